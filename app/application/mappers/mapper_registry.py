@@ -0,0 +1,75 @@
+# app/application/mappers/mapper_registry.py
+import inspect
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple, Type
+from pydantic import BaseModel, TypeAdapter
+
+Mapper = Callable[[Any], Any]
+
+def _getter(names: List[str]) -> Callable[[Any], tuple]:
+    # attrgetter with a single name returns the bare value; always hand back a tuple
+    if len(names) == 1:
+        get = attrgetter(names[0])
+        return lambda obj: (get(obj),)
+    return attrgetter(*names)
+
+class MapperRegistry:
+    """
+    Mapping functions compiled once per (source, target) pair and reused for every call.
+    Field lists are worked out up front, so a mapping is an attrgetter plus one constructor call.
+    """
+
+    def __init__(self):
+        self._trusted: Dict[Tuple[type, type], Mapper] = {}
+        self._entity: Dict[Tuple[type, type], Mapper] = {}
+        self._adapters: Dict[type, TypeAdapter] = {}
+
+    def trusted_dto_mapper(self, source: type, dto_class: Type[BaseModel]) -> Mapper:
+        """
+        Entity → DTO without validation, via model_construct. Only for data we produced ourselves
+        (read back from our database), which has already been validated on the way in.
+        """
+        key = (source, dto_class)
+        mapper = self._trusted.get(key)
+        if mapper is None:
+            mapper = self._trusted[key] = self._compile_trusted(dto_class)
+        return mapper
+
+    def entity_mapper(self, source: Type[BaseModel], entity_class: type) -> Mapper:
+        """DTO → Entity: the DTO's fields that the entity constructor accepts, passed as keywords"""
+        key = (source, entity_class)
+        mapper = self._entity.get(key)
+        if mapper is None:
+            mapper = self._entity[key] = self._compile_entity(source, entity_class)
+        return mapper
+
+    def list_adapter(self, dto_class: Type[BaseModel]) -> TypeAdapter:
+        """Cached TypeAdapter(List[dto_class]) for validating a whole batch in one call"""
+        adapter = self._adapters.get(dto_class)
+        if adapter is None:
+            adapter = self._adapters[dto_class] = TypeAdapter(List[dto_class])
+        return adapter
+
+    @staticmethod
+    def _compile_trusted(dto_class: Type[BaseModel]) -> Mapper:
+        names = list(dto_class.model_fields)
+        fields_set = set(names)
+        get = _getter(names)
+        construct = dto_class.model_construct
+
+        def mapper(entity):
+            return construct(fields_set, **dict(zip(names, get(entity))))
+        return mapper
+
+    @staticmethod
+    def _compile_entity(source: Type[BaseModel], entity_class: type) -> Mapper:
+        params = inspect.signature(entity_class).parameters
+        names = [name for name in source.model_fields if name in params]
+        get = _getter(names)
+
+        def mapper(dto):
+            return entity_class(**dict(zip(names, get(dto))))
+        return mapper
+
+# Shared by the mapper_utils helpers
+mapper_registry = MapperRegistry()
@@ -1,26 +1,40 @@
 from pydantic import BaseModel
 from typing import List, Type, TypeVar
+from app.application.mappers.mapper_registry import mapper_registry
 
 T = TypeVar("T", bound=BaseModel)
 
 # ----------------------------
 # DTO Mapping
 # ----------------------------
-def map_to_dto(dto_class: Type[T], entity: object) -> T:
-    """Map single entity → DTO"""
-    return dto_class.model_validate(entity.__dict__)
+def map_to_dto(dto_class: Type[T], entity: object, trusted: bool = True) -> T:
+    """
+    Map single entity → DTO.
+    trusted=True (entities read from our own database) skips re-validation; pass False for anything else.
+    """
+    if trusted:
+        return mapper_registry.trusted_dto_mapper(type(entity), dto_class)(entity)
+    return dto_class.model_validate(entity, from_attributes=True)
 
-def map_list_to_dto(dto_class: Type[T], entities: List[object]) -> List[T]:
-    """Map list of entities → list of DTOs"""
-    return [dto_class.model_validate(e.__dict__) for e in entities]
+def map_list_to_dto(dto_class: Type[T], entities: List[object], trusted: bool = True) -> List[T]:
+    """Map list of entities → list of DTOs, resolving the mapper once for the whole batch"""
+    if not entities:
+        return []
+    if trusted:
+        mapper = mapper_registry.trusted_dto_mapper(type(entities[0]), dto_class)
+        return [mapper(e) for e in entities]
+    return mapper_registry.list_adapter(dto_class).validate_python(entities, from_attributes=True)
 
 # ----------------------------
 # Entity Mapping
 # ----------------------------
 def map_to_entity(entity_class: type, dto: BaseModel) -> object:
     """Map single DTO → Entity"""
-    return entity_class(**dto.model_dump())
+    return mapper_registry.entity_mapper(type(dto), entity_class)(dto)
 
 def map_list_to_entity(entity_class: type, dtos: List[BaseModel]) -> List[object]:
     """Map list of DTOs → list of Entities"""
-    return [entity_class(**d.model_dump()) for d in dtos]
+    if not dtos:
+        return []
+    mapper = mapper_registry.entity_mapper(type(dtos[0]), entity_class)
+    return [mapper(d) for d in dtos]
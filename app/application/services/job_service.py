@@ -0,0 +1,132 @@
+# app/application/services/job_service.py
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterable, List, Optional, Tuple
+from app.config import settings
+from app.core.security import hash_passwords_async
+from app.domain.dtos.bulk.BulkRowResult import BulkRowResult
+from app.domain.dtos.job.JobStatusResponse import JobStatusResponse
+from app.domain.dtos.user.UserCreate import UserCreate
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.domain.interfaces.i_job_service import IJobService
+from app.infrastructure.jobs.async_runner import to_thread
+from app.utilities.bulk_utils import BulkRow
+
+logger = logging.getLogger(__name__)
+
+JOB_USER_IMPORT = "user-import"
+
+def _meta_key(job_id: str) -> str:
+    return f"job-meta-{job_id}"
+
+def _error(task_meta: dict) -> str:
+    exc = task_meta.get("result")
+    return f"{type(exc).__name__}: {exc}" if isinstance(exc, BaseException) else str(exc)
+
+async def _queued_rows(rows: List[Tuple[int, UserCreate]]) -> List[list]:
+    """[[row index, UserImportRow fields], ...]: the chunk's passwords hashed in the pool, in bounded pieces"""
+    hashed_passwords = await hash_passwords_async([user_data.password for _, user_data in rows])
+    return [
+        [index, {**user_data.model_dump(mode="json", exclude={"password"}), "hashed_password": hashed}]
+        for (index, user_data), hashed in zip(rows, hashed_passwords)
+    ]
+
+class JobService(IJobService):
+    """
+    Jobs are Celery chords: one task per chunk of JOB_CHUNK_SIZE rows, with ids {job id}.{n}, and a
+    callback whose id is the job id that merges the chunk results. A small job record (kind, row and
+    chunk counts) is kept in the result backend next to the task results; status is read from both
+    with a single multi-get. Backend and broker clients block, so they are used from a thread.
+    Passwords are hashed at submission, chunk by chunk, so task messages never carry them in plain text.
+    Celery and the task modules are imported on first use, so web workers that run no jobs never load them.
+    """
+
+    def __init__(self, chunk_size: int = settings.JOB_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    async def submit_user_import(self, rows: AsyncIterable[BulkRow]) -> JobStatusResponse:
+        from celery import chord
+        from app.infrastructure.jobs.user_import_tasks import finish_user_import, import_user_chunk
+        job_id = uuid.uuid4().hex
+        chunks: List[List[list]] = []
+        pending: List[Tuple[int, UserCreate]] = []
+        rejected: List[dict] = []
+        total = 0
+        async for index, user_data, error in rows:
+            total += 1
+            if error:
+                # Invalid rows never reach a worker; they are merged into the report by the callback
+                rejected.append(BulkRowResult(index=index, success=False, error=error).model_dump())
+                continue
+            pending.append((index, user_data))
+            if len(pending) >= self.chunk_size:
+                chunks.append(await _queued_rows(pending))
+                pending = []
+        if pending:
+            chunks.append(await _queued_rows(pending))
+
+        meta = {
+            "id": job_id, "kind": JOB_USER_IMPORT, "submitDate": datetime.now(timezone.utc).isoformat(),
+            "rows": total, "chunkRows": [len(chunk) for chunk in chunks],
+        }
+        if chunks:
+            header = [import_user_chunk.s(chunk).set(task_id=f"{job_id}.{n}") for n, chunk in enumerate(chunks)]
+            workflow = chord(header, finish_user_import.s(rejected).set(task_id=job_id))
+        else:
+            workflow = finish_user_import.s([], rejected).set(task_id=job_id)
+        # In eager mode the chunks run inside this call; their coroutines come back to this loop (and its engine)
+        await to_thread(self._enqueue, meta, workflow)
+        return await self.get_job(job_id)
+
+    def _enqueue(self, meta: dict, workflow) -> None:
+        from app.infrastructure.jobs.celery_app import celery_app
+        try:
+            celery_app.backend.set(_meta_key(meta["id"]), json.dumps(meta))
+            workflow.apply_async()
+        except Exception as exc:
+            if not celery_app.conf.task_always_eager:
+                raise ServiceUnavailableException("Job queue is unavailable, retry later") from exc
+            # Eager mode ran the chunks right here; the failed one is in the backend and reported as the job's error
+            logger.warning("Job %s failed while running eagerly", meta["id"], exc_info=True)
+
+    async def get_job(self, job_id: str) -> Optional[JobStatusResponse]:
+        return await asyncio.to_thread(self._status, job_id)
+
+    def _status(self, job_id: str) -> Optional[JobStatusResponse]:
+        from celery import states
+        from app.infrastructure.jobs.celery_app import celery_app
+        backend = celery_app.backend
+        raw = backend.get(_meta_key(job_id))
+        if raw is None:
+            return None
+        meta = json.loads(raw)
+        chunk_rows = meta["chunkRows"]
+        keys = [backend.get_key_for_task(f"{job_id}.{n}") for n in range(len(chunk_rows))]
+        keys.append(backend.get_key_for_task(job_id))
+        values = backend.mget(keys)
+        if hasattr(values, "items"):  # memcached-style clients answer with a dict
+            values = [values.get(key) for key in keys]
+        task_metas = [backend.decode_result(value) if value else {"status": states.PENDING} for value in values]
+        *chunk_metas, job_meta = task_metas
+
+        done = [n for n, chunk_meta in enumerate(chunk_metas) if chunk_meta["status"] == states.SUCCESS]
+        failed = next((m for m in task_metas if m["status"] in states.PROPAGATE_STATES), None)
+        result, error = None, None
+        if job_meta["status"] == states.SUCCESS:
+            state, result = "succeeded", job_meta["result"]
+        elif failed is not None:
+            state, error = "failed", _error(failed)
+        elif done or any(m["status"] == states.STARTED for m in task_metas):
+            state = "running"
+        else:
+            state = "queued"
+        return JobStatusResponse(
+            id=job_id, kind=meta["kind"], state=state, submitDate=meta["submitDate"], rows=meta["rows"],
+            chunks=len(chunk_rows), chunksDone=len(done),
+            # Rows rejected at submission count as done from the start
+            rowsDone=meta["rows"] - sum(chunk_rows) + sum(chunk_rows[n] for n in done),
+            result=result, error=error,
+        )
@@ -5,7 +5,7 @@ from app.domain.dtos.user.UserLogin import UserLogin
 from app.domain.entities.user import User
 from app.domain.interfaces.i_login_service import ILoginService
 from app.infrastructure.interfaces.i_login_repository import ILoginRepository
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_and_update_password_async, create_access_token
 
 class LoginService(ILoginService):
     """Concrete implementation of ILoginService"""
@@ -15,8 +15,15 @@ class LoginService(ILoginService):
 
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         user = await self.login_repository.get_user_by_username(username)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user:
+            return None
+        valid, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # Stored hash was made with a stale bcrypt cost: persist the rehash while we have the password
+            await self.login_repository.update_password_hash(user.id, new_hash)
+            user.hashed_password = new_hash
         return user
 
     async def login(self, login_data: UserLogin) -> Optional[UserLoginResponse]:
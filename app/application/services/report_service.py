@@ -0,0 +1,163 @@
+# app/application/services/report_service.py
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
+from app.config import settings
+from app.domain.entities.ledger_batch import LedgerBatch
+from app.domain.dtos.report.PeriodCloseResponse import PeriodCloseResponse
+from app.domain.dtos.report.PeriodSummaryResponse import PeriodSummaryResponse
+from app.domain.dtos.report.TrialBalanceLine import TrialBalanceLine
+from app.domain.dtos.report.TrialBalanceResponse import TrialBalanceResponse
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
+from app.domain.interfaces.i_report_service import IReportService
+from app.infrastructure.interfaces.i_report_repository import IReportRepository
+from app.utilities.period_utils import format_period, last_full_period, next_period, period_end, period_start
+
+# numpy / pandas are imported where reports are computed: loading them costs every worker ~0.4s of startup
+if TYPE_CHECKING:
+    import pandas as pd
+
+TOTAL_COLUMNS = ["period", "account", "debit", "credit", "lines"]
+# Chunk results are merged in rounds of this many, so partial totals never pile up
+MERGE_EVERY = 16
+
+def _money(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+def _empty_totals() -> "pd.DataFrame":
+    import numpy as np
+    import pandas as pd
+    return pd.DataFrame({"period": np.array([], dtype=np.int64), "account": np.array([], dtype=object),
+                         "debit": np.array([], dtype=np.int64), "credit": np.array([], dtype=np.int64),
+                         "lines": np.array([], dtype=np.int64)}).set_index(["period", "account"])
+
+def _merge(frames: List["pd.DataFrame"]) -> "pd.DataFrame":
+    import pandas as pd
+    if not frames:
+        return _empty_totals()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames).groupby(level=["period", "account"], observed=True, sort=False).sum()
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+class ReportService(IReportService):
+    """
+    Trial balance, period summaries and account ledgers, computed column-wise: lines arrive from a
+    streaming cursor chunk_size at a time as integer cents and are reduced per chunk with a pandas groupby
+    on (period, categorical account), so no Python object is built per line and memory holds one chunk.
+    Closed periods are read from their stored summaries instead of being re-aggregated.
+    """
+
+    def __init__(self, report_repository: IReportRepository, chunk_size: int = settings.REPORT_CHUNK_SIZE):
+        self.repo = report_repository
+        self.chunk_size = chunk_size
+
+    async def _scan(self, start: Optional[date], end: date, account: Optional[str] = None) -> "pd.DataFrame":
+        """Totals per (period, account) of the lines dated start..end, aggregated chunk by chunk"""
+        import numpy as np
+        import pandas as pd
+        partial: List[pd.DataFrame] = []
+        async for periods, accounts, debits, credits in self.repo.stream_line_amounts(start, end, account, self.chunk_size):
+            chunk = pd.DataFrame({
+                "period": np.fromiter(periods, dtype=np.int64, count=len(periods)),
+                "account": pd.Categorical(accounts),
+                "debit": np.fromiter(debits, dtype=np.int64, count=len(debits)),
+                "credit": np.fromiter(credits, dtype=np.int64, count=len(credits)),
+            })
+            partial.append(chunk.groupby(["period", "account"], observed=True, sort=False).agg(
+                debit=("debit", "sum"), credit=("credit", "sum"), lines=("debit", "size")))
+            if len(partial) >= MERGE_EVERY:
+                partial = [_merge(partial)]
+        totals = _merge(partial)
+        # Plain string accounts from here on, so summaries and scans combine without category mismatches
+        totals.index = totals.index.set_levels(totals.index.levels[1].astype(object), level="account")
+        return totals
+
+    async def _totals(self, end: date, first: Optional[int] = None, account: Optional[str] = None) -> Tuple["pd.DataFrame", Optional[int]]:
+        """
+        Totals per (period, account) of lines from period first (None: the beginning) through end. Periods
+        that are closed and end by end come from their summaries; only the rest is scanned. Returns the totals
+        and the last period served from summaries.
+        """
+        import numpy as np
+        import pandas as pd
+        closed = await self.repo.get_closed_period()
+        summarized = min(closed, last_full_period(end)) if closed is not None else None
+        if summarized is not None and first is not None and summarized < first:
+            summarized = None
+        frames = []
+        if summarized is not None:
+            rows = await self.repo.get_period_summaries(first, summarized, account)
+            frames.append(pd.DataFrame(rows, columns=TOTAL_COLUMNS).astype(
+                {"period": np.int64, "debit": np.int64, "credit": np.int64, "lines": np.int64}).set_index(["period", "account"]))
+            scan_from = period_start(next_period(summarized))
+        else:
+            scan_from = period_start(first) if first is not None else None
+        if scan_from is None or scan_from <= end:
+            frames.append(await self._scan(scan_from, end, account))
+        # Summaries and the scan cover disjoint periods
+        return pd.concat(frames) if len(frames) > 1 else frames[0], summarized
+
+    async def trial_balance(self, as_of: Optional[date] = None) -> TrialBalanceResponse:
+        as_of = as_of or _today()
+        totals, _ = await self._totals(as_of)
+        closed = await self.repo.get_closed_period()
+        by_account = totals.groupby(level="account", sort=True)[["debit", "credit"]].sum()
+        accounts = [
+            TrialBalanceLine(account=account, debit=_money(debit), credit=_money(credit), balance=_money(debit - credit))
+            for account, debit, credit in zip(by_account.index, by_account["debit"].tolist(), by_account["credit"].tolist())
+        ]
+        return TrialBalanceResponse(
+            asOf=as_of, closedThrough=format_period(closed) if closed is not None else None,
+            totalDebit=_money(by_account["debit"].sum()), totalCredit=_money(by_account["credit"].sum()), accounts=accounts,
+        )
+
+    async def period_summaries(self, first: int, last: int, account: Optional[str] = None) -> List[PeriodSummaryResponse]:
+        totals, summarized = await self._totals(period_end(last), first, account)
+        totals = totals.sort_index()
+        return [
+            PeriodSummaryResponse(period=format_period(period), account=name, debit=_money(debit), credit=_money(credit),
+                                  lines=lines, closed=summarized is not None and period <= summarized)
+            for (period, name), debit, credit, lines in zip(
+                totals.index, totals["debit"].tolist(), totals["credit"].tolist(), totals["lines"].tolist())
+        ]
+
+    async def account_ledger(self, account: str, start: Optional[date], end: date) -> AsyncIterator[LedgerBatch]:
+        import numpy as np
+        balance = 0
+        if start is not None:
+            opening, _ = await self._totals(start - timedelta(days=1), account=account)
+            balance = int(opening["debit"].sum() - opening["credit"].sum())
+            yield LedgerBatch(voucherDate=(start,), number=(None,), voucherId=(None,), description=("Opening balance",),
+                              debit=(_money(0),), credit=(_money(0),), balance=(_money(balance),))
+        async for dates, numbers, ids, descriptions, debits, credits in self.repo.stream_account_lines(account, start, end, self.chunk_size):
+            debit = np.fromiter(debits, dtype=np.int64, count=len(debits))
+            credit = np.fromiter(credits, dtype=np.int64, count=len(credits))
+            # Running balance: cumulative sum within the chunk, carried over from the previous one
+            running = balance + np.cumsum(debit - credit)
+            balance = int(running[-1])
+            yield LedgerBatch(
+                voucherDate=dates, number=numbers, voucherId=ids, description=descriptions,
+                debit=tuple(map(_money, debit.tolist())), credit=tuple(map(_money, credit.tolist())),
+                balance=tuple(map(_money, running.tolist())),
+            )
+
+    async def close_period(self, period: int) -> PeriodCloseResponse:
+        closed = await self.repo.get_closed_period(cached=False)
+        if closed is not None and period <= closed:
+            raise ClosedPeriodException(f"Period {format_period(period)} is already closed (closed through {format_period(closed)})")
+        # Every open period up to this one is summarized in one scan and closed together
+        start = period_start(next_period(closed)) if closed is not None else None
+        totals = await self._scan(start, period_end(period))
+        summaries = [
+            (int(p), name, _money(debit), _money(credit), int(lines))
+            for (p, name), debit, credit, lines in zip(
+                totals.index, totals["debit"].tolist(), totals["credit"].tolist(), totals["lines"].tolist())
+        ]
+        await self.repo.close_period(period, summaries, closed)
+        return PeriodCloseResponse(
+            period=format_period(period), periodsSummarized=totals.index.get_level_values("period").nunique(),
+            summaries=len(summaries), lines=int(totals["lines"].sum()),
+        )
@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
 from app.application.mappers.mapper_utils import map_to_dto, map_to_entity, map_list_to_dto
 from app.domain.dtos.role.RoleCreate import RoleCreate
 from app.domain.dtos.role.RoleResponse import RoleResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.domain.dtos.bulk.BulkRowResult import BulkRowResult
 from app.domain.entities.role import Role
 from app.domain.interfaces.i_role_service import IRoleService
 from app.infrastructure.interfaces.i_role_repository import IRoleRepository
-from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.utilities.pagination_utils import TOTAL_EXACT
+from app.utilities.bulk_utils import BulkRow, batched
 
 class RoleService(IRoleService):
     """Concrete implementation of IRoleService"""
@@ -14,35 +17,74 @@ class RoleService(IRoleService):
         self.repo = role_repository
 
     async def create_role(self, role_data: RoleCreate) -> RoleResponse:
-        # Check for duplicates
-        existing = await self.repo.get_by_name(role_data.name)
-        if existing:
-            raise AlreadyExistsException(f"Role Name already taken: {role_data.name}")
-
         # DTO -> Domain Entity
         role_entity: Role = map_to_entity(Role, role_data)
 
-        # Persist domain entity
+        # Persist domain entity; duplicates are rejected by the unique index (AlreadyExistsException)
         saved_role: Role = await self.repo.add_role(role_entity)
 
         # Domain Entity -> DTO
         return map_to_dto(RoleResponse, saved_role)
 
+    async def bulk_create_roles(self, rows: AsyncIterable[BulkRow], batch_size: int = 1000) -> BulkImportResponse:
+        """
+        Create roles in batches: one duplicate query and one unordered insert_many per batch.
+        Returns a per-row report; invalid or duplicate rows fail without affecting the others.
+        """
+        results: List[BulkRowResult] = []
+        async for batch in batched(rows, batch_size):
+            results.extend(await self._create_role_batch(batch))
+        return BulkImportResponse.from_results(results)
+
+    async def _create_role_batch(self, batch: List[BulkRow]) -> List[BulkRowResult]:
+        results: List[BulkRowResult] = []
+        valid = []
+        for index, role_data, error in batch:
+            if error:
+                results.append(BulkRowResult(index=index, success=False, error=error))
+            else:
+                valid.append((index, role_data))
+
+        # Check for duplicates against the database, one query for the whole batch
+        taken_names = set(await self.repo.get_by_names([r.name for _, r in valid]))
+
+        accepted = []
+        for index, role_data in valid:
+            if role_data.name in taken_names:
+                results.append(BulkRowResult(index=index, success=False, error=f"Role Name already taken: {role_data.name}"))
+                continue
+            taken_names.add(role_data.name)
+            accepted.append((index, map_to_entity(Role, role_data)))
+
+        saved_roles = await self.repo.add_roles([role for _, role in accepted])
+        for (index, role), saved in zip(accepted, saved_roles):
+            if saved:
+                results.append(BulkRowResult(index=index, success=True, id=saved.id))
+            else:
+                results.append(BulkRowResult(index=index, success=False, error=f"Role Name already taken: {role.name}"))
+        return results
+
+    async def export_roles(self, batch_size: int = 1000) -> AsyncIterator[List[RoleResponse]]:
+        """Stream every role as DTO batches, straight from the repository's cursor"""
+        async for batch in self.repo.stream_roles(batch_size):
+            yield map_list_to_dto(RoleResponse, batch)
+
     async def get_role_by_id(self, role_id: int) -> Optional[RoleResponse]:
         role_entity: Optional[Role] = await self.repo.get_by_id(role_id)
         return map_to_dto(RoleResponse, role_entity) if role_entity else None
 
     async def list_roles(
-        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True,
+        cursor: Optional[str] = None, include_total: str = TOTAL_EXACT
     ) -> Dict[str, Any]:
         """
-        Returns paginated list of roles
+        Returns paginated list of roles (offset paging, or keyset paging when a cursor is given)
         """
-        result = await self.repo.list_roles(page, page_size, sort_field, ascending)
-        print("Inservice",result)
+        result = await self.repo.list_roles(page, page_size, sort_field, ascending, cursor, include_total)
         return {
             "total": result["total"],
             "data": map_list_to_dto(RoleResponse, result["data"]),
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": result["next_cursor"]
         }
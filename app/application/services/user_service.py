@@ -1,12 +1,16 @@
 # app/application/services/user_service.py
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
 from app.application.mappers.mapper_utils import map_list_to_dto, map_to_dto, map_to_entity
 from app.domain.entities.user import User
+from app.domain.entities.user_batch import UserBatch
 from app.domain.dtos.user.UserCreate import UserCreate
 from app.domain.dtos.user.UserResponse import UserResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.domain.dtos.bulk.BulkRowResult import BulkRowResult
 from app.domain.interfaces.i_user_service import IUserService
 from app.infrastructure.interfaces.i_user_repository import IUserRepository
-from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.utilities.pagination_utils import TOTAL_EXACT
+from app.utilities.bulk_utils import BulkRow, batched
 
 class UserService(IUserService):
     """Concrete implementation of IUserService"""
@@ -15,39 +19,82 @@ class UserService(IUserService):
         self.repo = user_repository
 
     async def create_user(self, user_data: UserCreate) -> UserResponse:
-        # Check for duplicates before adding
-        existing = await self.repo.get_by_username_or_email(
-            username=user_data.username,
-            email=user_data.email
-        )
-        if existing:
-            raise AlreadyExistsException(f"Username or email already taken: {user_data.username}")
-        
         # DTO → Domain Entity
         user_entity: User = map_to_entity(User, user_data)
         
-        # Persist domain entity
+        # Persist domain entity; duplicates are rejected by the unique indexes (AlreadyExistsException)
         saved_user: User = await self.repo.add_user(user_entity)
         
         # Domain Entity → DTO
         return map_to_dto(UserResponse, saved_user)
 
+    async def bulk_create_users(self, rows: AsyncIterable[BulkRow], batch_size: int = 1000) -> BulkImportResponse:
+        """
+        Create users in batches: one duplicate query and one insert per batch, passwords hashed in parallel.
+        Returns a per-row report; invalid or duplicate rows fail without affecting the others.
+        """
+        results: List[BulkRowResult] = []
+        async for batch in batched(rows, batch_size):
+            results.extend(await self._create_user_batch(batch))
+        return BulkImportResponse.from_results(results)
+
+    async def _create_user_batch(self, batch: List[BulkRow]) -> List[BulkRowResult]:
+        results: List[BulkRowResult] = []
+        valid = []
+        for index, user_data, error in batch:
+            if error:
+                results.append(BulkRowResult(index=index, success=False, error=error))
+            else:
+                valid.append((index, user_data))
+
+        # Check for duplicates against the database, one query for the whole batch
+        existing = await self.repo.get_by_usernames_or_emails(
+            usernames=[u.username for _, u in valid],
+            emails=[u.email for _, u in valid if u.email]
+        )
+        taken_usernames = {u.username for u in existing}
+        taken_emails = {u.email for u in existing if u.email}
+
+        accepted = []
+        for index, user_data in valid:
+            if user_data.username in taken_usernames or (user_data.email and user_data.email in taken_emails):
+                results.append(BulkRowResult(index=index, success=False, error=f"Username or email already taken: {user_data.username}"))
+                continue
+            # Later rows of the same import are duplicates of this one
+            taken_usernames.add(user_data.username)
+            if user_data.email:
+                taken_emails.add(user_data.email)
+            accepted.append((index, map_to_entity(User, user_data)))
+
+        saved_users = await self.repo.add_users([user for _, user in accepted])
+        for (index, user), saved in zip(accepted, saved_users):
+            if saved:
+                results.append(BulkRowResult(index=index, success=True, id=saved.id))
+            else:
+                results.append(BulkRowResult(index=index, success=False, error=f"Rejected by a database constraint (duplicate or missing field): {user.username}"))
+        return results
+
+    async def export_users(self, batch_size: int = 1000) -> AsyncIterator[UserBatch]:
+        """Stream every user as columnar batches, straight from the repository's server-side cursor"""
+        async for batch in self.repo.stream_users(batch_size):
+            yield batch
+
     async def get_user_by_id(self, user_id: int) -> Optional[UserResponse]:
         user: Optional[User] = await self.repo.get_by_id(user_id)
         return map_to_dto(UserResponse,user) if user else None
 
     async def list_users(
-        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True,
+        cursor: Optional[str] = None, include_total: str = TOTAL_EXACT
        ) -> Dict[str, Any]:
         """
-        Returns paginated list of users
+        Returns paginated list of users (offset paging, or keyset paging when a cursor is given)
         """
-        print("Inservice1")
-        result = await self.repo.list_users(page, page_size, sort_field, ascending)
-        print("Inservice",result)
+        result = await self.repo.list_users(page, page_size, sort_field, ascending, cursor, include_total)
         return {
             "total": result["total"],
             "data": map_list_to_dto(UserResponse, result["data"]),
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": result["next_cursor"]
         }
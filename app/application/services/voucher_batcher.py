@@ -0,0 +1,134 @@
+# app/application/services/voucher_batcher.py
+import asyncio
+import contextvars
+import logging
+import uuid
+from typing import List, Optional, Tuple
+from app.config import settings
+from app.domain.entities.voucher import Voucher
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.infrastructure.interfaces.i_voucher_repository import IVoucherRepository
+from app.utilities.metrics_utils import voucher_batch_size
+
+logger = logging.getLogger(__name__)
+
+class VoucherBatcher:
+    """
+    Coalesces concurrent voucher posts into one transaction per batch: posts arriving within window_ms
+    of the first (up to max_batch) are numbered from a block reserved in advance and written with one
+    bulk insert per table. Each post returns once its batch has committed.
+
+    Numbers come from blocks of block_size reserved per worker, so they are unique and increasing within
+    a worker but interleave across workers, and numbers unused at shutdown (or in a failed post) are gaps.
+    """
+
+    def __init__(self, voucher_repository: IVoucherRepository, window_ms: float = settings.VOUCHER_BATCH_WINDOW_MS,
+                 max_batch: int = settings.VOUCHER_BATCH_MAX_SIZE, max_pending: int = settings.VOUCHER_MAX_PENDING,
+                 block_size: int = settings.VOUCHER_NUMBER_BLOCK_SIZE):
+        self.repo = voucher_repository
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.block_size = block_size
+        self._pending: List[Tuple[Voucher, asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        # Reserved, not yet used numbers: [_next_number, _block_end)
+        self._next_number = 0
+        self._block_end = 0
+
+    def start(self) -> None:
+        """Take posts again (server startup); a batcher closed by an earlier lifespan reopens here"""
+        self._closed = False
+        self._pending = []
+        self._wakeup = asyncio.Event()
+        self._task = None
+        # The old block may belong to another database; its unused numbers become gaps
+        self._next_number = 0
+        self._block_end = 0
+
+    async def submit(self, voucher: Voucher) -> Voucher:
+        """Queue a balanced voucher; returns it numbered once its batch is committed"""
+        if self._closed:
+            raise ServiceUnavailableException("Voucher posting is shutting down")
+        if len(self._pending) >= self.max_pending:
+            raise ServiceUnavailableException("Voucher posting queue is full, retry later")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((voucher, future))
+        if self._task is None:
+            # Fresh context: the writer must not inherit the first poster's unit of work or request metrics
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        self._wakeup.set()
+        # Shielded: a client that goes away does not fail the batch; its voucher is posted regardless
+        return await asyncio.shield(future)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if len(self._pending) < self.max_batch and self.window > 0:
+                await asyncio.sleep(self.window)  # let concurrent posts join this batch
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[Voucher, asyncio.Future]]) -> None:
+        voucher_batch_size.observe((), len(batch))
+        try:
+            numbers = await self._take_numbers(len(batch))
+            for (voucher, _), number in zip(batch, numbers):
+                voucher.id = str(uuid.uuid4())
+                voucher.number = number
+            await self.repo.add_vouchers([voucher for voucher, _ in batch])
+        except Exception as exc:
+            if len(batch) == 1 or not all(voucher.number for voucher, _ in batch):
+                self._fail(batch, exc)
+                return
+            # One bad voucher must not fail the others: retry them one transaction each
+            logger.warning("Voucher batch of %d failed; posting its vouchers one by one", len(batch), exc_info=True)
+            for voucher, future in batch:
+                try:
+                    await self.repo.add_vouchers([voucher])
+                except Exception as single_exc:
+                    self._fail([(voucher, future)], single_exc)
+                else:
+                    self._resolve([(voucher, future)])
+            return
+        self._resolve(batch)
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[Voucher, asyncio.Future]]) -> None:
+        for voucher, future in batch:
+            if not future.done():
+                future.set_result(voucher)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Voucher, asyncio.Future]], exc: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _take_numbers(self, count: int) -> List[int]:
+        """Numbers from the reserved block; a new block (one round trip) only when it runs out"""
+        numbers: List[int] = []
+        while len(numbers) < count:
+            if self._next_number >= self._block_end:
+                size = max(self.block_size, count - len(numbers))
+                self._next_number = await self.repo.allocate_numbers(size)
+                self._block_end = self._next_number + size
+            take = min(count - len(numbers), self._block_end - self._next_number)
+            numbers.extend(range(self._next_number, self._next_number + take))
+            self._next_number += take
+        return numbers
+
+    async def close(self) -> None:
+        """Stop taking posts and write out the ones already queued (server shutdown)"""
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,50 @@
+# app/application/services/voucher_service.py
+from typing import Optional
+from app.application.mappers.mapper_utils import map_list_to_dto, map_list_to_entity
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.domain.entities.voucher import Voucher
+from app.domain.entities.voucher_line import VoucherLine
+from app.domain.dtos.voucher.VoucherCreate import VoucherCreate
+from app.domain.dtos.voucher.VoucherLineResponse import VoucherLineResponse
+from app.domain.dtos.voucher.VoucherResponse import VoucherResponse
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
+from app.domain.exceptions.unbalanced_voucher_exceptions import UnbalancedVoucherException
+from app.domain.interfaces.i_voucher_service import IVoucherService
+from app.infrastructure.interfaces.i_report_repository import IReportRepository
+from app.infrastructure.interfaces.i_voucher_repository import IVoucherRepository
+from app.utilities.period_utils import format_period, period_of
+
+def _to_response(voucher: Voucher) -> VoucherResponse:
+    return VoucherResponse(
+        id=voucher.id, number=voucher.number, voucherDate=voucher.voucherDate, description=voucher.description,
+        totalDebit=voucher.totalDebit, totalCredit=voucher.totalCredit,
+        lines=map_list_to_dto(VoucherLineResponse, voucher.lines), createDate=voucher.createDate,
+    )
+
+class VoucherService(IVoucherService):
+    """Concrete implementation of IVoucherService"""
+
+    def __init__(self, voucher_repository: IVoucherRepository, batcher: VoucherBatcher, report_repository: IReportRepository):
+        self.repo = voucher_repository
+        self.batcher = batcher
+        self.reports = report_repository
+
+    async def post_voucher(self, voucher_data: VoucherCreate) -> VoucherResponse:
+        voucher = Voucher(
+            voucherDate=voucher_data.voucherDate, description=voucher_data.description,
+            lines=map_list_to_entity(VoucherLine, voucher_data.lines),
+        )
+        # Balance is checked here, in memory, so the batched write never has to reject a voucher
+        error = voucher.balance_error()
+        if error:
+            raise UnbalancedVoucherException(error)
+        # Closed periods are served from their summaries, so nothing may be posted into them any more. This cached
+        # check only turns most such posts away early; the write re-checks under the ledger lock.
+        closed = await self.reports.get_closed_period()
+        if closed is not None and period_of(voucher.voucherDate) <= closed:
+            raise ClosedPeriodException(f"Period {format_period(period_of(voucher.voucherDate))} is closed")
+        return _to_response(await self.batcher.submit(voucher))
+
+    async def get_voucher_by_id(self, voucher_id: str) -> Optional[VoucherResponse]:
+        voucher = await self.repo.get_by_id(voucher_id)
+        return _to_response(voucher) if voucher else None
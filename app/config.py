@@ -11,6 +11,8 @@ class Settings(BaseSettings):
     APP_ENV: str = "development"
     APP_DEBUG: bool = True
     APP_PORT: int = 8000
+    STARTUP_WARMUP: bool = False  # connect to the databases and preload caches at boot instead of on first use
+    STARTUP_MIGRATE: bool = False  # create missing tables at boot (otherwise: python -m app.infrastructure.db.migrate)
 
     # ==============================
     # SQL Server
@@ -21,6 +23,7 @@ class Settings(BaseSettings):
     SQLSERVER_USER: str = ""
     SQLSERVER_PASSWORD: str = ""
     SQLSERVER_DRIVER: str = "ODBC Driver 18 for SQL Server"
+    SQL_ECHO: bool = False  # log every SQL statement (development only)
 
     # ==============================
     # MongoDB
@@ -46,7 +49,14 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "your_super_secret_key_here"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 1 day
-    PASSWORD_SALT_ROUNDS: int = 12  # added
+    PASSWORD_SALT_ROUNDS: int = 12  # bcrypt cost for new hashes (unless calibrated); stored hashes below it are upgraded on login
+    PASSWORD_MIN_ROUNDS: int = 10  # calibration never picks a cost below this
+    PASSWORD_VERIFY_TARGET_MS: float = 250  # calibration picks the highest cost whose verify stays within this
+    PASSWORD_CALIBRATE_ON_STARTUP: bool = False  # measure this host at startup instead of using PASSWORD_SALT_ROUNDS
+    PASSWORD_HASHER_EXECUTOR: str = "process"  # "process" or "thread"
+    PASSWORD_HASHER_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_QUEUE: int = 32  # pending calls before rejecting with 503
+    PASSWORD_HASH_CHUNK_SIZE: int = 16  # passwords per pool call in bulk imports; login verifies wait behind at most one
 
     # ==============================
     # Redis
@@ -55,11 +65,64 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: str = ""
 
+    # ==============================
+    # Caching / Messaging
+    # ==============================
+    MESSAGE_BROKER_BACKEND: str = "redis"  # "redis" (cross-worker) or "memory" (single process / tests)
+    ROLE_CACHE_TTL_SECONDS: int = 300
+    ROLE_CACHE_MAX_SIZE: int = 1000
+    # Collection versions behind list/resource ETags also roll over this often, bounding staleness
+    # when a version broadcast is missed or data is changed outside the app
+    ETAG_VERSION_TTL_SECONDS: int = 60
+
     # ==============================
     # Celery
     # ==============================
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"       # added
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"   # added
+    # Tasks run inline in the caller instead of on a worker: tests / development, with
+    # CELERY_BROKER_URL=memory:// and CELERY_RESULT_BACKEND=cache+memory:// no Redis is needed
+    CELERY_TASK_ALWAYS_EAGER: bool = False
+    # Import rows are queued with bcrypt hashes, not passwords: submission hashes them (in the password pool,
+    # PASSWORD_HASH_CHUNK_SIZE at a time), so it takes about as long as a synchronous bulk import's hashing
+    JOB_CHUNK_SIZE: int = 1000  # rows per fan-out task
+    JOB_RESULT_TTL_SECONDS: int = 24 * 3600  # job status and results are kept this long
+
+    # ==============================
+    # Pagination
+    # ==============================
+    LIST_COUNT_CACHE_SECONDS: int = 60  # lifetime of cached totals for include_total=estimated
+
+    # ==============================
+    # Bulk import
+    # ==============================
+    BULK_IMPORT_BATCH_SIZE: int = 1000  # rows per set-based duplicate check + insert (<= 1000 keeps SQL Server under 2100 parameters)
+
+    # ==============================
+    # Export
+    # ==============================
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched per cursor round trip when streaming exports
+
+    # ==============================
+    # Chat (WebSocket hub)
+    # ==============================
+    CHAT_QUEUE_SIZE: int = 64  # outbound frames buffered per connection
+    CHAT_SLOW_CONSUMER_POLICY: str = "drop"  # "drop", "coalesce" or "disconnect" when a connection's queue is full
+    CHAT_MAX_MESSAGE_CHARS: int = 4000
+    CHAT_MAX_ROOM_CHARS: int = 100
+    CHAT_MAX_ROOMS_PER_CONNECTION: int = 50  # joins past this are refused with an error frame
+
+    # ==============================
+    # Notifications (Server-Sent Events)
+    # ==============================
+    NOTIFY_REPLAY_BUFFER: int = 1000  # recent events kept per worker for Last-Event-ID replay
+    NOTIFY_QUEUE_SIZE: int = 256  # frames a stream may fall behind before it is cut off (the client replays)
+    NOTIFY_HEARTBEAT_SECONDS: float = 15
+
+    # ==============================
+    # Observability
+    # ==============================
+    METRICS_ENABLED: bool = True  # Server-Timing header, /metrics endpoint, query/repository timing hooks
 
     # ==============================
     # Logging
@@ -72,6 +135,34 @@ class Settings(BaseSettings):
     # ==============================
     UPLOAD_FOLDER: str = "./uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10 MB
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # request body is written to disk in pieces of this size
+    FILE_INDEX_SIZE: int = 10000  # stored files whose download metadata is kept in memory
+    UPLOAD_SESSION_TTL_SECONDS: int = 24 * 3600  # resumable uploads idle this long are deleted
+
+    # ==============================
+    # Vouchers
+    # ==============================
+    VOUCHER_MAX_LINES: int = 500
+    VOUCHER_BATCH_WINDOW_MS: float = 2  # how long the first post of a batch waits for others to join
+    VOUCHER_BATCH_MAX_SIZE: int = 500  # vouchers per batched transaction
+    VOUCHER_MAX_PENDING: int = 10000  # queued posts before rejecting with 503
+    VOUCHER_NUMBER_BLOCK_SIZE: int = 1000  # voucher numbers reserved per round trip (unused ones become gaps)
+
+    # ==============================
+    # Ledger Reports
+    # ==============================
+    REPORT_CHUNK_SIZE: int = 100000  # voucher lines fetched and aggregated per cursor round trip
+    REPORT_CLOSED_PERIOD_CACHE_SECONDS: int = 30  # how long a worker trusts its cached closed-period watermark
+
+    # ==============================
+    # Image Derivatives
+    # ==============================
+    IMAGE_EXECUTOR: str = "process"  # "process" or "thread"
+    IMAGE_WORKERS: int = 2
+    IMAGE_MAX_QUEUE: int = 64  # pending renders before rejecting with 503
+    IMAGE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # on-disk derivative cache; least recently used evicted first
+    IMAGE_MAX_DIMENSION: int = 4096
+    IMAGE_UPLOAD_PRESETS: str = "thumbnail"  # comma-separated presets rendered right after an image upload
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,135 @@
+# app/core/container.py
+import inspect
+import typing
+from contextlib import AsyncExitStack
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+class Lifetime(Enum):
+    SINGLETON = "singleton"  # one instance per worker
+    SCOPED = "scoped"        # one instance per scope (request), disposed with it
+    TRANSIENT = "transient"  # a new instance on every resolve
+
+class _Registration:
+    __slots__ = ("service", "factory", "lifetime", "dependencies")
+
+    def __init__(self, service: type, factory: Callable[..., Any], lifetime: Lifetime):
+        self.service = service
+        self.factory = factory
+        self.lifetime = lifetime
+        # (parameter name, service) pairs, worked out once by Container.build()
+        self.dependencies: Optional[Tuple[Tuple[str, type], ...]] = None
+
+class Container:
+    """
+    Dependency container with explicit lifetimes. Constructor signatures are inspected once
+    (build(), or lazily on first resolve) into a resolution plan; singletons are cached.
+    """
+
+    def __init__(self):
+        self._registrations: Dict[type, _Registration] = {}
+        self._singletons: Dict[type, Any] = {}
+
+    def register(
+        self, service: type, implementation: Optional[Callable[..., Any]] = None, *,
+        instance: Any = None, lifetime: Lifetime = Lifetime.TRANSIENT
+    ) -> None:
+        """Register an implementation (class or factory function) or a ready-made instance for a service"""
+        if instance is not None:
+            self._registrations[service] = _Registration(service, lambda: instance, Lifetime.SINGLETON)
+            self._registrations[service].dependencies = ()
+            self._singletons[service] = instance
+            return
+        self._registrations[service] = _Registration(service, implementation or service, lifetime)
+
+    def build(self) -> None:
+        """Compute every resolution plan now, so a missing registration fails at startup instead of on a request"""
+        for registration in self._registrations.values():
+            self._plan(registration)
+
+    def resolve(self, service: Type[T]) -> T:
+        return self._resolve(service, None)
+
+    def create_scope(self) -> "Scope":
+        return Scope(self)
+
+    def _plan(self, registration: _Registration) -> Tuple[Tuple[str, type], ...]:
+        if registration.dependencies is None:
+            factory = registration.factory
+            target = factory.__init__ if inspect.isclass(factory) else factory
+            hints = typing.get_type_hints(target)
+            dependencies = []
+            for name, param in inspect.signature(factory).parameters.items():
+                if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                    continue
+                dependency = hints.get(name)
+                if dependency in self._registrations:
+                    dependencies.append((name, dependency))
+                elif param.default is param.empty:
+                    raise LookupError(f"Cannot resolve parameter '{name}' of {registration.service.__name__}")
+            registration.dependencies = tuple(dependencies)
+        return registration.dependencies
+
+    def _resolve(self, service: type, scope: Optional["Scope"]) -> Any:
+        instance = self._singletons.get(service)
+        if instance is not None:
+            return instance
+        registration = self._registrations.get(service)
+        if registration is None:
+            raise LookupError(f"{service.__name__} is not registered")
+
+        if registration.lifetime is Lifetime.SCOPED:
+            if scope is None:
+                raise LookupError(f"{service.__name__} is scoped and can only be resolved from a scope")
+            instance = scope._instances.get(service)
+            if instance is None:
+                instance = scope._instances[service] = self._create(registration, scope)
+            return instance
+
+        instance = self._create(registration, scope)
+        if registration.lifetime is Lifetime.SINGLETON:
+            instance = self._singletons.setdefault(service, instance)
+        return instance
+
+    def _create(self, registration: _Registration, scope: Optional["Scope"]) -> Any:
+        # Singletons never see the scope, so they cannot capture a request-scoped dependency
+        if registration.lifetime is Lifetime.SINGLETON:
+            scope = None
+        kwargs = {name: self._resolve(dependency, scope) for name, dependency in self._plan(registration)}
+        return registration.factory(**kwargs)
+
+class Scope:
+    """
+    Resolution scope for one request. Scoped instances are created once per scope; those entered
+    with enter() are exited when the scope closes, with the exception (if any) that ended it.
+    """
+
+    def __init__(self, container: Container):
+        self._container = container
+        self._instances: Dict[type, Any] = {}
+        self._entered: Dict[type, Any] = {}
+        self._exit_stack = AsyncExitStack()
+
+    def resolve(self, service: Type[T]) -> T:
+        return self._container._resolve(service, self)
+
+    async def enter(self, service: Type[T]) -> T:
+        """Resolve an async context manager and enter it for the lifetime of the scope"""
+        instance = self._entered.get(service)
+        if instance is None:
+            instance = self.resolve(service)
+            await self._exit_stack.enter_async_context(instance)
+            self._entered[service] = instance
+        return instance
+
+    async def __aenter__(self) -> "Scope":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            return await self._exit_stack.__aexit__(exc_type, exc, tb)
+        finally:
+            self._instances.clear()
+            self._entered.clear()
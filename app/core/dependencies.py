@@ -1,14 +1,61 @@
 # app/core/dependencies.py
+from typing import AsyncIterator
+from fastapi import Depends
+from app.core.container import Scope
 from app.core.di_container import container
 from app.application.services.login_service import LoginService
 from app.application.services.user_service import UserService
 from app.application.services.role_service import RoleService
+from app.application.services.voucher_service import VoucherService
+from app.application.services.report_service import ReportService
+from app.application.services.job_service import JobService
+from app.infrastructure.db.unit_of_work import UnitOfWork
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.core.file_manager import FileManager
+from app.core.image_derivatives import DerivativeManager
+from app.hubs.chat_hub import ChatHub
+from app.hubs.notify_hub import NotifyHub
 
-def get_login_service() -> LoginService:
+async def get_request_scope() -> AsyncIterator[Scope]:
+    """Request-scoped DI scope; scoped objects it entered (the unit of work) are disposed when the request ends"""
+    async with container.create_scope() as scope:
+        yield scope
+
+async def get_unit_of_work(scope: Scope = Depends(get_request_scope)) -> UnitOfWork:
+    """One session / transaction per request: committed when the endpoint returns, rolled back if it raises"""
+    return await scope.enter(UnitOfWork)
+
+# Services are singletons, so resolving them is a dict lookup; async avoids a threadpool hop per request
+async def get_login_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> LoginService:
     return container.resolve(LoginService)
 
-def get_user_service() -> UserService:
+async def get_user_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> UserService:
     return container.resolve(UserService)
 
-def get_role_service() -> RoleService:
+async def get_role_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> RoleService:
     return container.resolve(RoleService)
+
+async def get_voucher_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> VoucherService:
+    return container.resolve(VoucherService)
+
+async def get_report_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> ReportService:
+    return container.resolve(ReportService)
+
+
+def get_chat_hub() -> ChatHub:
+    return container.resolve(ChatHub)
+
+def get_notify_hub() -> NotifyHub:
+    return container.resolve(NotifyHub)
+
+def get_file_manager() -> FileManager:
+    return container.resolve(FileManager)
+
+def get_derivative_manager() -> DerivativeManager:
+    return container.resolve(DerivativeManager)
+
+def get_job_service() -> JobService:
+    return container.resolve(JobService)
+
+def get_collection_versions() -> CollectionVersions:
+    return container.resolve(CollectionVersions)
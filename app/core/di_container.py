@@ -1,29 +1,82 @@
-# app/core/container.py
-import punq
+# app/core/di_container.py
+from app.core.container import Container, Lifetime
 
 # Repositories
 from app.infrastructure.repositories.login_repository import LoginRepository
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.infrastructure.repositories.role_repository import RoleRepository
+from app.infrastructure.repositories.cached_role_repository import CachedRoleRepository
+from app.infrastructure.repositories.voucher_repository import VoucherRepository
+from app.infrastructure.repositories.report_repository import ReportRepository
 
 from app.infrastructure.interfaces.i_login_repository import ILoginRepository
 from app.infrastructure.interfaces.i_user_repository import IUserRepository
 from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+from app.infrastructure.interfaces.i_voucher_repository import IVoucherRepository
+from app.infrastructure.interfaces.i_report_repository import IReportRepository
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.infrastructure.db.unit_of_work import UnitOfWork
+
+# Caching / Messaging
+from app.config import settings
+from app.infrastructure.cache.role_cache import RoleCache
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.infrastructure.messaging.broker_factory import create_message_broker
+
+# Files
+from app.core.file_manager import FileManager
+from app.core.image_derivatives import DerivativeManager
+
+# Hubs
+from app.hubs.chat_hub import ChatHub
+from app.hubs.notify_hub import NotifyHub
 
 # Services
 from app.application.services.login_service import LoginService
 from app.application.services.user_service import UserService
 from app.application.services.role_service import RoleService
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.application.services.voucher_service import VoucherService
+from app.application.services.report_service import ReportService
+from app.application.services.job_service import JobService
 
 # DI container
-container = punq.Container()
+container = Container()
+
+# --- Register shared infrastructure (one per worker) ---
+container.register(IMessageBroker, instance=create_message_broker())
+container.register(RoleCache, instance=RoleCache(settings.ROLE_CACHE_TTL_SECONDS, settings.ROLE_CACHE_MAX_SIZE))
+container.register(CollectionVersions, lifetime=Lifetime.SINGLETON)
+
+# --- Register the unit of work (one session / transaction per request) ---
+container.register(UnitOfWork, lifetime=Lifetime.SCOPED)
+
+# --- Register repositories (stateless: built once per worker) ---
+container.register(ILoginRepository, LoginRepository, lifetime=Lifetime.SINGLETON)
+container.register(IUserRepository, UserRepository, lifetime=Lifetime.SINGLETON)
+container.register(RoleRepository, RoleRepository, lifetime=Lifetime.SINGLETON)
+# Roles are served through the cache; singleton so every request shares it
+container.register(IRoleRepository, CachedRoleRepository, lifetime=Lifetime.SINGLETON)
+container.register(IVoucherRepository, VoucherRepository, lifetime=Lifetime.SINGLETON)
+container.register(IReportRepository, ReportRepository, lifetime=Lifetime.SINGLETON)
+
+# --- Register services (stateless: built once per worker) ---
+container.register(LoginService, lifetime=Lifetime.SINGLETON)
+container.register(UserService, lifetime=Lifetime.SINGLETON)
+container.register(RoleService, lifetime=Lifetime.SINGLETON)
+container.register(VoucherService, lifetime=Lifetime.SINGLETON)
+container.register(ReportService, lifetime=Lifetime.SINGLETON)
+container.register(JobService, lifetime=Lifetime.SINGLETON)
+# One batcher per worker: every post of the worker joins its batches
+container.register(VoucherBatcher, lifetime=Lifetime.SINGLETON)
+
+# --- Register file storage ---
+container.register(FileManager, lifetime=Lifetime.SINGLETON)
+container.register(DerivativeManager, lifetime=Lifetime.SINGLETON)
 
-# --- Register repositories ---
-container.register(ILoginRepository, LoginRepository)
-container.register(IUserRepository, UserRepository)
-container.register(IRoleRepository, RoleRepository)
+# --- Register hubs (hold this worker's live connections) ---
+container.register(ChatHub, lifetime=Lifetime.SINGLETON)
+container.register(NotifyHub, lifetime=Lifetime.SINGLETON)
 
-# --- Register services ---
-container.register(LoginService, LoginService)
-container.register(UserService, UserService)
-container.register(RoleService, RoleService)
+# Precompute the resolution plans; a missing registration fails at import, not on a request
+container.build()
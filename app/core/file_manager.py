@@ -0,0 +1,276 @@
+# app/core/file_manager.py
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+import aiofiles
+import aiofiles.os
+from app.config import settings
+from app.domain.entities.stored_file import StoredFile
+from app.domain.entities.upload_session import UploadSession
+from app.domain.exceptions.file_too_large_exceptions import FileTooLargeException
+from app.domain.exceptions.upload_offset_exceptions import UploadOffsetMismatchException
+
+_FILE_ID = re.compile(r"^[0-9a-f]{64}$")
+SESSION_SWEEP_SECONDS = 600  # expired resumable uploads are looked for at most this often
+
+class IndexedFile:
+    """What a download needs about a stored blob, so serving it takes no metadata I/O"""
+    __slots__ = ("id", "path", "content_type", "stat", "etag", "last_modified")
+
+    def __init__(self, file_id: str, path: str, content_type: str, stat: os.stat_result):
+        self.id = file_id
+        self.path = path
+        self.content_type = content_type
+        self.stat = stat
+        self.etag = f'"{file_id}"'  # strong: the content hash is the identity
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+class FileManager:
+    """
+    Content-addressed upload storage under UPLOAD_FOLDER:
+
+        objects/ab/abcdef...        blob named by its SHA-256 (+ .json metadata); equal uploads share it
+        tmp/<uuid>                  upload being written; renamed into objects/ once hashed
+        sessions/<id>.part / .json  resumable uploads; the part file's size is the resume offset,
+                                    deleted once idle for session_ttl seconds
+
+    Bodies are streamed to disk in chunk_size pieces and hashed on the way, so memory stays at one
+    chunk per upload and the size limit is enforced as the bytes arrive.
+    Downloads go through an in-memory LRU index (id -> path, stat, content type).
+    """
+
+    def __init__(self, root: str = settings.UPLOAD_FOLDER, max_size: int = settings.MAX_FILE_SIZE,
+                 chunk_size: int = settings.UPLOAD_CHUNK_SIZE, index_size: int = settings.FILE_INDEX_SIZE,
+                 session_ttl: int = settings.UPLOAD_SESSION_TTL_SECONDS):
+        self.root = root
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.index_size = index_size
+        self.session_ttl = session_ttl
+        self._index: "OrderedDict[str, IndexedFile]" = OrderedDict()
+        self._objects = os.path.join(root, "objects")
+        self._tmp = os.path.join(root, "tmp")
+        self._sessions = os.path.join(root, "sessions")
+        # Running hash per resumable upload, valid while this worker has seen every chunk so far
+        self._hashers: Dict[str, Tuple[int, "hashlib._Hash"]] = {}
+        # Only for sessions that exist, dropped when they complete or expire
+        self._session_locks: Dict[str, asyncio.Lock] = {}
+        self._next_sweep = 0.0
+        self._dirs_ready = False
+
+    async def _ensure_dirs(self) -> None:
+        if not self._dirs_ready:
+            for path in (self._objects, self._tmp, self._sessions):
+                await aiofiles.os.makedirs(path, exist_ok=True)
+            self._dirs_ready = True
+
+    def object_path(self, file_id: str) -> str:
+        return os.path.join(self._objects, file_id[:2], file_id)
+
+    def check_size(self, size: int) -> None:
+        if size > self.max_size:
+            raise FileTooLargeException(f"File exceeds the {self.max_size} byte limit")
+
+    async def _coalesce(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Regroup small body chunks into chunk_size writes (one thread hop per write with aiofiles)"""
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    async def _write(self, path: str, mode: str, chunks: AsyncIterable[bytes], hasher, written: int, limit: int) -> int:
+        """Append chunks to path, hashing them; aborts with FileTooLargeException past limit. Returns bytes written."""
+        async with aiofiles.open(path, mode) as f:
+            async for piece in self._coalesce(chunks):
+                written += len(piece)
+                if written > limit:
+                    raise FileTooLargeException(f"File exceeds the {limit} byte limit")
+                hasher.update(piece)
+                await f.write(piece)
+        return written
+
+    async def save_stream(self, chunks: AsyncIterable[bytes], filename: str, content_type: str) -> StoredFile:
+        """Store a streamed upload; a partial file is removed if the stream fails or is too large"""
+        await self._ensure_dirs()
+        tmp_path = os.path.join(self._tmp, uuid.uuid4().hex)
+        hasher = hashlib.sha256()
+        try:
+            size = await self._write(tmp_path, "wb", chunks, hasher, 0, self.max_size)
+            return await self._commit(tmp_path, hasher.hexdigest(), size, filename, content_type)
+        finally:
+            if await aiofiles.os.path.exists(tmp_path):
+                await aiofiles.os.remove(tmp_path)
+
+    async def _commit(self, path: str, digest: str, size: int, filename: str, content_type: str) -> StoredFile:
+        """Move a hashed file into objects/; if that content is already stored, the new copy is dropped"""
+        target = self.object_path(digest)
+        if await aiofiles.os.path.exists(target):
+            await aiofiles.os.remove(path)
+            return StoredFile(id=digest, filename=filename, content_type=content_type, size=size, deduplicated=True)
+        await aiofiles.os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Metadata first: a blob never exists without it
+        async with aiofiles.open(target + ".json", "w") as f:
+            await f.write(json.dumps({"content_type": content_type, "size": size}))
+        await aiofiles.os.replace(path, target)  # atomic: concurrent equal uploads end up with one blob
+        self._remember(IndexedFile(digest, target, content_type, await aiofiles.os.stat(target)))
+        return StoredFile(id=digest, filename=filename, content_type=content_type, size=size)
+
+    # ----------------------------
+    # Downloads
+    # ----------------------------
+
+    def _remember(self, entry: IndexedFile) -> None:
+        self._index[entry.id] = entry
+        self._index.move_to_end(entry.id)
+        while len(self._index) > self.index_size:
+            self._index.popitem(last=False)
+
+    async def lookup(self, file_id: str) -> Optional[IndexedFile]:
+        """Stored blob by id: from the index, else read once from disk (e.g. stored by another worker)"""
+        entry = self._index.get(file_id)
+        if entry is not None:
+            self._index.move_to_end(file_id)
+            return entry
+        if not _FILE_ID.match(file_id):
+            return None
+        path = self.object_path(file_id)
+        try:
+            async with aiofiles.open(path + ".json") as f:
+                meta = json.loads(await f.read())
+            stat = await aiofiles.os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = IndexedFile(file_id, path, meta["content_type"], stat)
+        self._remember(entry)
+        return entry
+
+    # ----------------------------
+    # Resumable uploads
+    # ----------------------------
+
+    def _session_paths(self, upload_id: str) -> Tuple[str, str]:
+        base = os.path.join(self._sessions, upload_id)
+        return base + ".json", base + ".part"
+
+    async def create_session(self, filename: str, size: int, content_type: str) -> UploadSession:
+        self.check_size(size)
+        await self._ensure_dirs()
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + SESSION_SWEEP_SECONDS
+            await self.expire_sessions()
+        session = UploadSession(id=uuid.uuid4().hex, filename=filename, content_type=content_type, size=size)
+        meta_path, part_path = self._session_paths(session.id)
+        async with aiofiles.open(part_path, "wb"):
+            pass
+        async with aiofiles.open(meta_path, "w") as f:
+            await f.write(json.dumps({"filename": filename, "content_type": content_type, "size": size}))
+        return session
+
+    async def get_session(self, upload_id: str) -> Optional[UploadSession]:
+        """Session with its current offset (the part file's size, so it survives restarts); None if unknown"""
+        if not upload_id.isalnum():
+            return None
+        meta_path, part_path = self._session_paths(upload_id)
+        try:
+            async with aiofiles.open(meta_path) as f:
+                meta = json.loads(await f.read())
+            offset = (await aiofiles.os.stat(part_path)).st_size
+        except FileNotFoundError:
+            return None
+        return UploadSession(id=upload_id, offset=offset, **meta)
+
+    async def append_chunk(self, upload_id: str, offset: int, chunks: AsyncIterable[bytes]) -> Tuple[Optional[UploadSession], Optional[StoredFile]]:
+        """
+        Append a chunk that starts at `offset`. Returns (session, None) while incomplete,
+        (session, stored file) once the last byte arrived, (None, None) for an unknown session.
+        """
+        # Unknown ids never get a lock, so PATCHes to random ids leave nothing behind
+        if await self.get_session(upload_id) is None:
+            return None, None
+        lock = self._session_locks.setdefault(upload_id, asyncio.Lock())
+        async with lock:
+            session = await self.get_session(upload_id)
+            if session is None:
+                # Completed or expired while this request waited
+                self._forget_session(upload_id)
+                return None, None
+            if offset != session.offset:
+                raise UploadOffsetMismatchException(session.offset, offset)
+
+            meta_path, part_path = self._session_paths(upload_id)
+            hashed_to, hasher = self._hashers.pop(upload_id, (0, None))
+            if hasher is None or hashed_to != session.offset:
+                # Earlier chunks went to another worker (or this one restarted): rehash the part from disk
+                hasher = await self._hash_file(part_path)
+            try:
+                session.offset = await self._write(part_path, "ab", chunks, hasher, session.offset, session.size)
+            except Exception:
+                # Drop whatever this request appended; the client resumes from the last good offset
+                os.truncate(part_path, offset)
+                raise
+
+            if session.offset < session.size:
+                self._hashers[upload_id] = (session.offset, hasher)
+                return session, None
+            stored = await self._commit(part_path, hasher.hexdigest(), session.size, session.filename, session.content_type)
+            await aiofiles.os.remove(meta_path)
+            self._forget_session(upload_id)
+            return session, stored
+
+    def _forget_session(self, upload_id: str) -> None:
+        self._session_locks.pop(upload_id, None)
+        self._hashers.pop(upload_id, None)
+
+    async def expire_sessions(self) -> int:
+        """Delete resumable uploads whose part file has not grown for session_ttl seconds; returns how many"""
+        expired = 0
+        for upload_id in await asyncio.to_thread(self._idle_sessions, time.time() - self.session_ttl):
+            lock = self._session_locks.get(upload_id)
+            if lock is not None and lock.locked():
+                continue  # a chunk is arriving right now
+            for path in self._session_paths(upload_id):
+                try:
+                    await aiofiles.os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._forget_session(upload_id)
+            expired += 1
+        return expired
+
+    def _idle_sessions(self, cutoff: float) -> List[str]:
+        idle = []
+        try:
+            names = os.listdir(self._sessions)
+        except FileNotFoundError:
+            return idle
+        for name in names:
+            upload_id, ext = os.path.splitext(name)
+            if ext != ".json":
+                continue
+            last_activity = 0.0
+            for path in self._session_paths(upload_id):
+                try:
+                    last_activity = max(last_activity, os.stat(path).st_mtime)
+                except FileNotFoundError:
+                    pass
+            if last_activity < cutoff:
+                idle.append(upload_id)
+        return idle
+
+    async def _hash_file(self, path: str):
+        hasher = hashlib.sha256()
+        async with aiofiles.open(path, "rb") as f:
+            while piece := await f.read(self.chunk_size):
+                hasher.update(piece)
+        return hasher
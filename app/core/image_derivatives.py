@@ -0,0 +1,261 @@
+# app/core/image_derivatives.py
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+import aiofiles.os
+from app.config import settings
+from app.core.file_manager import FileManager, IndexedFile
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.domain.exceptions.unsupported_image_exceptions import UnsupportedImageException
+from app.utilities.metrics_utils import (
+    image_derivative_cache_bytes, image_derivative_render_duration, image_derivative_requests,
+)
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FORMATS = {"webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+# Decoders Pillow may use on uploads; the rarer plugins stay out of reach of untrusted files
+SOURCE_FORMATS = ("JPEG", "PNG", "WEBP", "GIF", "BMP", "TIFF")
+STALE_TMP_SECONDS = 3600
+
+@dataclass(frozen=True, slots=True)
+class DerivativeSpec:
+    """Fit the image inside (contain) or crop it to (cover) width x height, encoded as format"""
+
+    width: int
+    height: int
+    fit: str = "contain"
+    format: str = "webp"
+    quality: int = 80
+
+    @property
+    def key(self) -> str:
+        return f"{self.width}x{self.height}-{self.fit}-q{self.quality}.{self.format}"
+
+PRESETS: Dict[str, DerivativeSpec] = {
+    "thumbnail": DerivativeSpec(256, 256, "cover"),
+    "small": DerivativeSpec(640, 640),
+    "large": DerivativeSpec(1600, 1600),
+}
+
+def render_derivative(source: str, target: str, width: int, height: int, fit: str, fmt: str, quality: int) -> None:
+    """Runs in a pool worker: decode, orient, resize and encode one derivative to target"""
+    # Imported here, not at module level: web workers that never render do not load Pillow
+    from PIL import Image, ImageOps
+    with Image.open(source, formats=SOURCE_FORMATS) as image:
+        # JPEG can decode straight at 1/2..1/8 scale while that still covers the box
+        side = max(width, height)
+        image.draft(None, (side, side))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+        if fit == "cover":
+            image = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+        else:
+            image.thumbnail((width, height), Image.Resampling.LANCZOS)  # never upscales
+        if fmt == "jpeg" and image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(target, format=fmt.upper(), quality=quality)
+
+class DerivativeManager:
+    """
+    Resized variants of stored images, rendered in a worker pool (never on the event loop) and cached on
+    disk as derivatives/ab/<sha256>/<spec key>, so the cache key is the content hash plus the transform.
+    Concurrent requests for one variant share a single render. The cache is trimmed to cache_bytes,
+    least recently used first; recency is tracked per worker, seeded from file mtimes on first use.
+    """
+
+    def __init__(self, file_manager: FileManager, executor_type: str = settings.IMAGE_EXECUTOR,
+                 max_workers: int = settings.IMAGE_WORKERS, max_queue: int = settings.IMAGE_MAX_QUEUE,
+                 cache_bytes: int = settings.IMAGE_CACHE_MAX_BYTES, upload_presets: str = settings.IMAGE_UPLOAD_PRESETS):
+        if executor_type not in ("process", "thread"):
+            raise ValueError(f"Unknown image executor: {executor_type}")
+        self.upload_presets: List[DerivativeSpec] = []
+        for name in filter(None, (name.strip() for name in upload_presets.split(","))):
+            if name not in PRESETS:
+                raise ValueError(f"Unknown image preset: {name}")
+            self.upload_presets.append(PRESETS[name])
+        self.file_manager = file_manager
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.cache_bytes = cache_bytes
+        self.root = os.path.join(file_manager.root, "derivatives")
+        self._tmp = os.path.join(self.root, "tmp")
+        self._entries: "OrderedDict[str, IndexedFile]" = OrderedDict()  # path -> entry, least recent first
+        self._cache_size = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._rendering: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def cache_size(self) -> int:
+        return self._cache_size
+
+    def derivative_path(self, file_id: str, spec: DerivativeSpec) -> str:
+        return os.path.join(self.root, file_id[:2], file_id, spec.key)
+
+    @staticmethod
+    def derivative_etag(file_id: str, spec: DerivativeSpec) -> str:
+        return f'"{file_id}-{spec.key}"'
+
+    def _entry(self, path: str, stat: os.stat_result) -> IndexedFile:
+        file_id, key = os.path.basename(os.path.dirname(path)), os.path.basename(path)
+        return IndexedFile(f"{file_id}-{key}", path, IMAGE_FORMATS[key.rsplit(".", 1)[1]], stat)
+
+    async def get(self, file_id: str, spec: DerivativeSpec) -> Optional[IndexedFile]:
+        """The derivative of a stored image, rendered on first request; None if the file is unknown"""
+        source = await self.file_manager.lookup(file_id)
+        if source is None:
+            return None
+        if not source.content_type.startswith("image/"):
+            raise UnsupportedImageException(f"{source.content_type} is not an image")
+        await self._load()
+
+        path = self.derivative_path(file_id, spec)
+        entry = self._entries.get(path)
+        if entry is not None:
+            self._entries.move_to_end(path)
+            image_derivative_requests.inc(("hit",))
+            return entry
+        task = self._rendering.get(path)
+        if task is None:
+            task = asyncio.create_task(self._produce(source, spec, path))
+            self._rendering[path] = task
+            task.add_done_callback(lambda done: self._render_finished(path, done))
+            image_derivative_requests.inc(("render",))
+        else:
+            image_derivative_requests.inc(("shared",))
+        # Shielded: a client that goes away does not cancel the render others are waiting for
+        return await asyncio.shield(task)
+
+    def _render_finished(self, path: str, task: asyncio.Task) -> None:
+        self._rendering.pop(path, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here, so a render nobody waits for any more logs no warning
+
+    def schedule_upload_presets(self, file_id: str, content_type: str) -> None:
+        """Render the upload presets of a new image in the background"""
+        if not content_type.startswith("image/"):
+            return
+        for spec in self.upload_presets:
+            task = asyncio.create_task(self._prerender(file_id, spec))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _prerender(self, file_id: str, spec: DerivativeSpec) -> None:
+        try:
+            await self.get(file_id, spec)
+        except UnsupportedImageException as exc:
+            logger.info("No %s derivative for %s: %s", spec.key, file_id, exc)
+        except Exception:
+            logger.warning("Rendering the %s derivative of %s failed", spec.key, file_id, exc_info=True)
+
+    async def _produce(self, source: IndexedFile, spec: DerivativeSpec, path: str) -> IndexedFile:
+        try:
+            stat = await aiofiles.os.stat(path)  # rendered by another worker already
+        except FileNotFoundError:
+            stat = await self._render(source, spec, path)
+        entry = self._entry(path, stat)
+        await self._remember(entry)
+        return entry
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so importing this module never forks workers
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-render")
+        return self._executor
+
+    async def _render(self, source: IndexedFile, spec: DerivativeSpec, path: str) -> os.stat_result:
+        if self._in_flight >= self.capacity:
+            raise ServiceUnavailableException("Image rendering queue is full, retry later")
+        self._in_flight += 1
+        tmp_path = os.path.join(self._tmp, uuid.uuid4().hex)
+        start = time.perf_counter()
+        try:
+            await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+            loop = asyncio.get_running_loop()
+            from PIL import Image
+            try:
+                await loop.run_in_executor(self._get_executor(), render_derivative, source.path, tmp_path,
+                                           spec.width, spec.height, spec.fit, spec.format, spec.quality)
+            except (OSError, ValueError, Image.DecompressionBombError) as exc:
+                raise UnsupportedImageException(f"Cannot render this image: {exc}") from exc
+            await aiofiles.os.replace(tmp_path, path)  # atomic: readers never see a partial file
+            return await aiofiles.os.stat(path)
+        finally:
+            self._in_flight -= 1
+            image_derivative_render_duration.observe((), time.perf_counter() - start)
+            if await aiofiles.os.path.exists(tmp_path):
+                await aiofiles.os.remove(tmp_path)
+
+    async def _remember(self, entry: IndexedFile) -> None:
+        previous = self._entries.pop(entry.path, None)
+        if previous is not None:
+            self._cache_size -= previous.stat.st_size
+        self._entries[entry.path] = entry
+        self._cache_size += entry.stat.st_size
+        await self._evict()
+
+    async def _evict(self) -> None:
+        # The newest entry always stays: it is about to be served
+        while self._cache_size > self.cache_bytes and len(self._entries) > 1:
+            path, evicted = self._entries.popitem(last=False)
+            self._cache_size -= evicted.stat.st_size
+            try:
+                await aiofiles.os.remove(path)
+            except FileNotFoundError:
+                pass
+        image_derivative_cache_bytes.set(self._cache_size)
+
+    async def _load(self) -> None:
+        """Index the derivatives already on disk once, oldest first, and trim them to the budget"""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            await aiofiles.os.makedirs(self._tmp, exist_ok=True)
+            for path, stat in sorted(await asyncio.to_thread(self._scan), key=lambda found: found[1].st_mtime):
+                self._entries[path] = self._entry(path, stat)
+                self._cache_size += stat.st_size
+            await self._evict()
+            self._loaded = True
+
+    def _scan(self) -> List[Tuple[str, os.stat_result]]:
+        found = []
+        now = time.time()
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                if directory == self._tmp:
+                    # Left behind by a crash; recent ones may belong to a render in another worker
+                    if now - stat.st_mtime > STALE_TMP_SECONDS:
+                        os.remove(path)
+                elif name.rsplit(".", 1)[-1] in IMAGE_FORMATS:
+                    found.append((path, stat))
+        return found
+
+    def shutdown(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
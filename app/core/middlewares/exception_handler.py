@@ -3,6 +3,13 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from app.utilities.common_response import APIResponse
 from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.domain.exceptions.invalid_cursor_exceptions import InvalidCursorException
+from app.domain.exceptions.file_too_large_exceptions import FileTooLargeException
+from app.domain.exceptions.upload_offset_exceptions import UploadOffsetMismatchException
+from app.domain.exceptions.unsupported_image_exceptions import UnsupportedImageException
+from app.domain.exceptions.unbalanced_voucher_exceptions import UnbalancedVoucherException
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
 from fastapi import HTTPException
 
 async def global_exception_handler(request: Request, exc: Exception):
@@ -10,6 +17,34 @@ async def global_exception_handler(request: Request, exc: Exception):
         response = APIResponse(success=False, message="Already exists", errors=str(exc))
         return JSONResponse(status_code=400, content=response.model_dump())
     
+    if isinstance(exc, InvalidCursorException):
+        response = APIResponse(success=False, message="Invalid cursor", errors=str(exc))
+        return JSONResponse(status_code=400, content=response.model_dump())
+
+    if isinstance(exc, UnbalancedVoucherException):
+        response = APIResponse(success=False, message="Unbalanced voucher", errors=str(exc))
+        return JSONResponse(status_code=400, content=response.model_dump())
+
+    if isinstance(exc, FileTooLargeException):
+        response = APIResponse(success=False, message="File too large", errors=str(exc))
+        return JSONResponse(status_code=413, content=response.model_dump())
+
+    if isinstance(exc, UploadOffsetMismatchException):
+        response = APIResponse(success=False, message="Upload offset mismatch", errors=str(exc))
+        return JSONResponse(status_code=409, content=response.model_dump(), headers={"Upload-Offset": str(exc.expected)})
+
+    if isinstance(exc, ClosedPeriodException):
+        response = APIResponse(success=False, message="Period closed", errors=str(exc))
+        return JSONResponse(status_code=409, content=response.model_dump())
+
+    if isinstance(exc, UnsupportedImageException):
+        response = APIResponse(success=False, message="Unsupported image", errors=str(exc))
+        return JSONResponse(status_code=415, content=response.model_dump())
+
+    if isinstance(exc, ServiceUnavailableException):
+        response = APIResponse(success=False, message="Service unavailable", errors=str(exc))
+        return JSONResponse(status_code=503, content=response.model_dump(), headers={"Retry-After": "1"})
+
     if isinstance(exc, HTTPException):
         response = APIResponse(success=False, message=exc.detail, errors=None)
         return JSONResponse(status_code=exc.status_code, content=response.model_dump())
@@ -0,0 +1,53 @@
+# app/core/middlewares/request_metrics_middleware.py
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.db.instrumentation import RequestMetrics, start_request_metrics
+from app.utilities.metrics_utils import db_rows, http_request_duration, http_requests
+
+def _server_timing(metrics: RequestMetrics, elapsed: float) -> bytes:
+    return (
+        f'sql;dur={metrics.sql_time * 1000:.2f};desc="{metrics.sql_count} queries", '
+        f'mongo;dur={metrics.mongo_time * 1000:.2f};desc="{metrics.mongo_count} commands", '
+        f'rows;desc="{metrics.rows}", '
+        f'app;dur={elapsed * 1000:.2f}'
+    ).encode()
+
+class RequestMetricsMiddleware:
+    """
+    Per-request DB instrumentation: a Server-Timing header (SQL / Mongo time and counts, rows returned),
+    an X-DB-Checkouts header, and the per-route histograms served on /metrics.
+    Plain ASGI (not BaseHTTPMiddleware) so the endpoint runs in the same context as the metrics.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = start_request_metrics()
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(metrics, time.perf_counter() - start)))
+                headers.append((b"x-db-checkouts", str(metrics.checkouts).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            # Route template, not the raw path, so ids don't explode the label set
+            route = scope.get("route")
+            route_label = getattr(route, "path", "unmatched")
+            http_request_duration.observe((scope["method"], route_label), time.perf_counter() - start)
+            http_requests.inc((scope["method"], route_label, str(status)))
+            if metrics.rows:
+                db_rows.inc((route_label,), metrics.rows)
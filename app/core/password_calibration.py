@@ -0,0 +1,64 @@
+# app/core/password_calibration.py
+"""
+Pick the bcrypt cost for this host: the highest cost whose verify stays within
+PASSWORD_VERIFY_TARGET_MS, never below PASSWORD_MIN_ROUNDS.
+
+    python -m app.core.password_calibration             # print the recommended PASSWORD_SALT_ROUNDS
+    PASSWORD_CALIBRATE_ON_STARTUP=true                  # or let every worker calibrate itself at startup
+"""
+import argparse
+import asyncio
+import math
+import statistics
+import time
+from typing import Tuple
+from passlib.hash import bcrypt
+from app.config import settings
+from app.core.security import set_password_rounds
+from app.utilities.metrics_utils import password_calibrated_verify
+
+MAX_ROUNDS = 16
+_SAMPLE_PASSWORD = "calibration-sample-password"
+
+def measure_verify_ms(rounds: int, samples: int = 3) -> float:
+    """Median time of one bcrypt verify at the given cost"""
+    hashed = bcrypt.using(rounds=rounds).hash(_SAMPLE_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.verify(_SAMPLE_PASSWORD, hashed)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+def calibrate_rounds(target_ms: float, min_rounds: int, max_rounds: int = MAX_ROUNDS) -> Tuple[int, float]:
+    """
+    (rounds, verify ms at that cost). Each extra round doubles the work, so the cost is extrapolated
+    from a measurement at min_rounds and then checked once at the chosen cost.
+    """
+    base_ms = measure_verify_ms(min_rounds)
+    extra = int(math.log2(target_ms / base_ms)) if base_ms < target_ms else 0
+    rounds = min(max(min_rounds + extra, min_rounds), max_rounds)
+    verify_ms = measure_verify_ms(rounds) if rounds != min_rounds else base_ms
+    if verify_ms > target_ms and rounds > min_rounds:
+        rounds -= 1
+        verify_ms = measure_verify_ms(rounds)
+    return rounds, verify_ms
+
+async def calibrate_password_rounds() -> Tuple[int, float]:
+    """Calibrate off the event loop and switch new hashes to the chosen cost"""
+    rounds, verify_ms = await asyncio.to_thread(
+        calibrate_rounds, settings.PASSWORD_VERIFY_TARGET_MS, settings.PASSWORD_MIN_ROUNDS)
+    set_password_rounds(rounds)
+    password_calibrated_verify.set(verify_ms / 1000)
+    return rounds, verify_ms
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=settings.PASSWORD_VERIFY_TARGET_MS)
+    parser.add_argument("--min-rounds", type=int, default=settings.PASSWORD_MIN_ROUNDS)
+    args = parser.parse_args()
+    rounds, verify_ms = calibrate_rounds(args.target_ms, args.min_rounds)
+    print(f"PASSWORD_SALT_ROUNDS={rounds}  # verify {verify_ms:.0f}ms (target {args.target_ms:.0f}ms, minimum cost {args.min_rounds})")
+
+if __name__ == "__main__":
+    main()
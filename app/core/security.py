@@ -1,21 +1,145 @@
 # app/core/security.py
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict
-from jose import jwt
+from typing import Callable, Dict, List, Optional, Tuple
 from passlib.context import CryptContext
 from app.config import settings
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.utilities.metrics_utils import password_hash_rounds, password_verify_duration
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt's own limit: a stored cost above the current one is never "stale", so logins never downgrade
+# hashes (passlib otherwise flags costs above the configured one too)
+BCRYPT_MAX_ROUNDS = 31
+
+# Hashes below the current cost count as stale: verify_and_update hands back a replacement hash
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_SALT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_SALT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_MAX_ROUNDS,
+)
+password_hash_rounds.set(settings.PASSWORD_SALT_ROUNDS)
 
 def create_access_token(data: Dict, expires_delta: timedelta = None):
+    from jose import jwt  # imported on first use, like the other optional backends: it costs ~30ms at boot
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or settings.JWT_ACCESS_TOKEN_EXPIRE)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
+def decode_access_token(token: str) -> Optional[Dict]:
+    """Claims of a valid, unexpired token made by create_access_token; None otherwise"""
+    from jose import JWTError, jwt
+    try:
+        return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """(valid, new hash); the new hash is only set when the stored one was made with a stale cost"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return [pwd_context.hash(p) for p in passwords]
+
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt hashing/verification in a dedicated worker pool so the event loop never blocks.
+    Work beyond `max_workers + max_queue` in-flight calls is rejected with ServiceUnavailableException.
+    """
+
+    def __init__(self, executor_type: str = "process", max_workers: int = 2, max_queue: int = 32):
+        if executor_type not in ("process", "thread"):
+            raise ValueError(f"Unknown password hasher executor: {executor_type}")
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so importing this module never forks workers
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pwd-hasher")
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        if self._in_flight >= self.capacity:
+            raise ServiceUnavailableException("Password hashing queue is full, retry later")
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasherPool(
+    executor_type=settings.PASSWORD_HASHER_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+)
+
+def set_password_rounds(rounds: int) -> None:
+    """Use a new bcrypt cost for new hashes; stored hashes below it are upgraded on their next login"""
+    pwd_context.update(bcrypt__rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=BCRYPT_MAX_ROUNDS)
+    password_hash_rounds.set(rounds)
+    # Process workers hold a copy of the old context; the next call forks new ones
+    password_hasher.shutdown()
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    start = time.perf_counter()
+    try:
+        return await password_hasher.run(verify_and_update_password, plain_password, hashed_password)
+    finally:
+        password_verify_duration.observe((), time.perf_counter() - start)
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(hash_password, password)
+
+async def hash_passwords_async(passwords: List[str], chunk_size: int = settings.PASSWORD_HASH_CHUNK_SIZE) -> List[str]:
+    """
+    Hash many passwords in small chunks, at most max_workers - 1 in the pool at a time (one with a single
+    worker): a large import never holds every worker, and login verifies only queue behind one chunk
+    """
+    if not passwords:
+        return []
+    chunks = [passwords[i:i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+    window = asyncio.Semaphore(max(1, password_hasher.max_workers - 1))
+
+    async def hash_chunk(chunk: List[str]) -> List[str]:
+        async with window:
+            return await password_hasher.run(hash_passwords, chunk)
+
+    results = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+    return [hashed for chunk in results for hashed in chunk]
@@ -0,0 +1,16 @@
+# app/domain/dtos/bulk/BulkImportResponse.py
+from pydantic import BaseModel
+from typing import List
+from app.domain.dtos.bulk.BulkRowResult import BulkRowResult
+
+class BulkImportResponse(BaseModel):
+    total: int
+    created: int
+    failed: int
+    results: List[BulkRowResult]
+
+    @classmethod
+    def from_results(cls, results: List[BulkRowResult]) -> "BulkImportResponse":
+        results = sorted(results, key=lambda r: r.index)
+        created = sum(1 for r in results if r.success)
+        return cls(total=len(results), created=created, failed=len(results) - created, results=results)
@@ -0,0 +1,9 @@
+# app/domain/dtos/bulk/BulkRowResult.py
+from pydantic import BaseModel
+from typing import Optional
+
+class BulkRowResult(BaseModel):
+    index: int                  # 0-based position of the row in the request
+    success: bool
+    id: Optional[str] = None    # id of the created record
+    error: Optional[str] = None
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+class StoredFileResponse(BaseModel):
+    id: str
+    filename: str
+    content_type: str
+    size: int
+    deduplicated: bool
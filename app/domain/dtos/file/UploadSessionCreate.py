@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+class UploadSessionCreate(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    size: int = Field(..., ge=1)
+    content_type: str = "application/octet-stream"
@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel
+from app.domain.dtos.file.StoredFileResponse import StoredFileResponse
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    filename: str
+    size: int
+    offset: int
+    completed: bool = False
+    file: Optional[StoredFileResponse] = None
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel
+
+class JobStatusResponse(BaseModel):
+    id: str
+    kind: str
+    state: str  # queued, running, succeeded, failed
+    submitDate: datetime
+    rows: int
+    chunks: int
+    chunksDone: int
+    rowsDone: int  # rows of the finished chunks
+    result: Optional[Any] = None  # the job's report once it succeeded (user-import: BulkImportResponse)
+    error: Optional[str] = None
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+class NotificationCreate(BaseModel):
+    topic: str = Field(..., min_length=1, max_length=100)
+    # Written into the event: line of the SSE frame, so no line breaks
+    event: str = Field("message", min_length=1, max_length=100, pattern=r"^[^\r\n]+$")
+    data: str
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class NotificationResponse(BaseModel):
+    id: str
+    topic: str
+    event: str
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class PeriodCloseResponse(BaseModel):
+    period: str  # YYYY-MM
+    periodsSummarized: int  # every open period up to this one is closed with it
+    summaries: int
+    lines: int
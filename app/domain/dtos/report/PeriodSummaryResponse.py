@@ -0,0 +1,10 @@
+from decimal import Decimal
+from pydantic import BaseModel
+
+class PeriodSummaryResponse(BaseModel):
+    period: str  # YYYY-MM
+    account: str
+    debit: Decimal
+    credit: Decimal
+    lines: int
+    closed: bool
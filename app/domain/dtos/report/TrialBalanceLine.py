@@ -0,0 +1,8 @@
+from decimal import Decimal
+from pydantic import BaseModel
+
+class TrialBalanceLine(BaseModel):
+    account: str
+    debit: Decimal
+    credit: Decimal
+    balance: Decimal  # debit - credit
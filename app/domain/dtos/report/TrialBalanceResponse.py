@@ -0,0 +1,12 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel
+from app.domain.dtos.report.TrialBalanceLine import TrialBalanceLine
+
+class TrialBalanceResponse(BaseModel):
+    asOf: date
+    closedThrough: Optional[str] = None  # latest closed period, served from its stored summaries
+    totalDebit: Decimal
+    totalCredit: Decimal
+    accounts: List[TrialBalanceLine]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, EmailStr
+from typing import Optional
+
+class UserImportRow(BaseModel):
+    """A row of a background user import as queued: the password is hashed before the row reaches the broker"""
+    username: str
+    hashed_password: str
+    email: Optional[EmailStr] = None
+    roleId: Optional[str] = None
+    isActive: bool = True
+
+    model_config = {
+        "extra": "forbid"
+    }
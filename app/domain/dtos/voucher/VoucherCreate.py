@@ -0,0 +1,14 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.config import settings
+from app.domain.dtos.voucher.VoucherLineCreate import VoucherLineCreate
+
+class VoucherCreate(BaseModel):
+    voucherDate: Optional[date] = None  # defaults to today (UTC)
+    description: Optional[str] = Field(None, max_length=200)
+    lines: List[VoucherLineCreate] = Field(..., min_length=2, max_length=settings.VOUCHER_MAX_LINES)
+
+    model_config = {
+        "extra": "forbid"
+    }
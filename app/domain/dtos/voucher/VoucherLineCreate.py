@@ -0,0 +1,13 @@
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class VoucherLineCreate(BaseModel):
+    account: str = Field(..., min_length=1, max_length=50)
+    debit: Decimal = Field(Decimal("0"), ge=0, max_digits=18, decimal_places=2)
+    credit: Decimal = Field(Decimal("0"), ge=0, max_digits=18, decimal_places=2)
+    description: Optional[str] = Field(None, max_length=200)
+
+    model_config = {
+        "extra": "forbid"
+    }
@@ -0,0 +1,9 @@
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel
+
+class VoucherLineResponse(BaseModel):
+    account: str
+    debit: Decimal
+    credit: Decimal
+    description: Optional[str] = None
@@ -0,0 +1,15 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel
+from app.domain.dtos.voucher.VoucherLineResponse import VoucherLineResponse
+
+class VoucherResponse(BaseModel):
+    id: str
+    number: int
+    voucherDate: date
+    description: Optional[str] = None
+    totalDebit: Decimal
+    totalCredit: Decimal
+    lines: List[VoucherLineResponse]
+    createDate: datetime
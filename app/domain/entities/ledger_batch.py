@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional, Tuple
+
+@dataclass(slots=True, eq=False)
+class LedgerBatch:
+    """
+    Column-oriented slice of an account ledger: the account's lines in posting order, each with the
+    running balance (debit - credit) after it. Streamed by the ledger export; one tuple per field.
+    """
+
+    voucherDate: Tuple[date, ...] = ()
+    number: Tuple[int, ...] = ()
+    voucherId: Tuple[str, ...] = ()
+    description: Tuple[Optional[str], ...] = ()
+    debit: Tuple[Decimal, ...] = ()
+    credit: Tuple[Decimal, ...] = ()
+    balance: Tuple[Decimal, ...] = ()
+
+    FIELDS = ("voucherDate", "number", "voucherId", "description", "debit", "credit", "balance")
+
+    def __len__(self) -> int:
+        return len(self.voucherId)
+
+    def rows(self, fields: Iterable[str]) -> Iterator[tuple]:
+        """Row tuples holding the given fields, in that order"""
+        return zip(*(getattr(self, field) for field in fields))
@@ -1,12 +1,9 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True, eq=False)
 class Role:
-    """Domain entity for a User"""
+    """Domain entity for a Role (slotted: no per-instance __dict__)"""
 
-    def __init__(
-        self,
-        id: int,
-        name: str,
-        isActive: bool = True
-    ):
-        self.id = id
-        self.name = name
-        self.isActive = isActive
+    id: int
+    name: str
+    isActive: bool = True
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True, eq=False)
+class StoredFile:
+    """A stored upload; id is the SHA-256 of the content, so equal uploads share one blob"""
+
+    id: str
+    filename: str
+    content_type: str
+    size: int
+    deduplicated: bool = False
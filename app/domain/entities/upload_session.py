@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True, eq=False)
+class UploadSession:
+    """A resumable upload in progress; offset is how many bytes have been received so far"""
+
+    id: str
+    filename: str
+    content_type: str
+    size: int
+    offset: int = 0
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.domain.entities.user import User
+
+@dataclass(slots=True, eq=False)
+class UserBatch:
+    """
+    Column-oriented batch of users: one tuple per field instead of one User object per row.
+    Used by the export path, where hundreds of thousands of rows only pass through.
+    """
+
+    id: Tuple[str, ...] = ()
+    username: Tuple[str, ...] = ()
+    email: Tuple[Optional[str], ...] = ()
+    roleId: Tuple[Optional[str], ...] = ()
+    roleName: Tuple[Optional[str], ...] = ()
+    createDate: Tuple[datetime, ...] = ()
+    isActive: Tuple[bool, ...] = ()
+
+    FIELDS = ("id", "username", "email", "roleId", "roleName", "createDate", "isActive")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "UserBatch":
+        """Build from row tuples ordered as FIELDS"""
+        if not rows:
+            return cls()
+        return cls(*zip(*rows))
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def rows(self, fields: Iterable[str]) -> Iterator[tuple]:
+        """Row tuples holding the given fields, in that order"""
+        return zip(*(getattr(self, field) for field in fields))
+
+    def __iter__(self) -> Iterator[User]:
+        """Materialize one User at a time, for callers that need entities"""
+        for row in self.rows(self.FIELDS):
+            yield User(**dict(zip(self.FIELDS, row)))
+
+    def to_list(self) -> List[User]:
+        return list(self)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import List, Optional
+from app.domain.entities.voucher_line import VoucherLine
+
+@dataclass(slots=True, eq=False)
+class Voucher:
+    """Domain entity for a voucher: balanced debit / credit lines posted together"""
+
+    id: Optional[str] = None
+    number: Optional[int] = None
+    voucherDate: Optional[date] = None
+    description: Optional[str] = None
+    lines: List[VoucherLine] = field(default_factory=list)
+    createDate: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.createDate is None:
+            self.createDate = datetime.now(timezone.utc)
+        if self.voucherDate is None:
+            self.voucherDate = self.createDate.date()
+
+    @property
+    def totalDebit(self) -> Decimal:
+        return sum((line.debit for line in self.lines), Decimal("0"))
+
+    @property
+    def totalCredit(self) -> Decimal:
+        return sum((line.credit for line in self.lines), Decimal("0"))
+
+    def balance_error(self) -> Optional[str]:
+        """Why the voucher cannot be posted, or None when it is balanced"""
+        if len(self.lines) < 2:
+            return "A voucher needs at least two lines"
+        for index, line in enumerate(self.lines):
+            if (line.debit > 0) == (line.credit > 0):
+                return f"Line {index + 1} must have either a debit or a credit amount"
+        if self.totalDebit != self.totalCredit:
+            return f"Debits ({self.totalDebit}) and credits ({self.totalCredit}) do not balance"
+        return None
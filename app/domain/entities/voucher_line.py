@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+@dataclass(slots=True, eq=False)
+class VoucherLine:
+    """One ledger line of a voucher: an account debited or credited"""
+
+    account: str
+    debit: Decimal = Decimal("0")
+    credit: Decimal = Decimal("0")
+    description: Optional[str] = None
@@ -0,0 +1,2 @@
+class ClosedPeriodException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class UnbalancedVoucherException(Exception):
+    pass
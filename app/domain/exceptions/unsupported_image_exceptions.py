@@ -0,0 +1,2 @@
+class UnsupportedImageException(Exception):
+    pass
@@ -0,0 +1,7 @@
+class UploadOffsetMismatchException(Exception):
+    """A resumable upload chunk did not start where the stored part ends"""
+
+    def __init__(self, expected: int, received: int):
+        super().__init__(f"Upload offset is {expected}, chunk starts at {received}")
+        self.expected = expected
+        self.received = received
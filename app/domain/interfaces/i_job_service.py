@@ -0,0 +1,18 @@
+#i_job_service.py
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, Optional
+from app.domain.dtos.job.JobStatusResponse import JobStatusResponse
+from app.utilities.bulk_utils import BulkRow
+
+class IJobService(ABC):
+    """Interface for background jobs run by the task workers"""
+
+    @abstractmethod
+    async def submit_user_import(self, rows: AsyncIterable[BulkRow]) -> JobStatusResponse:
+        """Enqueue a user import of parsed bulk rows, fanned out in chunks; returns the queued job."""
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Optional[JobStatusResponse]:
+        """Status and progress of a job, with its report once done; None if unknown or expired."""
+        pass
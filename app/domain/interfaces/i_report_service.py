@@ -0,0 +1,31 @@
+#i_report_service.py
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import AsyncIterator, List, Optional
+from app.domain.entities.ledger_batch import LedgerBatch
+from app.domain.dtos.report.PeriodCloseResponse import PeriodCloseResponse
+from app.domain.dtos.report.PeriodSummaryResponse import PeriodSummaryResponse
+from app.domain.dtos.report.TrialBalanceResponse import TrialBalanceResponse
+
+class IReportService(ABC):
+    """Interface for ledger reports and period closing"""
+
+    @abstractmethod
+    async def trial_balance(self, as_of: Optional[date] = None) -> TrialBalanceResponse:
+        """Per-account debit / credit totals of every line dated on or before as_of (default today)."""
+        pass
+
+    @abstractmethod
+    async def period_summaries(self, first: int, last: int, account: Optional[str] = None) -> List[PeriodSummaryResponse]:
+        """Per-period, per-account totals for periods first..last (YYYYMM)."""
+        pass
+
+    @abstractmethod
+    def account_ledger(self, account: str, start: Optional[date], end: date) -> AsyncIterator[LedgerBatch]:
+        """An account's lines dated start..end with running balances, after an opening-balance row when start is set."""
+        pass
+
+    @abstractmethod
+    async def close_period(self, period: int) -> PeriodCloseResponse:
+        """Summarize and close every open period up to period; raises ClosedPeriodException if it is closed already."""
+        pass
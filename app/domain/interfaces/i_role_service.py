@@ -1,8 +1,11 @@
 #i_user_service.py
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional
 from app.domain.entities.role import Role
 from app.domain.dtos.role.RoleCreate import RoleCreate
+from app.domain.dtos.role.RoleResponse import RoleResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.utilities.bulk_utils import BulkRow
 
 class IRoleService(ABC):
     """Interface for user-related business logic"""
@@ -11,6 +14,16 @@ class IRoleService(ABC):
     async def create_role(self, role_data: RoleCreate) -> Role:
         pass
 
+    @abstractmethod
+    async def bulk_create_roles(self, rows: AsyncIterable[BulkRow], batch_size: int = 1000) -> BulkImportResponse:
+        """Create many roles, returning a per-row report."""
+        pass
+
+    @abstractmethod
+    def export_roles(self, batch_size: int = 1000) -> AsyncIterator[List[RoleResponse]]:
+        """Stream every role in batches (async generator)."""
+        pass
+
     @abstractmethod
     async def get_role_by_id(self, role_id: int) -> Optional[Role]:
         pass
@@ -19,6 +32,6 @@ class IRoleService(ABC):
     # async def list_roles(self) -> List[Role]:
     #     pass
     @abstractmethod
-    async def list_roles( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True) -> Dict[str, any]:
+    async def list_roles( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True, cursor: Optional[str] = None, include_total: str = "true") -> Dict[str, any]:
         """Fetch all roles."""
         pass
\ No newline at end of file
@@ -1,8 +1,12 @@
 #i_user_service.py
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional
 from app.domain.entities.user import User
+from app.domain.entities.user_batch import UserBatch
 from app.domain.dtos.user.UserCreate import UserCreate
+from app.domain.dtos.user.UserResponse import UserResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.utilities.bulk_utils import BulkRow
 
 class IUserService(ABC):
     """Interface for user-related business logic"""
@@ -11,6 +15,16 @@ class IUserService(ABC):
     async def create_user(self, user_data: UserCreate) -> User:
         pass
 
+    @abstractmethod
+    async def bulk_create_users(self, rows: AsyncIterable[BulkRow], batch_size: int = 1000) -> BulkImportResponse:
+        """Create many users, returning a per-row report."""
+        pass
+
+    @abstractmethod
+    def export_users(self, batch_size: int = 1000) -> AsyncIterator[UserBatch]:
+        """Stream every user in columnar batches (async generator)."""
+        pass
+
     @abstractmethod
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         pass
@@ -19,6 +33,6 @@ class IUserService(ABC):
     # async def list_users(self) -> List[User]:
     #     pass
     @abstractmethod
-    async def list_users( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True) -> Dict[str, any]:
+    async def list_users( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True, cursor: Optional[str] = None, include_total: str = "true") -> Dict[str, any]:
         """Fetch all users."""
         pass
@@ -0,0 +1,18 @@
+#i_voucher_service.py
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.dtos.voucher.VoucherCreate import VoucherCreate
+from app.domain.dtos.voucher.VoucherResponse import VoucherResponse
+
+class IVoucherService(ABC):
+    """Interface for voucher posting"""
+
+    @abstractmethod
+    async def post_voucher(self, voucher_data: VoucherCreate) -> VoucherResponse:
+        """Validate and post a voucher; raises UnbalancedVoucherException when debits and credits differ,
+        ClosedPeriodException when it is dated in a closed period."""
+        pass
+
+    @abstractmethod
+    async def get_voucher_by_id(self, voucher_id: str) -> Optional[VoucherResponse]:
+        pass
@@ -0,0 +1,189 @@
+# app/hubs/chat_hub.py
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, Set
+from app.config import settings
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.utilities.metrics_utils import chat_connections, chat_frames_dropped
+
+logger = logging.getLogger(__name__)
+
+CHAT_CHANNEL = "chat"
+
+class SlowConsumerPolicy(str, Enum):
+    """What happens when a connection's outbound queue is full"""
+    DROP = "drop"              # drop the oldest queued frame
+    COALESCE = "coalesce"      # replace the backlog with a "skipped" notice, then keep going
+    DISCONNECT = "disconnect"  # close the connection (1013, try again later)
+
+class ChatConnection:
+    """
+    One WebSocket: the rooms it joined and a bounded outbound queue drained by its own sender task,
+    so fan-out never awaits a client.
+    """
+    __slots__ = ("websocket", "user", "rooms", "queue", "dropped", "closed", "_ready", "_sender")
+
+    def __init__(self, websocket, user: str):
+        self.websocket = websocket
+        self.user = user
+        self.rooms: Set[str] = set()
+        self.queue: deque = deque()
+        self.dropped = 0
+        self.closed = False
+        self._ready = asyncio.Event()
+        self._sender = asyncio.create_task(self._send_loop())
+
+    async def _send_loop(self) -> None:
+        try:
+            while True:
+                if not self.queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                await self.websocket.send_text(self.queue.popleft())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Client went away mid-send; the receive loop sees the disconnect and cleans up
+            self.closed = True
+
+    async def close(self, code: int = 1000) -> None:
+        self._sender.cancel()
+        if not self.closed:
+            self.closed = True
+            await self._close_socket(code)
+
+    def kick(self, code: int) -> asyncio.Task:
+        """Stop sending right away and close the socket in the background (slow consumer)"""
+        self.closed = True
+        self.queue.clear()
+        self._sender.cancel()
+        return asyncio.create_task(self._close_socket(code))
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+class ChatHub:
+    """
+    Room-based chat fan-out. Each message is serialized once and the same frame is queued for every
+    member of the room; publishing goes through the message broker so members on other workers get it too.
+    """
+
+    def __init__(self, broker: IMessageBroker, queue_size: int = settings.CHAT_QUEUE_SIZE,
+                 policy: str = settings.CHAT_SLOW_CONSUMER_POLICY, max_rooms: int = settings.CHAT_MAX_ROOMS_PER_CONNECTION):
+        self.broker = broker
+        self.queue_size = queue_size
+        self.policy = SlowConsumerPolicy(policy)
+        self.max_rooms = max_rooms
+        # room -> members; connection.rooms is the reverse index, so leaving / disconnecting is O(rooms joined)
+        self._rooms: Dict[str, Set[ChatConnection]] = {}
+        self._connections: Set[ChatConnection] = set()
+        self._closing: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        await self.broker.subscribe(CHAT_CHANNEL, self._on_broker_message)
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    def room_size(self, room: str) -> int:
+        return len(self._rooms.get(room, ()))
+
+    def connect(self, websocket, user: str) -> ChatConnection:
+        connection = ChatConnection(websocket, user)
+        self._connections.add(connection)
+        chat_connections.set(len(self._connections))
+        return connection
+
+    async def disconnect(self, connection: ChatConnection) -> None:
+        for room in connection.rooms:
+            self._leave_index(connection, room)
+        connection.rooms.clear()
+        self._connections.discard(connection)
+        chat_connections.set(len(self._connections))
+        await connection.close()
+
+    def join(self, connection: ChatConnection, room: str) -> bool:
+        """Add the connection to a room; False (and nothing joined) once it is in max_rooms rooms"""
+        if room not in connection.rooms and len(connection.rooms) >= self.max_rooms:
+            return False
+        connection.rooms.add(room)
+        self._rooms.setdefault(room, set()).add(connection)
+        return True
+
+    def leave(self, connection: ChatConnection, room: str) -> None:
+        connection.rooms.discard(room)
+        self._leave_index(connection, room)
+
+    def _leave_index(self, connection: ChatConnection, room: str) -> None:
+        members = self._rooms.get(room)
+        if members is not None:
+            members.discard(connection)
+            if not members:
+                del self._rooms[room]
+
+    async def publish(self, room: str, user: str, text: str) -> None:
+        """Serialize once; every worker (this one included) delivers it to its local members"""
+        frame = json.dumps({"type": "message", "room": room, "user": user, "text": text, "ts": time.time()})
+        # Length-prefixed room in front of the frame: receiving workers route without parsing the JSON
+        # again, and no room name can spill into the frame
+        try:
+            await self.broker.publish(CHAT_CHANNEL, f"{len(room)}:{room}{frame}")
+        except Exception:
+            logger.warning("Chat broker publish failed; delivering to this worker only", exc_info=True)
+            self.deliver(room, frame)
+
+    async def _on_broker_message(self, message: str) -> None:
+        length, _, rest = message.partition(":")
+        try:
+            size = int(length)
+        except ValueError:
+            logger.warning("Dropping malformed chat broker message")
+            return
+        self.deliver(rest[:size], rest[size:])
+
+    def send_error(self, connection: ChatConnection, detail: str) -> None:
+        """
+        Queue an error frame for one connection. Like every other frame it goes through the connection's
+        queue: its sender task is the socket's only writer, and a client that floods bad frames without
+        reading is held to the queue size and the slow-consumer policy.
+        """
+        self._offer(connection, json.dumps({"type": "error", "detail": detail}))
+
+    def deliver(self, room: str, frame: str) -> None:
+        """Queue an encoded frame for every local member of the room; never waits for a client"""
+        for connection in list(self._rooms.get(room, ())):
+            self._offer(connection, frame)
+
+    def _offer(self, connection: ChatConnection, frame: str) -> None:
+        if connection.closed:
+            return
+        queue = connection.queue
+        if len(queue) >= self.queue_size:
+            connection.dropped += 1
+            chat_frames_dropped.inc((self.policy.value,))
+            if self.policy is SlowConsumerPolicy.DROP:
+                queue.popleft()
+            elif self.policy is SlowConsumerPolicy.COALESCE:
+                skipped = len(queue)
+                queue.clear()
+                queue.append(json.dumps({"type": "skipped", "count": skipped}))
+            else:
+                task = connection.kick(code=1013)
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+                return
+        queue.append(frame)
+        connection._ready.set()
+
+    async def close(self) -> None:
+        """Close every connection (server shutdown)"""
+        for connection in list(self._connections):
+            await self.disconnect(connection)
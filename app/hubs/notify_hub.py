@@ -0,0 +1,164 @@
+# app/hubs/notify_hub.py
+import asyncio
+import json
+import logging
+import re
+import time
+import uuid
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from app.config import settings
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.utilities.metrics_utils import notify_subscribers, notify_subscribers_dropped
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "notifications"
+HEARTBEAT_FRAME = b": ping\n\n"
+# SSE ends a line on CRLF, CR or LF alike
+SSE_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+def encode_sse(event_id: str, event: str, data: str) -> bytes:
+    """One Server-Sent Events frame; multi-line data becomes several data: lines"""
+    lines = "".join(f"data: {line}\n" for line in SSE_LINE_BREAK.split(data))
+    return f"id: {event_id}\nevent: {event}\n{lines}\n".encode()
+
+class NotifySubscriber:
+    """One SSE stream: its topic filter (None = everything) and a bounded queue of encoded frames"""
+    __slots__ = ("topics", "queue", "ready", "closed")
+
+    def __init__(self, topics: Optional[FrozenSet[str]]):
+        self.topics = topics
+        self.queue: deque = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def drain(self) -> bytes:
+        frames = b"".join(self.queue)
+        self.queue.clear()
+        return frames
+
+class NotifyHub:
+    """
+    Per-worker SSE fan-out. The worker holds one broker subscription; each event is encoded once
+    on arrival, kept in a bounded replay buffer for Last-Event-ID and queued for the local subscribers.
+    A subscriber that falls queue_size frames behind is cut off: its client reconnects and replays.
+    """
+
+    def __init__(self, broker: IMessageBroker, replay_size: int = settings.NOTIFY_REPLAY_BUFFER,
+                 queue_size: int = settings.NOTIFY_QUEUE_SIZE, heartbeat_seconds: float = settings.NOTIFY_HEARTBEAT_SECONDS):
+        self.broker = broker
+        self.queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        # (event id, topic, frame), oldest first; _positions maps an id to its sequence number for replay
+        self._replay: deque = deque(maxlen=replay_size)
+        self._positions: Dict[str, int] = {}
+        self._sequence = 0
+        self._subscribers: Set[NotifySubscriber] = set()
+        self._by_topic: Dict[str, Set[NotifySubscriber]] = {}
+        self._all_topics: Set[NotifySubscriber] = set()
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._heartbeat is None and self.heartbeat_seconds > 0:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        await self.broker.subscribe(NOTIFY_CHANNEL, self._on_broker_message)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def publish(self, topic: str, event: str, data: str) -> str:
+        """Broadcast to every worker; the id is assigned here so all workers replay by the same ids"""
+        event_id = f"{time.time_ns():x}-{uuid.uuid4().hex[:8]}"
+        message = json.dumps({"id": event_id, "topic": topic, "event": event, "data": data})
+        try:
+            await self.broker.publish(NOTIFY_CHANNEL, message)
+        except Exception:
+            logger.warning("Notification broker publish failed; delivering to this worker only", exc_info=True)
+            await self._on_broker_message(message)
+        return event_id
+
+    async def _on_broker_message(self, message: str) -> None:
+        payload = json.loads(message)
+        self.dispatch(payload["id"], payload["topic"], encode_sse(payload["id"], payload["event"], payload["data"]))
+
+    def dispatch(self, event_id: str, topic: str, frame: bytes) -> None:
+        """Remember the frame for replay and queue it for every matching local subscriber"""
+        if len(self._replay) == self._replay.maxlen:
+            self._positions.pop(self._replay[0][0], None)
+        self._sequence += 1
+        self._replay.append((event_id, topic, frame))
+        self._positions[event_id] = self._sequence
+
+        for subscriber in list(self._all_topics):
+            self._offer(subscriber, frame)
+        for subscriber in list(self._by_topic.get(topic, ())):
+            self._offer(subscriber, frame)
+
+    def _offer(self, subscriber: NotifySubscriber, frame: bytes) -> None:
+        if len(subscriber.queue) >= self.queue_size:
+            # Too far behind: end the stream; the client's reconnect replays from its Last-Event-ID
+            notify_subscribers_dropped.inc()
+            subscriber.closed = True
+            subscriber.queue.clear()
+            self.unsubscribe(subscriber)
+        else:
+            subscriber.queue.append(frame)
+        subscriber.ready.set()
+
+    def subscribe(self, topics: Optional[FrozenSet[str]] = None, last_event_id: Optional[str] = None) -> Tuple[NotifySubscriber, List[bytes]]:
+        """
+        Register a subscriber and return the frames it missed since last_event_id. Both happen without
+        yielding to the loop, so no event falls between replay and live delivery.
+        An unknown id (older than the buffer) replays the whole buffer.
+        """
+        subscriber = NotifySubscriber(topics)
+        self._subscribers.add(subscriber)
+        if topics is None:
+            self._all_topics.add(subscriber)
+        else:
+            for topic in topics:
+                self._by_topic.setdefault(topic, set()).add(subscriber)
+        notify_subscribers.set(self.subscriber_count)
+
+        replay: List[bytes] = []
+        if last_event_id is not None:
+            position = self._positions.get(last_event_id)
+            first = self._sequence - len(self._replay) + 1
+            skip = position - first + 1 if position is not None else 0
+            replay = [frame for index, (_, topic, frame) in enumerate(self._replay)
+                      if index >= skip and (topics is None or topic in topics)]
+        return subscriber, replay
+
+    def unsubscribe(self, subscriber: NotifySubscriber) -> None:
+        self._subscribers.discard(subscriber)
+        if subscriber.topics is None:
+            self._all_topics.discard(subscriber)
+        else:
+            for topic in subscriber.topics:
+                members = self._by_topic.get(topic)
+                if members is not None:
+                    members.discard(subscriber)
+                    if not members:
+                        del self._by_topic[topic]
+        notify_subscribers.set(self.subscriber_count)
+
+    async def _heartbeat_loop(self) -> None:
+        # One timer per worker, one shared frame: keeps proxies from closing idle streams
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            for subscriber in list(self._subscribers):
+                if not subscriber.queue:
+                    subscriber.queue.append(HEARTBEAT_FRAME)
+                    subscriber.ready.set()
+
+    async def close(self) -> None:
+        """End every stream (server shutdown)"""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        for subscriber in list(self._subscribers):
+            subscriber.closed = True
+            subscriber.ready.set()
+            self.unsubscribe(subscriber)
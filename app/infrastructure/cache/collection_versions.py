@@ -0,0 +1,72 @@
+# app/infrastructure/cache/collection_versions.py
+import json
+import logging
+import time
+import uuid
+from typing import Dict
+from app.config import settings
+from app.infrastructure.db.unit_of_work import current_unit_of_work
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_CHANNEL = "collection-versions"
+
+def _token() -> str:
+    return uuid.uuid4().hex[:16]
+
+class CollectionVersions:
+    """
+    Version tokens per collection ("users", "roles") behind the ETags of reads: a token changes whenever
+    its collection is written, so an unchanged token means an unchanged answer and no query is needed.
+    New tokens are broadcast through the message broker and adopted by every worker, so clients see the
+    same ETag whichever worker serves them; a starting worker broadcasts a fresh epoch that replaces all
+    tokens. Tokens also roll over every ttl_seconds, bounding how long a missed broadcast (or a write made
+    outside the app) keeps an ETag valid.
+    """
+
+    def __init__(self, broker: IMessageBroker, ttl_seconds: int = settings.ETAG_VERSION_TTL_SECONDS):
+        self.broker = broker
+        self.ttl_seconds = ttl_seconds
+        self._epoch = _token()
+        self._tokens: Dict[str, str] = {}
+        # Identifies this instance (one per worker) so it can skip its own messages
+        self.origin = uuid.uuid4().hex
+
+    async def start(self) -> None:
+        """Follow the versions of other workers and make them adopt this worker's epoch"""
+        await self.broker.subscribe(VERSIONS_CHANNEL, self._on_message)
+        await self._publish({"epoch": self._epoch})
+
+    def current(self, collection: str) -> str:
+        # Wall-clock buckets line up across workers, so the rollover does not split their ETags
+        return f"{self._tokens.get(collection, self._epoch)}.{int(time.time() // self.ttl_seconds)}"
+
+    async def changed(self, *collections: str) -> None:
+        """Record a write: inside a unit of work once it commits (nothing if it rolls back), otherwise now"""
+        uow = current_unit_of_work()
+        if uow is not None:
+            uow.after_commit(lambda: self.bump(*collections))
+        else:
+            await self.bump(*collections)
+
+    async def bump(self, *collections: str) -> None:
+        tokens = {collection: _token() for collection in collections}
+        self._tokens.update(tokens)
+        await self._publish({"tokens": tokens})
+
+    async def _publish(self, payload: dict) -> None:
+        try:
+            await self.broker.publish(VERSIONS_CHANNEL, json.dumps({**payload, "origin": self.origin}))
+        except Exception:
+            # Other workers keep serving their ETags until the TTL rolls them over
+            logger.warning("Could not publish collection versions", exc_info=True)
+
+    async def _on_message(self, message: str) -> None:
+        payload = json.loads(message)
+        if payload.get("origin") == self.origin:
+            return
+        if "epoch" in payload:
+            self._epoch = payload["epoch"]
+            self._tokens.clear()
+        self._tokens.update(payload.get("tokens", {}))
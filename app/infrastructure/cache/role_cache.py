@@ -0,0 +1,86 @@
+# app/infrastructure/cache/role_cache.py
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.domain.entities.role import Role
+
+class RoleCache:
+    """
+    Size-bounded TTL cache of roles, indexed by id and by name (least recently used evicted first).
+    When the whole role set was loaded and fits, the cache is "complete" and a miss means the role does not exist.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_size: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._by_id: "OrderedDict[str, Tuple[Role, float]]" = OrderedDict()
+        self._id_by_name: Dict[str, str] = {}
+        self._complete_until = 0.0
+        # Bumped on every invalidation so loads that started before it are discarded
+        self.generation = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return time.monotonic() < self._complete_until
+
+    def get_by_id(self, role_id: str) -> Optional[Role]:
+        entry = self._by_id.get(role_id)
+        if entry is None:
+            return None
+        role, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(role_id)
+            return None
+        self._by_id.move_to_end(role_id)
+        return role
+
+    def get_by_name(self, name: str) -> Optional[Role]:
+        role_id = self._id_by_name.get(name)
+        return self.get_by_id(role_id) if role_id is not None else None
+
+    def put(self, role: Role, generation: Optional[int] = None) -> bool:
+        """Cache a role read from the database; ignored if the cache was invalidated since the read began"""
+        if generation is not None and generation != self.generation:
+            return False
+        role_id = str(role.id)
+        self._remove(role_id)
+        self._by_id[role_id] = (role, time.monotonic() + self.ttl_seconds)
+        self._id_by_name[role.name] = role_id
+        while len(self._by_id) > self.max_size:
+            _, (evicted, _) = self._by_id.popitem(last=False)
+            self._drop_name(evicted)
+            self._complete_until = 0.0
+        return True
+
+    def load_all(self, roles: Iterable[Role], generation: Optional[int] = None) -> bool:
+        """Replace the contents with the full role set; marks the cache complete if it fits"""
+        if generation is not None and generation != self.generation:
+            return False
+        roles = list(roles)
+        self._by_id.clear()
+        self._id_by_name.clear()
+        for role in roles[: self.max_size]:
+            self.put(role)
+        self._complete_until = time.monotonic() + self.ttl_seconds if len(roles) <= self.max_size else 0.0
+        return True
+
+    def snapshot(self) -> List[Role]:
+        return [role for role, _ in self._by_id.values()]
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._by_id.clear()
+        self._id_by_name.clear()
+        self._complete_until = 0.0
+
+    def _remove(self, role_id: str) -> None:
+        entry = self._by_id.pop(role_id, None)
+        if entry is not None:
+            self._drop_name(entry[0])
+
+    def _drop_name(self, role: Role) -> None:
+        if self._id_by_name.get(role.name) == str(role.id):
+            del self._id_by_name[role.name]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
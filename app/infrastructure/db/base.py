@@ -1,42 +1,79 @@
-
 #For MSSQL
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-#For Mongo
-from motor.motor_asyncio import AsyncIOMotorClient
 #Settings
 from app.config import settings
+from app.infrastructure.db.instrumentation import install_engine_instrumentation, mongo_event_listeners
+
+# Engines and clients are created on first use (or by warm_up()), not at import:
+# a worker only pays for the backends its requests actually touch.
 
 '''For MSSQL Start'''
 
 # SQLAlchemy declarative base
 Base = declarative_base()
 
-# Async engine
-engine = create_async_engine(
-    settings.SQLSERVER_CONNECTION_STRING,  # Make sure connection string uses async driver
-    echo=True
-)
+_engine: AsyncEngine = None
+_session_factory: sessionmaker = None
+
+def get_engine() -> AsyncEngine:
+    """Async engine, created on first use"""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            settings.SQLSERVER_CONNECTION_STRING,  # Make sure connection string uses async driver
+            echo=settings.SQL_ECHO
+        )
+        install_engine_instrumentation(_engine)
+    return _engine
 
-# Async session factory
-async_session = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+def get_session_factory() -> sessionmaker:
+    """Async session factory, bound to the engine on first use"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+    return _session_factory
+
+def async_session() -> AsyncSession:
+    """New session (creates the engine on first call)"""
+    return get_session_factory()()
 
 '''For MSSQL END'''
 
 '''For MONGODB Start'''
 
-# Async MongoDB client
-mongo_client = AsyncIOMotorClient(settings.MONGO_URI)
+_mongo_client = None
 
-# Database reference
-db = mongo_client[settings.MONGO_DB]
+def get_mongo_client():
+    """Async MongoDB client, created on first use (Motor is only imported then)"""
+    global _mongo_client
+    if _mongo_client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _mongo_client = AsyncIOMotorClient(settings.MONGO_URI, event_listeners=mongo_event_listeners())
+    return _mongo_client
 
 # Helper to get a collection
 def get_collection(name: str):
-    return db[name]
+    return get_mongo_client()[settings.MONGO_DB][name]
 
 '''For MONGODB END'''
+
+async def warm_up() -> None:
+    """Open a SQL connection and ping MongoDB now, so the first request does not pay for it"""
+    async with get_engine().connect():
+        pass
+    await get_mongo_client().admin.command("ping")
+
+async def dispose() -> None:
+    """Close whatever was created; backends never used are left alone"""
+    global _engine, _session_factory, _mongo_client
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = _session_factory = None
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
@@ -0,0 +1,13 @@
+# app/infrastructure/db/db_errors.py
+from sqlalchemy.exc import IntegrityError
+
+# SQL Server: 2601 (unique index), 2627 (unique / primary key constraint)
+_SQLSERVER_UNIQUE_CODES = ("2601", "2627")
+
+def is_unique_violation(exc: IntegrityError) -> bool:
+    """Whether an IntegrityError was caused by a unique index / constraint (not a NOT NULL or FK failure)"""
+    orig = exc.orig
+    if getattr(orig, "pgcode", None) == "23505":  # PostgreSQL unique_violation
+        return True
+    message = str(orig)
+    return any(f"({code})" in message for code in _SQLSERVER_UNIQUE_CODES) or "UNIQUE constraint failed" in message
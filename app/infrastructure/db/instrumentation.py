@@ -0,0 +1,136 @@
+# app/infrastructure/db/instrumentation.py
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+from sqlalchemy import event
+from app.config import settings
+from app.utilities.metrics_utils import db_query_duration, repository_duration
+
+class RequestMetrics:
+    """What one request spent in the databases; filled in by the hooks below"""
+    __slots__ = ("checkouts", "sql_count", "sql_time", "mongo_count", "mongo_time", "rows", "_repository_depth")
+
+    def __init__(self):
+        self.checkouts = 0
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.mongo_count = 0
+        self.mongo_time = 0.0
+        self.rows = 0
+        self._repository_depth = 0
+
+# Metrics of the current request (None outside a request)
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+def start_request_metrics() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current_metrics.set(metrics)
+    return metrics
+
+# ----------------------------
+# SQLAlchemy engine events
+# ----------------------------
+# They run inside SQLAlchemy's greenlet, which carries the awaiting task's context
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.checkouts += 1
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._metrics_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - context._metrics_start
+    db_query_duration.observe(("sql",), elapsed)
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.sql_count += 1
+        metrics.sql_time += elapsed
+
+def install_engine_instrumentation(engine) -> None:
+    """Count pool checkouts and time every statement of an (async) engine; no-op when metrics are off"""
+    if not settings.METRICS_ENABLED:
+        return
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "checkout", _on_checkout)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+# ----------------------------
+# pymongo command monitoring
+# ----------------------------
+
+def mongo_event_listeners() -> list:
+    """Command listeners for a Motor client (pymongo is only imported here, with the client)"""
+    if not settings.METRICS_ENABLED:
+        return []
+    from pymongo import monitoring
+
+    class MongoCommandMetrics(monitoring.CommandListener):
+        # Motor runs commands in executor threads with a copy of the caller's context
+        def started(self, event) -> None:
+            pass
+
+        def succeeded(self, event) -> None:
+            self._record(event.duration_micros / 1_000_000)
+
+        def failed(self, event) -> None:
+            self._record(event.duration_micros / 1_000_000)
+
+        @staticmethod
+        def _record(elapsed: float) -> None:
+            db_query_duration.observe(("mongo",), elapsed)
+            metrics = _current_metrics.get()
+            if metrics is not None:
+                metrics.mongo_count += 1
+                metrics.mongo_time += elapsed
+
+    return [MongoCommandMetrics()]
+
+# ----------------------------
+# Repository methods
+# ----------------------------
+
+def _record_count(result: Any) -> int:
+    """Records in a repository result: list / dict sizes, the page of a list_* result, 1 for an entity"""
+    if result is None:
+        return 0
+    if isinstance(result, dict):
+        data = result.get("data")
+        return len(data) if isinstance(data, list) else len(result)
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 1
+
+def _timed(repository: str, method: str, fn):
+    labels = (repository, method)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics._repository_depth += 1
+        start = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        finally:
+            repository_duration.observe(labels, time.perf_counter() - start)
+            if metrics is not None:
+                metrics._repository_depth -= 1
+        # Only the outermost repository call counts, so a cache in front of a repository is not counted twice
+        if metrics is not None and metrics._repository_depth == 0:
+            metrics.rows += _record_count(result)
+        return result
+    return wrapper
+
+def instrument_repository(cls):
+    """Class decorator: time every public async method; returns the class untouched when metrics are off"""
+    if not settings.METRICS_ENABLED:
+        return cls
+    for name, member in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(member):
+            setattr(cls, name, _timed(cls.__name__, name, member))
+    return cls
@@ -0,0 +1,35 @@
+# app/infrastructure/db/ledger_lock.py
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.db.db_errors import is_unique_violation
+from app.infrastructure.db.models.ledger_lock import LedgerLock as LedgerLockModel
+
+LEDGER = "ledger"
+
+async def lock_ledger(session: AsyncSession, exclusive: bool = False) -> None:
+    """
+    Lock the ledger row until the session's transaction ends: shared while posting vouchers (posts do not
+    block each other), exclusive while closing a period (it waits for the posts in flight, and they for it).
+    """
+    if exclusive:
+        # An UPDATE takes the exclusive row lock on every backend (SQLite: the database write lock)
+        stmt = update(LedgerLockModel).where(LedgerLockModel.name == LEDGER).values(name=LEDGER)
+        if (await session.execute(stmt)).rowcount:
+            return
+    else:
+        # SQL Server: HOLDLOCK keeps the shared lock to the end of the transaction; PostgreSQL: FOR SHARE
+        stmt = (
+            select(LedgerLockModel.name).where(LedgerLockModel.name == LEDGER)
+            .with_for_update(read=True).with_hint(LedgerLockModel, "WITH (HOLDLOCK, ROWLOCK)", "mssql")
+        )
+        if (await session.execute(stmt)).first() is not None:
+            return
+    # First lock ever: create the row; if another worker just did, lock theirs
+    try:
+        async with session.begin_nested():
+            session.add(LedgerLockModel(name=LEDGER))
+    except IntegrityError as exc:
+        if not is_unique_violation(exc):
+            raise
+        await session.execute(stmt)
@@ -0,0 +1,41 @@
+# app/infrastructure/db/migrate.py
+"""
+Schema and index setup, run once per deployment instead of on every worker boot:
+
+    python -m app.infrastructure.db.migrate
+"""
+import asyncio
+import logging
+from app.infrastructure.db.base import Base, dispose, get_collection, get_engine
+import app.infrastructure.db.models  # noqa: F401  registers the tables on Base.metadata
+
+logger = logging.getLogger(__name__)
+
+def _create_missing_indexes(connection) -> None:
+    # create_all only indexes tables it creates; tables from an earlier deployment get new indexes here
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+async def migrate() -> None:
+    """Create missing SQL tables and indexes (existing ones are left untouched)"""
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+    logger.info("Database tables and indexes created successfully.")
+
+async def migrate_mongo() -> None:
+    """Ensure the MongoDB indexes (a no-op when they already exist)"""
+    await get_collection("roles").create_index("name", unique=True, name="UX_roles_name")
+    logger.info("MongoDB indexes ensured.")
+
+async def main() -> None:
+    try:
+        await migrate()
+        await migrate_mongo()
+    finally:
+        await dispose()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
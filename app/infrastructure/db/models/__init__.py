@@ -1,2 +1,8 @@
 from .user import User
 from .role import Role
+from .voucher import Voucher
+from .voucher_line import VoucherLine
+from .voucher_sequence import VoucherSequence
+from .account_period_summary import AccountPeriodSummary
+from .closed_period import ClosedPeriod
+from .ledger_lock import LedgerLock
@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, Column, Integer, Numeric, String
+from app.infrastructure.db.base import Base
+
+class AccountPeriodSummary(Base):
+    """Debit / credit totals of one account over one closed period, written when the period is closed"""
+    __tablename__ = "AccountPeriodSummaries"
+    __table_args__ = ({"schema": "dbo"},)
+
+    period = Column("Period", Integer, primary_key=True)  # YYYYMM
+    account = Column("Account", String(50), primary_key=True)
+    debit = Column("Debit", Numeric(20, 2), nullable=False)
+    credit = Column("Credit", Numeric(20, 2), nullable=False)
+    lineCount = Column("LineCount", BigInteger, nullable=False)
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer
+from app.infrastructure.db.base import Base
+
+class ClosedPeriod(Base):
+    """One row per closed period; the latest is the watermark: nothing on or before it may be posted"""
+    __tablename__ = "ClosedPeriods"
+    __table_args__ = ({"schema": "dbo"},)
+
+    period = Column("Period", Integer, primary_key=True)  # YYYYMM
+    closeDate = Column("CloseDate", DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String
+from app.infrastructure.db.base import Base
+
+class LedgerLock(Base):
+    """
+    Lock row of the ledger: posting vouchers holds it shared and closing a period exclusive, so a close
+    never commits while a posting transaction is still writing into the periods it summarizes
+    """
+    __tablename__ = "LedgerLocks"
+    __table_args__ = ({"schema": "dbo"},)
+
+    name = Column("Name", String(50), primary_key=True)
@@ -1,10 +1,13 @@
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, Index, Integer, String
 
 from app.infrastructure.db.base import Base
 
 class Role(Base):
     __tablename__ = "Roles"
-    __table_args__ = {"schema": "dbo"}
+    __table_args__ = (
+        Index("UX_Roles_Name", "name", unique=True),
+        {"schema": "dbo"},
+    )
 
     id = Column(String(50), primary_key=True)
     name = Column(String(50), nullable=False)
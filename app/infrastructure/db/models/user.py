@@ -1,11 +1,21 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Boolean, DateTime, text
 from sqlalchemy.orm import relationship
 from app.infrastructure.db.base import Base
 from datetime import datetime, timezone
 
 class User(Base):
     __tablename__ = "Users"
-    __table_args__ = {"schema": "dbo"}
+    __table_args__ = (
+        # Uniqueness is enforced by the database, so creates insert directly instead of checking first.
+        # UserName's index also backs (UserName, id) keyset paging: SQL Server nonclustered indexes carry the clustered key.
+        Index("UX_Users_UserName", "UserName", unique=True),
+        # Filtered on SQL Server, where a unique index admits one NULL only; SQLite and PostgreSQL already let any
+        # number of users have no email. Only mssql_ options here: each dialect named is imported with the model.
+        Index("UX_Users_Email", "Email", unique=True, mssql_where=text("Email IS NOT NULL")),
+        # (sort column, id) index backs keyset pagination on the list endpoint
+        Index("IX_Users_CreateDate_Id", "CreateDate", "id"),
+        {"schema": "dbo"},
+    )
 
     id = Column(String(50), primary_key=True)
     username = Column("UserName", String(50), nullable=False)
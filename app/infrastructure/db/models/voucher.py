@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, String
+from app.infrastructure.db.base import Base
+
+class Voucher(Base):
+    __tablename__ = "Vouchers"
+    __table_args__ = (
+        Index("UX_Vouchers_Number", "Number", unique=True),
+        Index("IX_Vouchers_VoucherDate", "VoucherDate"),
+        {"schema": "dbo"},
+    )
+
+    id = Column(String(50), primary_key=True)
+    number = Column("Number", BigInteger, nullable=False)
+    voucherDate = Column("VoucherDate", Date, nullable=False)
+    description = Column("Description", String(200), nullable=True)
+    createDate = Column("CreateDate", DateTime(timezone=True), nullable=False)
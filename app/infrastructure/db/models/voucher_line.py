@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, Numeric, String
+from app.infrastructure.db.base import Base
+
+class VoucherLine(Base):
+    __tablename__ = "VoucherLines"
+    __table_args__ = (
+        # Reports scan lines by date range, and account ledgers by (account, date range)
+        Index("IX_VoucherLines_VoucherDate", "VoucherDate"),
+        Index("IX_VoucherLines_Account_VoucherDate", "Account", "VoucherDate"),
+        {"schema": "dbo"},
+    )
+
+    # (voucher, line number) key: rows are fully built client-side, so a batch inserts without generated ids
+    voucherId = Column("VoucherId", String(50), ForeignKey("dbo.Vouchers.id"), primary_key=True)
+    lineNo = Column("LineNo", Integer, primary_key=True)
+    # Copied from the voucher, so reports read one table instead of joining every line to its voucher
+    voucherDate = Column("VoucherDate", Date, nullable=False)
+    account = Column("Account", String(50), nullable=False)
+    debit = Column("Debit", Numeric(18, 2), nullable=False)
+    credit = Column("Credit", Numeric(18, 2), nullable=False)
+    description = Column("Description", String(200), nullable=True)
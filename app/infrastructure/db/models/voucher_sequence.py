@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, String
+from app.infrastructure.db.base import Base
+
+class VoucherSequence(Base):
+    """Next unreserved voucher number; workers reserve whole blocks of numbers at a time"""
+    __tablename__ = "VoucherSequences"
+    __table_args__ = ({"schema": "dbo"},)
+
+    name = Column("Name", String(50), primary_key=True)
+    nextNumber = Column("NextNumber", BigInteger, nullable=False)
@@ -0,0 +1,87 @@
+# app/infrastructure/db/unit_of_work.py
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.db.base import async_session
+
+logger = logging.getLogger(__name__)
+
+# Unit of work of the current request (None outside a request)
+_current_uow: ContextVar[Optional["UnitOfWork"]] = ContextVar("current_uow", default=None)
+
+class UnitOfWork:
+    """
+    One session / transaction shared by every repository call made while it is active.
+    The session (and its connection) is only opened on first use, so requests that never
+    touch SQL never check out a connection.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or async_session
+        self._session: Optional[AsyncSession] = None
+        self._token = None
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the transaction has committed; dropped if it rolls back"""
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                # The data is committed; a failed follow-up must not turn the request into an error
+                logger.warning("After-commit callback failed", exc_info=True)
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._token = _current_uow.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            _current_uow.reset(self._token)
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current_uow.get()
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Session for a repository call. Inside a unit of work the shared session is used and only
+    flushed (so constraint errors surface at the call site); the unit of work commits once.
+    Outside one (startup, background jobs) a short-lived session is opened and committed.
+    """
+    uow = _current_uow.get()
+    if uow is not None:
+        session = uow.session
+        yield session
+        await session.flush()
+        return
+    async with async_session() as session:
+        yield session
+        await session.commit()
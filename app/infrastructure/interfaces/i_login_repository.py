@@ -9,3 +9,8 @@ class ILoginRepository(ABC):
     @abstractmethod
     async def get_user_by_username(self, username: str) -> Optional[User]:
         pass
+
+    @abstractmethod
+    async def update_password_hash(self, user_id: str, hashed_password: str) -> None:
+        """Replace a user's stored hash (rehash on login after the bcrypt cost changed)"""
+        pass
@@ -0,0 +1,23 @@
+#i_message_broker.py
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+MessageHandler = Callable[[str], Awaitable[None]]
+
+class IMessageBroker(ABC):
+    """Interface for publish/subscribe messaging between workers"""
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish a message to every subscriber of the channel, in every worker."""
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """Call handler for each message published to the channel."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop listening and release connections."""
+        pass
@@ -0,0 +1,38 @@
+# app/infrastructure/interfaces/i_report_repository.py
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+
+class IReportRepository(ABC):
+    """Interface for ledger reporting data access: line streams, period summaries and the closed-period watermark"""
+
+    @abstractmethod
+    def stream_line_amounts(
+        self, start: Optional[date], end: date, account: Optional[str], chunk_size: int
+    ) -> AsyncIterator[Tuple[tuple, tuple, tuple, tuple]]:
+        """Voucher lines dated start..end (start None: from the first) as column tuples (period, account, debit cents, credit cents)."""
+        pass
+
+    @abstractmethod
+    def stream_account_lines(
+        self, account: str, start: Optional[date], end: date, chunk_size: int
+    ) -> AsyncIterator[Tuple[tuple, tuple, tuple, tuple, tuple, tuple]]:
+        """One account's lines in posting order as column tuples (voucherDate, number, voucherId, description, debit cents, credit cents)."""
+        pass
+
+    @abstractmethod
+    async def get_period_summaries(self, first: Optional[int], last: int, account: Optional[str] = None) -> List[tuple]:
+        """Stored summaries of periods first..last as (period, account, debit cents, credit cents, line count) rows."""
+        pass
+
+    @abstractmethod
+    async def get_closed_period(self, cached: bool = True) -> Optional[int]:
+        """The latest closed period (YYYYMM), or None; cached for a few seconds unless cached=False."""
+        pass
+
+    @abstractmethod
+    async def close_period(self, period: int, summaries: List[tuple], since: Optional[int]) -> None:
+        """Store (period, account, debit, credit, line count) summaries of the periods after `since` (the watermark
+        they were built on) and mark period closed, in one transaction; raises ClosedPeriodException when a period
+        was closed concurrently or vouchers were posted into them after the summaries were built."""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from app.domain.entities.role import Role
 
 class IRoleRepository(ABC):
@@ -7,7 +7,12 @@ class IRoleRepository(ABC):
 
     @abstractmethod
     async def add_role(self, role_entity: Role) -> Role:
-        """Add a new role to the database and return the domain entity."""
+        """Add a new role to the database and return the domain entity; raises AlreadyExistsException when the name is taken."""
+        pass
+
+    @abstractmethod
+    async def add_roles(self, roles: List[Role]) -> List[Optional[Role]]:
+        """Insert a batch of roles; rows rejected as duplicates come back as None."""
         pass
 
     @abstractmethod
@@ -15,6 +20,11 @@ class IRoleRepository(ABC):
         """Fetch a role by ID."""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, role_ids: List[str]) -> Dict[str, Role]:
+        """Fetch several roles at once, keyed by ID (unknown IDs are left out)."""
+        pass
+
     @abstractmethod
     async def list_all_roles(self) -> List[Role]:
         """Fetch all roles."""
@@ -26,6 +36,17 @@ class IRoleRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_roles( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True) -> Dict[str, any]:
-        """Fetch all roles."""
+    async def get_by_names(self, names: List[str]) -> Dict[str, Role]:
+        """Get roles by name, keyed by name (set-based duplicate checking)."""
+        pass
+
+    @abstractmethod
+    def stream_roles(self, batch_size: int = 1000) -> AsyncIterator[List[Role]]:
+        """Stream all roles in batches (async generator) without loading them all."""
+        pass
+
+    @abstractmethod
+    async def list_roles( self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True, cursor: Optional[str] = None, include_total: str = "true") -> Dict[str, any]:
+        """Fetch a page of roles; with a cursor, seek past it instead of using page (keyset mode).
+        include_total is "true" (exact), "estimated" or "false" (total is None)."""
         pass
@@ -1,13 +1,25 @@
 #i_user_prepository
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from app.domain.entities.user import User
+from app.domain.entities.user_batch import UserBatch
 
 class IUserRepository(ABC):
     """Interface for user data access"""
 
     @abstractmethod
     async def add_user(self, user_data: User) -> User:
+        """Insert a user; raises AlreadyExistsException when the username or email is taken."""
+        pass
+
+    @abstractmethod
+    async def add_users(self, users: List[User]) -> List[Optional[User]]:
+        """Insert a batch of users; rows rejected by a constraint (e.g. duplicates) come back as None."""
+        pass
+
+    @abstractmethod
+    async def get_by_usernames_or_emails(self, usernames: List[str], emails: List[str]) -> List[User]:
+        """Get users matching any of the usernames or emails (set-based duplicate checking)."""
         pass
 
     @abstractmethod
@@ -20,7 +32,13 @@ class IUserRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_users( self, page: int = 1, page_size: int = 10, sort_field: str = "username", ascending: bool = True) -> Dict[str, any]:
-        """Fetch all users."""
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[UserBatch]:
+        """Stream all users in columnar batches (async generator) without loading them all."""
+        pass
+
+    @abstractmethod
+    async def list_users( self, page: int = 1, page_size: int = 10, sort_field: str = "username", ascending: bool = True, cursor: Optional[str] = None, include_total: str = "true") -> Dict[str, any]:
+        """Fetch a page of users; with a cursor, seek past it instead of using page (keyset mode).
+        include_total is "true" (exact), "estimated" or "false" (total is None)."""
         pass
 
@@ -0,0 +1,22 @@
+# app/infrastructure/interfaces/i_voucher_repository.py
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.entities.voucher import Voucher
+
+class IVoucherRepository(ABC):
+    """Interface for voucher data access"""
+
+    @abstractmethod
+    async def add_vouchers(self, vouchers: List[Voucher]) -> None:
+        """Insert numbered vouchers and their lines in one transaction (one bulk insert per table);
+        raises ClosedPeriodException, writing none of them, when one is dated in a closed period."""
+        pass
+
+    @abstractmethod
+    async def allocate_numbers(self, count: int) -> int:
+        """Reserve `count` consecutive voucher numbers; returns the first."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, voucher_id: str) -> Optional[Voucher]:
+        pass
@@ -0,0 +1,39 @@
+# app/infrastructure/jobs/async_runner.py
+import asyncio
+import contextvars
+import threading
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+# Loop of the coroutine that called to_thread(); seen by the thread through its copied context
+_caller_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar("caller_loop", default=None)
+
+def run_async(awaitable: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous task code. Each thread keeps one event loop for
+    its lifetime (unlike asyncio.run), so pooled async DB connections, which belong to the loop that
+    opened them, are reused by the next task instead of being orphaned.
+
+    Called under to_thread() (eager tasks, run while the app enqueues them) the coroutine is handed
+    back to the app's loop instead: the engine and broker clients there are the process-wide ones,
+    and their connections must not be used from a second loop.
+    """
+    caller = _caller_loop.get()
+    if caller is not None:
+        # Fresh context: the task must not inherit the submitting request's unit of work or metrics
+        return contextvars.Context().run(asyncio.run_coroutine_threadsafe, awaitable, caller).result()
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _local.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(awaitable)
+
+async def to_thread(func: Callable[..., T], *args) -> T:
+    """asyncio.to_thread for blocking Celery calls; tasks they run eagerly run their coroutines on this loop"""
+    token = _caller_loop.set(asyncio.get_running_loop())
+    try:
+        return await asyncio.to_thread(func, *args)
+    finally:
+        _caller_loop.reset(token)
@@ -0,0 +1,23 @@
+# app/infrastructure/jobs/celery_app.py
+from celery import Celery
+from app.config import settings
+
+# Workers: celery -A app.infrastructure.jobs.celery_app worker --loglevel=info
+celery_app = Celery(
+    "app",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.infrastructure.jobs.user_import_tasks"],
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,
+    result_expires=settings.JOB_RESULT_TTL_SECONDS,
+    # Chunks are long: a worker reserves only the task it is about to run, so idle workers get the rest
+    worker_prefetch_multiplier=1,
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    # Eager results go to the result backend too, so job status reads the same way in both modes
+    task_store_eager_result=True,
+)
@@ -0,0 +1,31 @@
+# app/infrastructure/jobs/user_import_tasks.py
+from typing import AsyncIterator, List
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.domain.dtos.bulk.BulkRowResult import BulkRowResult
+from app.domain.dtos.user.UserImportRow import UserImportRow
+from app.infrastructure.jobs.async_runner import run_async
+from app.infrastructure.jobs.celery_app import celery_app
+from app.utilities.bulk_utils import BulkRow
+
+async def _rows(rows: List[list]) -> AsyncIterator[BulkRow]:
+    for index, fields in rows:
+        yield index, UserImportRow.model_validate(fields), None
+
+@celery_app.task(name="jobs.user_import.chunk")
+def import_user_chunk(rows: List[list]) -> dict:
+    """
+    Create one chunk of an import: [[row index, UserImportRow fields], ...] -> BulkImportResponse dict.
+    Rows carry password hashes (never plain passwords), so the broker must be as private as the database.
+    """
+    # Imported here: the container builds the services (and this module is imported while it does)
+    from app.application.services.user_service import UserService
+    from app.core.di_container import container
+    report = run_async(container.resolve(UserService).bulk_create_users(_rows(rows), max(len(rows), 1)))
+    return report.model_dump(mode="json")
+
+@celery_app.task(name="jobs.user_import.finish")
+def finish_user_import(chunk_reports: List[dict], rejected: List[dict]) -> dict:
+    """Chord callback: merge the chunk reports and the rows rejected at submission into one report"""
+    results = [BulkRowResult.model_validate(row) for report in chunk_reports for row in report["results"]]
+    results.extend(BulkRowResult.model_validate(row) for row in rejected)
+    return BulkImportResponse.from_results(results).model_dump(mode="json")
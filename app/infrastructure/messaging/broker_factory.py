@@ -0,0 +1,14 @@
+# app/infrastructure/messaging/broker_factory.py
+from app.config import settings
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from app.infrastructure.messaging.redis_broker import RedisMessageBroker
+
+def create_message_broker(backend: str = None) -> IMessageBroker:
+    """Build the broker selected by MESSAGE_BROKER_BACKEND ("redis" or "memory")"""
+    backend = backend or settings.MESSAGE_BROKER_BACKEND
+    if backend == "redis":
+        return RedisMessageBroker(settings.REDIS_HOST, settings.REDIS_PORT, settings.REDIS_PASSWORD)
+    if backend == "memory":
+        return InMemoryMessageBroker()
+    raise ValueError(f"Unknown message broker backend: {backend}")
@@ -0,0 +1,25 @@
+# app/infrastructure/messaging/in_memory_broker.py
+import logging
+from typing import Dict, List
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker, MessageHandler
+
+logger = logging.getLogger(__name__)
+
+class InMemoryMessageBroker(IMessageBroker):
+    """Single-process broker: delivers messages to local subscribers only (single worker runs and tests)"""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+
+    async def publish(self, channel: str, message: str) -> None:
+        for handler in list(self._handlers.get(channel, [])):
+            try:
+                await handler(message)
+            except Exception:
+                logger.exception("Message handler failed on channel %s", channel)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    async def close(self) -> None:
+        self._handlers.clear()
@@ -0,0 +1,71 @@
+# app/infrastructure/messaging/redis_broker.py
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker, MessageHandler
+
+logger = logging.getLogger(__name__)
+
+class RedisMessageBroker(IMessageBroker):
+    """Redis pub/sub broker: one connection and one listener task per worker, shared by all channels"""
+
+    def __init__(self, host: str, port: int, password: str = "", reconnect_delay: float = 1.0):
+        self.host = host
+        self.port = port
+        self.password = password or None
+        self.reconnect_delay = reconnect_delay
+        self._redis = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+
+    def _client(self):
+        # Connect lazily so workers that never publish or subscribe never open a connection
+        if self._redis is None:
+            from redis.asyncio import Redis
+            self._redis = Redis(host=self.host, port=self.port, password=self.password, decode_responses=True)
+        return self._redis
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._client().publish(channel, message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+        if self._pubsub is None:
+            self._pubsub = self._client().pubsub()
+        await self._pubsub.subscribe(channel)
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    for handler in list(self._handlers.get(message["channel"], [])):
+                        try:
+                            await handler(message["data"])
+                        except Exception:
+                            logger.exception("Message handler failed on channel %s", message["channel"])
+            except asyncio.CancelledError:
+                raise
+            except RedisConnectionError:
+                logger.warning("Redis pub/sub connection lost, resubscribing in %ss", self.reconnect_delay)
+                await asyncio.sleep(self.reconnect_delay)
+                try:
+                    await self._pubsub.subscribe(*self._handlers.keys())
+                except RedisConnectionError:
+                    pass
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -0,0 +1,144 @@
+# app/infrastructure/repositories/cached_role_repository.py
+import asyncio
+import json
+import logging
+import uuid
+from typing import AsyncIterator, Dict, List, Optional
+from app.domain.entities.role import Role
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.infrastructure.cache.role_cache import RoleCache
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+from app.infrastructure.repositories.role_repository import RoleRepository
+from app.infrastructure.db.instrumentation import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache-invalidation"
+
+@instrument_repository
+class CachedRoleRepository(IRoleRepository):
+    """Read-through role cache in front of RoleRepository, invalidated across workers via the message broker"""
+
+    def __init__(self, role_repository: RoleRepository, cache: RoleCache, broker: IMessageBroker,
+                 versions: CollectionVersions = None):
+        self.inner = role_repository
+        self.cache = cache
+        self.broker = broker
+        self.versions = versions
+        self._reload_lock = asyncio.Lock()
+        # Whether the full role set fit in the cache last time; only then is a full reload worthwhile
+        self._fits = True
+        # Identifies this instance (one per worker) so it can skip its own invalidation messages
+        self.origin = uuid.uuid4().hex
+
+    async def start(self, preload: bool = True) -> None:
+        """Subscribe to invalidations from other workers and (optionally) preload the role set now"""
+        await self.broker.subscribe(INVALIDATION_CHANNEL, self._on_invalidation)
+        if preload:
+            await self.preload()
+
+    async def preload(self) -> None:
+        async with self._reload_lock:
+            if self.cache.is_complete:
+                return
+            generation = self.cache.generation
+            roles = await self.inner.list_all_roles()
+            self._fits = len(roles) <= self.cache.max_size
+            self.cache.load_all(roles, generation)
+
+    async def _ensure_loaded(self) -> None:
+        if self._fits and not self.cache.is_complete:
+            await self.preload()
+
+    async def _on_invalidation(self, message: str) -> None:
+        payload = json.loads(message)
+        if payload.get("cache") == "roles" and payload.get("origin") != self.origin:
+            self.cache.invalidate()
+
+    async def invalidate(self) -> None:
+        self.cache.invalidate()
+        try:
+            await self.broker.publish(INVALIDATION_CHANNEL, json.dumps({"cache": "roles", "origin": self.origin}))
+        except Exception:
+            # Other workers fall back to the TTL
+            logger.warning("Could not publish role cache invalidation", exc_info=True)
+
+    async def _changed(self) -> None:
+        await self.invalidate()
+        # Mongo writes are durable once acknowledged: the ETags of role reads change right away
+        if self.versions is not None:
+            await self.versions.bump("roles")
+
+    async def add_role(self, role_entity: Role) -> Role:
+        saved = await self.inner.add_role(role_entity)
+        await self._changed()
+        return saved
+
+    async def add_roles(self, roles: List[Role]) -> List[Optional[Role]]:
+        saved = await self.inner.add_roles(roles)
+        await self._changed()
+        return saved
+
+    async def get_by_id(self, role_id: str) -> Optional[Role]:
+        await self._ensure_loaded()
+        role = self.cache.get_by_id(role_id)
+        if role is not None or self.cache.is_complete:
+            return role
+        generation = self.cache.generation
+        role = await self.inner.get_by_id(role_id)
+        if role is not None:
+            self.cache.put(role, generation)
+        return role
+
+    async def get_by_ids(self, role_ids: List[str]) -> Dict[str, Role]:
+        await self._ensure_loaded()
+        found: Dict[str, Role] = {}
+        missing: List[str] = []
+        for role_id in set(role_ids):
+            role = self.cache.get_by_id(role_id)
+            if role is not None:
+                found[role_id] = role
+            else:
+                missing.append(role_id)
+        if missing and not self.cache.is_complete:
+            generation = self.cache.generation
+            fetched = await self.inner.get_by_ids(missing)
+            for role in fetched.values():
+                self.cache.put(role, generation)
+            found.update(fetched)
+        return found
+
+    async def get_by_name(self, name: str) -> Optional[Role]:
+        await self._ensure_loaded()
+        role = self.cache.get_by_name(name)
+        if role is not None or self.cache.is_complete:
+            return role
+        generation = self.cache.generation
+        role = await self.inner.get_by_name(name)
+        if role is not None:
+            self.cache.put(role, generation)
+        return role
+
+    async def get_by_names(self, names: List[str]) -> Dict[str, Role]:
+        await self._ensure_loaded()
+        if self.cache.is_complete:
+            return {name: role for name in set(names) if (role := self.cache.get_by_name(name)) is not None}
+        return await self.inner.get_by_names(names)
+
+    async def list_all_roles(self) -> List[Role]:
+        await self._ensure_loaded()
+        if self.cache.is_complete:
+            return self.cache.snapshot()
+        return await self.inner.list_all_roles()
+
+    def stream_roles(self, batch_size: int = 1000) -> AsyncIterator[List[Role]]:
+        # Exports always read the database directly
+        return self.inner.stream_roles(batch_size)
+
+    async def list_roles(
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True,
+        cursor: Optional[str] = None, include_total: str = "true"
+    ) -> Dict[str, any]:
+        # Paged listings are passed through; sorting/paging belongs to the database
+        return await self.inner.list_roles(page, page_size, sort_field, ascending, cursor, include_total)
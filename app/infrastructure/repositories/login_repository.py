@@ -1,18 +1,25 @@
 #login_repository.py
-from sqlalchemy import select
-from app.infrastructure.db.base import async_session
+from sqlalchemy import select, update
+from app.infrastructure.db.unit_of_work import session_scope
 from app.infrastructure.db.models.user import User as UserModel
 from app.infrastructure.interfaces.i_login_repository import ILoginRepository
+from app.infrastructure.db.instrumentation import instrument_repository
 from app.domain.entities.user import User
 
+@instrument_repository
 class LoginRepository(ILoginRepository):
     """Concrete repository for login"""
 
     async def get_user_by_username(self, username: str) -> User | None:
-        async with async_session() as session:
+        async with session_scope() as session:
             result = await session.execute(select(UserModel).where(UserModel.username == username))
             db_user = result.scalars().first()
             if not db_user:
                 return None
             return User(id=db_user.id, username=db_user.username, hashed_password=db_user.hashed_password, email=db_user.email)
 
+    async def update_password_hash(self, user_id: str, hashed_password: str) -> None:
+        async with session_scope() as session:
+            await session.execute(
+                update(UserModel).where(UserModel.id == user_id).values(hashed_password=hashed_password)
+            )
@@ -0,0 +1,124 @@
+# app/infrastructure/repositories/report_repository.py
+import time
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import BigInteger, cast, extract, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from app.config import settings
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
+from app.infrastructure.db.base import async_session
+from app.infrastructure.db.db_errors import is_unique_violation
+from app.infrastructure.db.instrumentation import instrument_repository
+from app.infrastructure.db.ledger_lock import lock_ledger
+from app.infrastructure.db.models.account_period_summary import AccountPeriodSummary as SummaryModel
+from app.infrastructure.db.models.closed_period import ClosedPeriod as ClosedPeriodModel
+from app.infrastructure.db.models.voucher import Voucher as VoucherModel
+from app.infrastructure.db.models.voucher_line import VoucherLine as VoucherLineModel
+from app.infrastructure.db.unit_of_work import session_scope
+from app.infrastructure.interfaces.i_report_repository import IReportRepository
+from app.utilities.period_utils import format_period, next_period, period_end, period_start
+
+# Cached watermark: (period, expires_at)
+_closed_period: Tuple[Optional[int], float] = (None, 0.0)
+
+def _cents(column):
+    # Integer cents: the database does the Decimal -> int64 conversion, and sums stay exact
+    return cast(func.round(column * 100, 0), BigInteger)
+
+def _line_filter(stmt, start: Optional[date], end: date, account: Optional[str]):
+    stmt = stmt.where(VoucherLineModel.voucherDate <= end)
+    if start is not None:
+        stmt = stmt.where(VoucherLineModel.voucherDate >= start)
+    if account is not None:
+        stmt = stmt.where(VoucherLineModel.account == account)
+    return stmt
+
+@instrument_repository
+class ReportRepository(IReportRepository):
+    """Concrete repository for ledger reports"""
+
+    async def stream_line_amounts(
+        self, start: Optional[date], end: date, account: Optional[str], chunk_size: int
+    ) -> AsyncIterator[Tuple[tuple, tuple, tuple, tuple]]:
+        period = extract("year", VoucherLineModel.voucherDate) * 100 + extract("month", VoucherLineModel.voucherDate)
+        stmt = _line_filter(
+            select(period, VoucherLineModel.account, _cents(VoucherLineModel.debit), _cents(VoucherLineModel.credit)),
+            start, end, account,
+        ).execution_options(yield_per=chunk_size)
+        # Own session, like the user export: ledgers are still streaming after the request's unit of work closed.
+        # Streamed on its connection (Core rows): these are plain columns, so ORM row loading is pure overhead.
+        async with async_session() as session:
+            connection = await session.connection()
+            result = await connection.stream(stmt)
+            async for rows in result.partitions(chunk_size):
+                yield tuple(zip(*rows))
+
+    async def stream_account_lines(
+        self, account: str, start: Optional[date], end: date, chunk_size: int
+    ) -> AsyncIterator[Tuple[tuple, tuple, tuple, tuple, tuple, tuple]]:
+        stmt = _line_filter(
+            select(VoucherLineModel.voucherDate, VoucherModel.number, VoucherLineModel.voucherId,
+                   func.coalesce(VoucherLineModel.description, VoucherModel.description),
+                   _cents(VoucherLineModel.debit), _cents(VoucherLineModel.credit))
+            .join(VoucherModel, VoucherModel.id == VoucherLineModel.voucherId),
+            start, end, account,
+        ).order_by(VoucherLineModel.voucherDate, VoucherModel.number, VoucherLineModel.lineNo).execution_options(yield_per=chunk_size)
+        async with async_session() as session:
+            connection = await session.connection()
+            result = await connection.stream(stmt)
+            async for rows in result.partitions(chunk_size):
+                yield tuple(zip(*rows))
+
+    async def get_period_summaries(self, first: Optional[int], last: int, account: Optional[str] = None) -> List[tuple]:
+        stmt = select(SummaryModel.period, SummaryModel.account, _cents(SummaryModel.debit), _cents(SummaryModel.credit),
+                      SummaryModel.lineCount).where(SummaryModel.period <= last)
+        if first is not None:
+            stmt = stmt.where(SummaryModel.period >= first)
+        if account is not None:
+            stmt = stmt.where(SummaryModel.account == account)
+        async with session_scope() as session:
+            return [tuple(row) for row in (await session.execute(stmt)).all()]
+
+    async def get_closed_period(self, cached: bool = True) -> Optional[int]:
+        global _closed_period
+        period, expires_at = _closed_period
+        if not cached or time.monotonic() >= expires_at:
+            # A cache refresh uses its own short session: joining the caller's unit of work would pin a
+            # connection for the rest of the request (a voucher post holds it while its batch waits)
+            scope = session_scope() if not cached else async_session()
+            async with scope as session:
+                period = (await session.execute(select(func.max(ClosedPeriodModel.period)))).scalar_one_or_none()
+            _closed_period = (period, time.monotonic() + settings.REPORT_CLOSED_PERIOD_CACHE_SECONDS)
+        return period
+
+    async def close_period(self, period: int, summaries: List[tuple], since: Optional[int]) -> None:
+        global _closed_period
+        rows = [
+            {"period": p, "account": account, "debit": debit, "credit": credit, "lineCount": lines}
+            for p, account, debit, credit, lines in summaries
+        ]
+        async with session_scope() as session:
+            # Exclusive: posts in flight commit first, later ones wait for this close and then see its watermark
+            await lock_ledger(session, exclusive=True)
+            closed = (await session.execute(select(func.max(ClosedPeriodModel.period)))).scalar_one_or_none()
+            if closed != since:
+                raise ClosedPeriodException(f"Period {format_period(period)} was closed concurrently")
+            # The summaries were scanned before the lock. Lines are never deleted, so the same count means
+            # no voucher was posted into these periods in between (one index range count, not a rescan).
+            start = period_start(next_period(since)) if since is not None else None
+            count = _line_filter(select(func.count()).select_from(VoucherLineModel), start, period_end(period), None)
+            if (await session.execute(count)).scalar_one() != sum(row["lineCount"] for row in rows):
+                raise ClosedPeriodException(
+                    f"Vouchers were posted up to {format_period(period)} while it was being closed; close it again")
+            try:
+                async with session.begin_nested():
+                    # Two closes racing from the same watermark collide on a summary or period key
+                    session.add(ClosedPeriodModel(period=period))
+                    await session.flush()
+                    if rows:
+                        await session.execute(insert(SummaryModel), rows)
+            except IntegrityError as exc:
+                if is_unique_violation(exc):
+                    raise ClosedPeriodException(f"Period {format_period(period)} was closed concurrently") from exc
+                raise
+        _closed_period = (period, time.monotonic() + settings.REPORT_CLOSED_PERIOD_CACHE_SECONDS)
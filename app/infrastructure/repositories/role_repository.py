@@ -1,32 +1,53 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from sqlalchemy import select
-from app.infrastructure.db.base import async_session, get_collection
+from app.infrastructure.db.base import get_collection
+from app.infrastructure.db.unit_of_work import session_scope
 from app.infrastructure.db.models.role import Role as RoleModel
 from app.infrastructure.interfaces.i_role_repository import IRoleRepository
 from app.domain.entities.role import Role
 
-#For Mongo Only
-from bson import ObjectId
+#For Mongo Only: bson / pymongo are imported inside the methods, so they load with the first role query
+from sqlalchemy.exc import IntegrityError
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.db.db_errors import is_unique_violation
+from app.infrastructure.db.instrumentation import instrument_repository
+from app.domain.exceptions.invalid_cursor_exceptions import InvalidCursorException
+from app.utilities.pagination_utils import TOTAL_ESTIMATED, TOTAL_EXACT, decode_cursor, encode_cursor
 
+# Required fields that can back a keyset cursor
+KEYSET_SORT_FIELDS = {"id", "name", "isActive"}
+
+@instrument_repository
 class RoleRepository(IRoleRepository):
     """Concrete repository for role management"""
     def __init__(self):
-        self.collection = get_collection("roles")#For MongoDB Only
+        self._collection = None
+
+    @property
+    def collection(self):
+        # Resolved on first use so the Mongo client is only created when roles are actually read
+        if self._collection is None:
+            self._collection = get_collection("roles")#For MongoDB Only
+        return self._collection
     """For MSSQL"""   
     async def add_role(self, role_entity: Role) -> Role:
-        async with async_session() as session:
+        async with session_scope() as session:
             # Domain Entity → DB Model
-            db_role = RoleModel(**role_entity.__dict__)
-            db_role.id=None # Ensure SQLAlchemy does not try to insert an ID for auto increment
-            session.add(db_role)
-            await session.commit()
-            await session.refresh(db_role)
+            # id is left unset so the identity column generates it
+            db_role = RoleModel(name=role_entity.name, isActive=role_entity.isActive)
+            try:
+                async with session.begin_nested():
+                    session.add(db_role)  # flushed on exit, which populates the identity value without a refresh
+            except IntegrityError as exc:
+                if is_unique_violation(exc):
+                    raise AlreadyExistsException(f"Role Name already taken: {role_entity.name}") from exc
+                raise
 
             # DB Model → Domain Entity
             return Role(id=db_role.id, name=db_role.name, isActive=db_role.isActive)
 
     async def get_by_id(self, role_id: int) -> Optional[Role]:
-        async with async_session() as session:
+        async with session_scope() as session:
             result = await session.execute(select(RoleModel).where(RoleModel.id == role_id))
             db_role = result.scalars().first()
             if not db_role:
@@ -34,13 +55,13 @@ class RoleRepository(IRoleRepository):
             return Role(id=db_role.id, name=db_role.name, isActive=db_role.isActive)
 
     async def list_all_roles(self) -> List[Role]:
-        async with async_session() as session:
+        async with session_scope() as session:
             result = await session.execute(select(RoleModel))
             db_roles = result.scalars().all()
             return [Role(id=r.id, name=r.name, isActive=r.isActive) for r in db_roles]
 
     async def get_by_name(self, name: str) -> Optional[Role]:
-        async with async_session() as session:
+        async with session_scope() as session:
             result = await session.execute(select(RoleModel).where(RoleModel.name == name))
             db_role = result.scalars().first()
             if not db_role:
@@ -52,21 +73,63 @@ class RoleRepository(IRoleRepository):
         """
         Domain Entity → MongoDB document
         """
-        print("RoleRepositoryIn");
         doc = {
             "name": role_entity.name,
             "isActive": role_entity.isActive
         }
-        result = await self.collection.insert_one(doc)
-        print("Add Result:",result)
+        from pymongo.errors import DuplicateKeyError
+        try:
+            # The unique index on name rejects duplicates (see db/migrate.py); no pre-check needed
+            await self.collection.insert_one(doc)
+        except DuplicateKeyError as exc:
+            raise AlreadyExistsException(f"Role Name already taken: {role_entity.name}") from exc
         return Role(id=str(doc["_id"]), name=role_entity.name, isActive=role_entity.isActive)
 
+    async def add_roles(self, roles: List[Role]) -> List[Optional[Role]]:
+        """
+        Insert a batch with one unordered insert_many; rows rejected by the server
+        (e.g. duplicate key) come back as None while the rest are still inserted.
+        """
+        docs = [{"name": r.name, "isActive": r.isActive} for r in roles]
+        if not docs:
+            return []
+        from pymongo.errors import BulkWriteError
+        failed = set()
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                if error.get("code") != 11000:  # only duplicate keys are reported per row
+                    raise
+                failed.add(error["index"])
+        return [
+            None if i in failed else Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"])
+            for i, doc in enumerate(docs)
+        ]
+
+    async def get_by_names(self, names: List[str]) -> Dict[str, Role]:
+        roles = {}
+        async for doc in self.collection.find({"name": {"$in": list(set(names))}}):
+            roles[doc["name"]] = Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"])
+        return roles
+
     async def get_by_id(self, role_id: str) -> Optional[Role]:
+        from bson import ObjectId
         doc = await self.collection.find_one({"_id": ObjectId(role_id)})
         if not doc:
             return None
         return Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"])
 
+    async def get_by_ids(self, role_ids: List[str]) -> Dict[str, Role]:
+        from bson import ObjectId
+        object_ids = [ObjectId(role_id) for role_id in set(role_ids) if ObjectId.is_valid(role_id)]
+        if not object_ids:
+            return {}
+        roles = {}
+        async for doc in self.collection.find({"_id": {"$in": object_ids}}):
+            roles[str(doc["_id"])] = Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"])
+        return roles
+
     async def list_all_roles(self) -> List[Role]:
         cursor = self.collection.find()
         roles = []
@@ -74,6 +137,17 @@ class RoleRepository(IRoleRepository):
             roles.append(Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"]))
         return roles
 
+    async def stream_roles(self, batch_size: int = 1000) -> AsyncIterator[List[Role]]:
+        """Stream every role in _id order, batch_size documents per cursor round trip"""
+        batch: List[Role] = []
+        async for doc in self.collection.find().sort("_id", 1).batch_size(batch_size):
+            batch.append(Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"]))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     async def get_by_name(self, name: str) -> Optional[Role]:
         doc = await self.collection.find_one({"name": name})
         if not doc:
@@ -81,25 +155,72 @@ class RoleRepository(IRoleRepository):
         return Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"])
     
     async def list_roles(
-        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True,
+        cursor: Optional[str] = None, include_total: str = TOTAL_EXACT
         ) -> Dict[str, any]:
         """
         Returns paginated roles with total count.
 
-        :param page: Page number (1-based)
+        :param page: Page number (1-based), ignored when a cursor is given
         :param page_size: Number of items per page
         :param sort_field: Field to sort by
         :param ascending: Sort order
-        :return: dict with 'total' and 'data'
+        :param cursor: Opaque cursor from a previous page's next_cursor (keyset mode)
+        :param include_total: "true" for an exact total fetched with the page in one $facet aggregation,
+            "estimated" for estimated_document_count, "false" to skip counting
+        :return: dict with 'total', 'data' and 'next_cursor'
         """
-        skip = (page - 1) * page_size
+        if cursor is not None and sort_field not in KEYSET_SORT_FIELDS:
+            raise InvalidCursorException(f"Cursor paging is not supported for sort_field '{sort_field}'")
+        field = "_id" if sort_field == "id" else sort_field
         sort_order = 1 if ascending else -1
+        # _id as tie-breaker keeps the order total, so pages are stable
+        sort_spec = [(field, sort_order)] if field == "_id" else [(field, sort_order), ("_id", sort_order)]
 
-        total = await self.collection.count_documents({})
-        cursor = self.collection.find().sort(sort_field, sort_order).skip(skip).limit(page_size)
+        query: Dict[str, any] = {}
+        if cursor is not None:
+            # Keyset mode: seek past the last (sort value, _id) instead of skipping documents
+            last_value, last_id = decode_cursor(cursor, sort_field, ascending)
+            op, bound = ("$gt", "$gte") if ascending else ("$lt", "$lte")
+            # The id comes from the client: a well-formed cursor can still carry a bad one
+            from bson import ObjectId
+            if not ObjectId.is_valid(last_id):
+                raise InvalidCursorException("Malformed pagination cursor")
+            last_oid = ObjectId(last_id)
+            if field == "_id":
+                query = {"_id": {op: last_oid}}
+            else:
+                # The leading bound keeps the query on the {field, _id} index range
+                query = {field: {bound: last_value}, "$or": [{field: {op: last_value}}, {"_id": {op: last_oid}}]}
 
-        roles: List[Role] = []
-        async for doc in cursor:
-            roles.append(Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"]))
-        #print("RolesNowInRepo:",roles)
-        return {"total": total, "data": roles}
+        page_stages = [{"$sort": dict(sort_spec)}]
+        if query:
+            page_stages.insert(0, {"$match": query})
+        if cursor is None:
+            page_stages.append({"$skip": (page - 1) * page_size})
+        page_stages.append({"$limit": page_size + 1})  # one extra document tells us whether there is a next page
+
+        total = None
+        if include_total == TOTAL_EXACT:
+            # Page and total in a single round trip
+            pipeline = [{"$facet": {"data": page_stages, "total": [{"$count": "count"}]}}]
+            result = await self.collection.aggregate(pipeline, allowDiskUse=True).to_list(length=1)
+            facet = result[0] if result else {"data": [], "total": []}
+            docs = facet["data"]
+            total = facet["total"][0]["count"] if facet["total"] else 0
+        else:
+            # Plain aggregation keeps the indexed sort; the estimate reads collection metadata only
+            docs = await self.collection.aggregate(page_stages).to_list(length=page_size + 1)
+            if include_total == TOTAL_ESTIMATED:
+                total = await self.collection.estimated_document_count()
+
+        has_more = len(docs) > page_size
+        docs = docs[:page_size]
+        roles: List[Role] = [Role(id=str(doc["_id"]), name=doc["name"], isActive=doc["isActive"]) for doc in docs]
+
+        next_cursor = None
+        if has_more and docs:
+            last_doc = docs[-1]
+            last_value = str(last_doc["_id"]) if field == "_id" else last_doc.get(field)
+            next_cursor = encode_cursor(sort_field, ascending, last_value, last_doc["_id"])
+        return {"total": total, "data": roles, "next_cursor": next_cursor}
@@ -1,34 +1,83 @@
-from typing import Optional
-from sqlalchemy import asc, desc, func, select
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import asc, desc, func, insert, or_, select
+from sqlalchemy.exc import IntegrityError
 from app.domain.entities.role import Role
 from app.infrastructure.db.base import async_session
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.infrastructure.db.unit_of_work import session_scope
 from app.infrastructure.db.models.user import User as UserModel
-from app.infrastructure.db.models.role import Role as RoleModel
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
 from app.infrastructure.interfaces.i_user_repository import IUserRepository
 from app.domain.entities.user import User
-from app.core.security import hash_password
+from app.domain.entities.user_batch import UserBatch
+from app.core.security import hash_password_async, hash_passwords_async
+from app.domain.exceptions.invalid_cursor_exceptions import InvalidCursorException
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.db.db_errors import is_unique_violation
+from app.infrastructure.db.instrumentation import instrument_repository
+from app.utilities.pagination_utils import TOTAL_ESTIMATED, TOTAL_EXACT, decode_cursor, encode_cursor
+from app.config import settings
+import time
 import uuid
 
+# Non-nullable columns that can back a keyset cursor
+KEYSET_SORT_FIELDS = {"id", "username", "roleId", "createDate", "isActive"}
+
+# Cached total for include_total=estimated: (count, expires_at)
+_estimated_total = (0, 0.0)
+
+def _count_stmt():
+    return select(func.count()).select_from(UserModel)
+
+async def _estimated_count(session) -> int:
+    global _estimated_total
+    count, expires_at = _estimated_total
+    if time.monotonic() >= expires_at:
+        count = (await session.execute(_count_stmt())).scalar_one()
+        _estimated_total = (count, time.monotonic() + settings.LIST_COUNT_CACHE_SECONDS)
+    return count
+
+@instrument_repository
 class UserRepository(IUserRepository):
     """Concrete repository for user management"""
 
-    async def add_user(self, user_data: User) -> User:
-         async with async_session() as session:
-          new_id = str(uuid.uuid4())  # ✅ Generate GUID
+    def __init__(self, role_repository: IRoleRepository, versions: CollectionVersions = None):
+        # Resolves roleName for listed users (served from the role cache instead of a JOIN)
+        self.role_repository = role_repository
+        # Bumped after writes so the ETags of user reads change
+        self.versions = versions
+
+    async def _changed(self) -> None:
+        if self.versions is not None:
+            await self.versions.changed("users")
 
-          db_user = UserModel(
-            id=new_id,   # assign GUID here
+    async def add_user(self, user_data: User) -> User:
+        # Hash before opening the session so no connection is held while bcrypt runs
+        hashed_password = await hash_password_async(user_data.password)
+        db_user = UserModel(
+            id=str(uuid.uuid4()),  # ✅ Generate GUID
             username=user_data.username,
-            hashed_password=hash_password(user_data.password),
+            hashed_password=hashed_password,
             email=user_data.email,
             roleId=user_data.roleId,
+            createDate=user_data.createDate,
             isActive=user_data.isActive
-          )
-          session.add(db_user)
-          await session.commit()
-          await session.refresh(db_user)
+        )
+        async with session_scope() as session:
+            # Insert directly and let the unique indexes reject duplicates: no pre-check round trip, no race.
+            # The savepoint keeps a rejected insert from poisoning the rest of the request's transaction.
+            try:
+                async with session.begin_nested():
+                    # Every column is set client-side, so no refresh round trip is needed
+                    session.add(db_user)
+            except IntegrityError as exc:
+                if is_unique_violation(exc):
+                    raise AlreadyExistsException(f"Username or email already taken: {user_data.username}") from exc
+                raise
 
-          return User(
+        await self._changed()
+        return User(
             id=db_user.id,
             username=db_user.username,
             hashed_password=db_user.hashed_password,
@@ -36,41 +85,135 @@ class UserRepository(IUserRepository):
             roleId=db_user.roleId,
             createDate=db_user.createDate,
             isActive=db_user.isActive
-          )
-         
+        )
+
+    async def add_users(self, users: List[User]) -> List[Optional[User]]:
+        """
+        Insert a batch with a single executemany; passwords are hashed in parallel first, except for users
+        that arrive with a hashed_password (background imports hash before queueing).
+        If the batch hits a constraint violation, rows are retried one by one so only the offenders fail (None).
+        """
+        hashed = iter(await hash_passwords_async([u.password for u in users if u.hashed_password is None]))
+        hashed_passwords = [u.hashed_password if u.hashed_password is not None else next(hashed) for u in users]
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "username": u.username,
+                "hashed_password": hashed,
+                "email": u.email,
+                "roleId": u.roleId,
+                "createDate": now,
+                "isActive": u.isActive,
+            }
+            for u, hashed in zip(users, hashed_passwords)
+        ]
+
+        async with session_scope() as session:
+            # Savepoints keep a failed batch from rolling back the rest of the request's transaction
+            inserted: List[Optional[dict]] = rows
+            try:
+                async with session.begin_nested():
+                    await session.execute(insert(UserModel), rows)
+            except IntegrityError:
+                inserted = []
+                for row in rows:
+                    try:
+                        async with session.begin_nested():
+                            await session.execute(insert(UserModel), [row])
+                        inserted.append(row)
+                    except IntegrityError:
+                        inserted.append(None)
+
+        if any(inserted):
+            await self._changed()
+        return [User(**row) if row else None for row in inserted]
+
     async def get_by_id(self, user_id: int) -> Optional[User]:
-        async with async_session() as session:
+        async with session_scope() as session:
             result = await session.execute(select(UserModel).where(UserModel.id == user_id))
             db_user = result.scalars().first()
             if not db_user:
                 return None
             return User(id=db_user.id, username=db_user.username, hashed_password=db_user.hashed_password, email=db_user.email)
 
-    async def list_users(self, page: int, page_size: int, sort_field: str, ascending: bool) -> dict:
-      async with async_session() as session:
-        # Sorting
-        order_by = asc(getattr(UserModel, sort_field)) if ascending else desc(getattr(UserModel, sort_field))
-        print("B4RolesWithUsers:")
-        # Query with JOIN
+    async def stream_users(self, batch_size: int = 1000) -> AsyncIterator[UserBatch]:
+        """
+        Stream every user in id order through a server-side cursor, batch_size rows at a time,
+        so memory stays flat however many users there are. Password hashes are not selected.
+        Batches are columnar (UserBatch), so no User object is built per row.
+        """
         stmt = (
-            select(UserModel, RoleModel.name.label("roleName"))
-            .join(RoleModel, UserModel.roleId == RoleModel.id)
-            .order_by(order_by)
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+            select(UserModel.id, UserModel.username, UserModel.email, UserModel.roleId, UserModel.createDate, UserModel.isActive)
+            .order_by(UserModel.id)
+            .execution_options(yield_per=batch_size)
         )
+        # Own session rather than the request's unit of work: the response body is still
+        # streaming after the request dependencies have been closed
+        async with async_session() as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions(batch_size):
+                ids, usernames, emails, role_ids, create_dates, is_active = zip(*rows)
+                roles = await self.role_repository.get_by_ids(role_ids)
+                role_names = tuple(role.name if (role := roles.get(role_id)) else None for role_id in role_ids)
+                yield UserBatch(
+                    id=ids, username=usernames, email=emails, roleId=role_ids,
+                    roleName=role_names, createDate=create_dates, isActive=is_active
+                )
+
+    async def list_users(
+        self, page: int, page_size: int, sort_field: str, ascending: bool, cursor: Optional[str] = None,
+        include_total: str = TOTAL_EXACT
+    ) -> dict:
+      if cursor is not None and sort_field not in KEYSET_SORT_FIELDS:
+          raise InvalidCursorException(f"Cursor paging is not supported for sort_field '{sort_field}'")
+      async with session_scope() as session:
+        # Sorting, with id as tie-breaker so pages are stable
+        sort_column = getattr(UserModel, sort_field)
+        direction = asc if ascending else desc
+        columns = [UserModel]
+        if include_total == TOTAL_EXACT:
+            # Total rides along with the page as a scalar subquery, so page + count is one round trip.
+            # COUNT(*) OVER() would force the whole sorted join to be materialized before the LIMIT,
+            # and under a keyset seek it would only count the remaining rows.
+            columns.append(_count_stmt().scalar_subquery().label("total"))
+        stmt = (
+            select(*columns)
+            .order_by(direction(sort_column), direction(UserModel.id))
+            .limit(page_size + 1)  # one extra row tells us whether there is a next page
+        )
+
+        if cursor is not None:
+            # Keyset mode: seek past the last (sort value, id) instead of skipping rows
+            last_value, last_id = decode_cursor(cursor, sort_field, ascending)
+            if sort_column is UserModel.id:
+                stmt = stmt.where(UserModel.id > last_id if ascending else UserModel.id < last_id)
+            elif ascending:
+                # The leading >= keeps the predicate sargable on the (sort column, id) index
+                stmt = stmt.where(sort_column >= last_value, or_(sort_column > last_value, UserModel.id > last_id))
+            else:
+                stmt = stmt.where(sort_column <= last_value, or_(sort_column < last_value, UserModel.id < last_id))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
 
         result = await session.execute(stmt)
-        rows = result.all()  # [(UserModel, roleName), ...]
-        print("RolesWithUsers:",rows)
+        rows = result.all()  # [(UserModel[, total]), ...]
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
         # Count total
-        total_stmt = select(func.count()).select_from(UserModel)
-        total_result = await session.execute(total_stmt)
-        total_count = total_result.scalar_one()
-        print("WithUsersRoleName:",rows)
+        total_count = None
+        if include_total == TOTAL_EXACT:
+            # Only a page past the end comes back empty and needs its own count
+            total_count = rows[0].total if rows else (await session.execute(_count_stmt())).scalar_one()
+        elif include_total == TOTAL_ESTIMATED:
+            total_count = await _estimated_count(session)
+
         # Convert to Domain Entities (including roleName)
+        roles = await self.role_repository.get_by_ids([row[0].roleId for row in rows])
         users = []
-        for user_model, role_name in rows:
+        for user_model, *_ in rows:
+            role = roles.get(user_model.roleId)
             users.append(
                 User(
                     id=user_model.id,
@@ -80,14 +223,19 @@ class UserRepository(IUserRepository):
                     roleId=user_model.roleId,
                     createDate=user_model.createDate,
                     isActive=user_model.isActive,
-                    roleName=role_name,  # ✅ Add role name here
+                    roleName=role.name if role else None,  # ✅ Add role name here
                 )
             )
 
-        return {"total": total_count, "data": users}
+        next_cursor = None
+        if has_more and rows:
+            last_user = rows[-1][0]
+            next_cursor = encode_cursor(sort_field, ascending, getattr(last_user, sort_field), last_user.id)
+
+        return {"total": total_count, "data": users, "next_cursor": next_cursor}
 
     async def get_by_username_or_email(self, username: Optional[str] = None, email: Optional[str] = None) -> Optional[User]:
-        async with async_session() as session:
+        async with session_scope() as session:
             query = select(UserModel)
 
             if username and email:
@@ -114,3 +262,16 @@ class UserRepository(IUserRepository):
                 createDate=db_user.createDate,
                 isActive=db_user.isActive
             )
+
+    async def get_by_usernames_or_emails(self, usernames: List[str], emails: List[str]) -> List[User]:
+        """Set-based duplicate check for bulk imports: one query for a whole batch."""
+        conditions = []
+        if usernames:
+            conditions.append(UserModel.username.in_(usernames))
+        if emails:
+            conditions.append(UserModel.email.in_(emails))
+        if not conditions:
+            return []
+        async with session_scope() as session:
+            result = await session.execute(select(UserModel.username, UserModel.email).where(or_(*conditions)))
+            return [User(username=username, email=email) for username, email in result.all()]
@@ -0,0 +1,81 @@
+# app/infrastructure/repositories/voucher_repository.py
+from typing import List, Optional
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from app.domain.entities.voucher import Voucher
+from app.domain.entities.voucher_line import VoucherLine
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
+from app.infrastructure.db.instrumentation import instrument_repository
+from app.infrastructure.db.ledger_lock import lock_ledger
+from app.infrastructure.db.models.closed_period import ClosedPeriod as ClosedPeriodModel
+from app.infrastructure.db.models.voucher import Voucher as VoucherModel
+from app.infrastructure.db.models.voucher_line import VoucherLine as VoucherLineModel
+from app.infrastructure.db.models.voucher_sequence import VoucherSequence as VoucherSequenceModel
+from app.infrastructure.db.unit_of_work import session_scope
+from app.infrastructure.interfaces.i_voucher_repository import IVoucherRepository
+from app.utilities.period_utils import format_period, period_of
+
+VOUCHER_SEQUENCE = "voucher"
+
+@instrument_repository
+class VoucherRepository(IVoucherRepository):
+    """Concrete repository for vouchers"""
+
+    async def add_vouchers(self, vouchers: List[Voucher]) -> None:
+        headers = [
+            {"id": v.id, "number": v.number, "voucherDate": v.voucherDate, "description": v.description, "createDate": v.createDate}
+            for v in vouchers
+        ]
+        lines = [
+            {"voucherId": v.id, "lineNo": line_no, "voucherDate": v.voucherDate, "account": line.account, "debit": line.debit,
+             "credit": line.credit, "description": line.description}
+            for v in vouchers for line_no, line in enumerate(v.lines, start=1)
+        ]
+        # One executemany per table: the INSERT is compiled once (cached) and the driver sends the rows in
+        # bulk. Building insert().values(rows) instead recompiles a new statement for every batch size.
+        async with session_scope() as session:
+            await lock_ledger(session)
+            await session.execute(insert(VoucherModel), headers)
+            await session.execute(insert(VoucherLineModel), lines)
+            # The watermark is read uncached under the ledger lock, so a period closed after the service's
+            # (cached) check still rejects the voucher. Read after the inserts: SQLite only begins the
+            # transaction at the first write, and a raise here rolls them back.
+            closed = (await session.execute(select(func.max(ClosedPeriodModel.period)))).scalar_one_or_none()
+            late = [period_of(v.voucherDate) for v in vouchers if closed is not None and period_of(v.voucherDate) <= closed]
+            if late:
+                raise ClosedPeriodException(f"Period {format_period(min(late))} is closed")
+
+    async def allocate_numbers(self, count: int) -> int:
+        # One UPDATE ... RETURNING: the row lock serializes concurrent reservations across workers
+        stmt = (
+            update(VoucherSequenceModel)
+            .where(VoucherSequenceModel.name == VOUCHER_SEQUENCE)
+            .values(nextNumber=VoucherSequenceModel.nextNumber + count)
+            .returning(VoucherSequenceModel.nextNumber)
+        )
+        async with session_scope() as session:
+            next_number = (await session.execute(stmt)).scalar_one_or_none()
+            if next_number is not None:
+                return next_number - count
+            # First reservation ever: create the row; if another worker just did, reserve from theirs
+            try:
+                async with session.begin_nested():
+                    session.add(VoucherSequenceModel(name=VOUCHER_SEQUENCE, nextNumber=1 + count))
+                return 1
+            except IntegrityError:
+                return (await session.execute(stmt)).scalar_one() - count
+
+    async def get_by_id(self, voucher_id: str) -> Optional[Voucher]:
+        async with session_scope() as session:
+            header = (await session.execute(select(VoucherModel).where(VoucherModel.id == voucher_id))).scalars().first()
+            if header is None:
+                return None
+            lines = await session.execute(
+                select(VoucherLineModel.account, VoucherLineModel.debit, VoucherLineModel.credit, VoucherLineModel.description)
+                .where(VoucherLineModel.voucherId == voucher_id)
+                .order_by(VoucherLineModel.lineNo)
+            )
+            return Voucher(
+                id=header.id, number=header.number, voucherDate=header.voucherDate, description=header.description,
+                lines=[VoucherLine(*row) for row in lines.all()], createDate=header.createDate,
+            )
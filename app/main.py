@@ -2,8 +2,18 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from app.core.middlewares.exception_handler import global_exception_handler
 #from app.core.middlewares.response_middleware import ResponseWrapperMiddleware
-from app.presentation.controllers import login_controller, role_controller, user_controller
-from app.infrastructure.db.base import Base, engine
+from app.core.middlewares.request_metrics_middleware import RequestMetricsMiddleware
+from app.presentation.controllers import chat_controller, file_controller, job_controller, login_controller, metrics_controller, notify_controller, report_controller, role_controller, user_controller, voucher_controller
+from app.infrastructure.db import base as db
+from app.core.security import password_hasher
+from app.core.image_derivatives import DerivativeManager
+from app.core.di_container import container
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.hubs.chat_hub import ChatHub
+from app.hubs.notify_hub import NotifyHub
+from app.application.services.voucher_batcher import VoucherBatcher
 import logging
 from app.config import settings
 logging.basicConfig(level=logging.INFO)
@@ -15,27 +25,75 @@ async def lifespan(app: FastAPI):
     Lifespan handler replaces deprecated on_event("startup") and on_event("shutdown").
     This runs at app startup and shutdown.
     """
-    # Startup: create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables created successfully.")
-    
+    # Startup: schema creation is a separate step (python -m app.infrastructure.db.migrate)
+    if settings.STARTUP_MIGRATE:
+        from app.infrastructure.db.migrate import migrate, migrate_mongo
+        await migrate()
+        await migrate_mongo()
+
+    # bcrypt cost tuned to this host (otherwise PASSWORD_SALT_ROUNDS as configured)
+    if settings.PASSWORD_CALIBRATE_ON_STARTUP:
+        from app.core.password_calibration import calibrate_password_rounds
+        rounds, verify_ms = await calibrate_password_rounds()
+        logger.info("bcrypt cost calibrated to %d rounds (verify %.0fms).", rounds, verify_ms)
+
+    # Listen for role cache invalidations from other workers; the cache itself fills on first use
+    # unless warm-up is enabled, in which case connections are opened and roles preloaded now
+    role_repository = container.resolve(IRoleRepository)
+    try:
+        await role_repository.start(preload=settings.STARTUP_WARMUP)
+        if settings.STARTUP_WARMUP:
+            await db.warm_up()
+            logger.info("Database connections warmed up and role cache preloaded.")
+    except Exception:
+        logger.warning("Startup warm-up failed; backends will be connected on first use.", exc_info=True)
+
+    # ETag versions of users / roles are shared with the other workers through the broker
+    try:
+        await container.resolve(CollectionVersions).start()
+    except Exception:
+        logger.warning("Collection versions could not subscribe to the message broker; ETags stay local to this worker.",
+                       exc_info=True)
+
+    # Chat messages and notifications reach clients on other workers through the broker
+    chat_hub = container.resolve(ChatHub)
+    notify_hub = container.resolve(NotifyHub)
+    for hub in (chat_hub, notify_hub):
+        try:
+            await hub.start()
+        except Exception:
+            logger.warning("%s could not subscribe to the message broker; it stays local to this worker.",
+                           type(hub).__name__, exc_info=True)
+
+    # Voucher posting reopens here if an earlier lifespan in this process closed it
+    container.resolve(VoucherBatcher).start()
+
     # Yield control to the app
     yield
     
-    # Shutdown: optional cleanup
-    await engine.dispose()
-    logger.info("Engine disposed on shutdown.")
+    # Shutdown: close open sockets, then whichever backends were used
+    await chat_hub.close()
+    await notify_hub.close()
+    await container.resolve(VoucherBatcher).close()  # queued posts are written before the engine goes
+    await db.dispose()
+    logger.info("Database connections closed on shutdown.")
+    password_hasher.shutdown()
+    container.resolve(DerivativeManager).shutdown()
+    await container.resolve(IMessageBroker).close()
 
 # Create FastAPI app with lifespan
 app = FastAPI(title="Fast API", lifespan=lifespan)
-print(settings.MONGO_URI)
 # Global exception handler
 app.add_exception_handler(Exception, global_exception_handler) 
 
 # Global middleware for response wrapping
 #app.add_middleware(ResponseWrapperMiddleware)
 
+# Per-request DB instrumentation (Server-Timing / X-DB-Checkouts headers) and /metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+    app.include_router(metrics_controller.router, tags=["Metrics"])
+
 # Health check or root endpoint
 @app.get("/")
 def root():
@@ -45,3 +103,9 @@ def root():
 app.include_router(login_controller.router, prefix="/api/auth", tags=["Auth"])
 app.include_router(user_controller.router, prefix="/api/user", tags=["User"])
 app.include_router(role_controller.router, prefix="/api/role", tags=["Role"])
+app.include_router(chat_controller.router, prefix="/api/chat", tags=["Chat"])
+app.include_router(notify_controller.router, prefix="/api/notify", tags=["Notify"])
+app.include_router(file_controller.router, prefix="/api/files", tags=["Files"])
+app.include_router(voucher_controller.router, prefix="/api/vouchers", tags=["Vouchers"])
+app.include_router(report_controller.router, prefix="/api/reports", tags=["Reports"])
+app.include_router(job_controller.router, prefix="/api/jobs", tags=["Jobs"])
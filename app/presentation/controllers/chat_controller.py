@@ -0,0 +1,71 @@
+# app/presentation/chat_controller.py
+import json
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from app.config import settings
+from app.core.dependencies import get_chat_hub
+from app.core.security import decode_access_token
+from app.hubs.chat_hub import ChatHub
+
+router = APIRouter()
+
+def _valid_room(room: str) -> bool:
+    return 0 < len(room) <= settings.CHAT_MAX_ROOM_CHARS and room.isprintable()
+
+def _token(websocket: WebSocket, token: Optional[str]) -> Optional[str]:
+    # Browsers cannot set headers on a WebSocket, so the token may also come as ?token=
+    authorization = websocket.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        return authorization[7:]
+    return token
+
+@router.websocket("/ws")
+async def chat_socket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    hub: ChatHub = Depends(get_chat_hub)
+):
+    """
+    Chat over WebSocket, authenticated with a login token. Client frames are JSON:
+    {"action": "join" | "leave", "room": ...} or {"action": "send", "room": ..., "text": ...}.
+    Error frames ({"type": "error", "detail": ...}) are queued like messages: only the hub's sender writes.
+    """
+    raw_token = _token(websocket, token)
+    claims = decode_access_token(raw_token) if raw_token else None
+    if not claims or not claims.get("sub"):
+        await websocket.close(code=1008)  # policy violation: missing / invalid token
+        return
+
+    await websocket.accept()
+    connection = hub.connect(websocket, claims["sub"])
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+                action, room = message["action"], str(message["room"])
+            except (ValueError, KeyError, TypeError):
+                hub.send_error(connection, "Expected {action, room} JSON")
+                continue
+            if not _valid_room(room):
+                hub.send_error(connection, "Invalid room name")
+                continue
+
+            if action == "join":
+                if not hub.join(connection, room):
+                    hub.send_error(connection, f"Too many rooms (at most {hub.max_rooms})")
+            elif action == "leave":
+                hub.leave(connection, room)
+            elif action == "send":
+                text = str(message.get("text", ""))
+                if room not in connection.rooms:
+                    hub.send_error(connection, f"Not in room {room}")
+                elif len(text) > settings.CHAT_MAX_MESSAGE_CHARS:
+                    hub.send_error(connection, "Message too long")
+                else:
+                    await hub.publish(room, connection.user, text)
+            else:
+                hub.send_error(connection, f"Unknown action {action}")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await hub.disconnect(connection)
@@ -0,0 +1,144 @@
+# app/presentation/file_controller.py
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from app.config import settings
+from app.core.dependencies import get_derivative_manager, get_file_manager
+from app.core.file_manager import FileManager
+from app.core.image_derivatives import PRESETS, DerivativeManager, DerivativeSpec
+from app.application.mappers.mapper_utils import map_to_dto
+from app.domain.dtos.file.StoredFileResponse import StoredFileResponse
+from app.domain.dtos.file.UploadSessionCreate import UploadSessionCreate
+from app.domain.dtos.file.UploadSessionResponse import UploadSessionResponse
+from app.utilities.common_response import APIResponse
+from app.utilities.download_utils import (
+    IndexedFileResponse, etag_not_modified_response, is_not_modified, not_modified_response,
+)
+from app.utilities.etag_utils import etag_is_current
+from app.utilities.response_utils import wrap_response
+from app.utilities.upload_utils import read_upload
+
+router = APIRouter()
+
+def _session_response(session, stored=None) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        id=session.id, filename=session.filename, size=session.size, offset=session.offset,
+        completed=stored is not None, file=map_to_dto(StoredFileResponse, stored) if stored is not None else None,
+    )
+
+def _derivative_spec(preset: Optional[str], width: Optional[int], height: Optional[int],
+                     fit: str, format: str, quality: int) -> DerivativeSpec:
+    if preset is not None:
+        if preset not in PRESETS:
+            raise HTTPException(status_code=400, detail=f"Unknown preset, use one of: {', '.join(PRESETS)}")
+        return PRESETS[preset]
+    if width is None and height is None:
+        raise HTTPException(status_code=400, detail="Give a preset, a width or a height")
+    if fit == "cover":
+        width, height = width or height, height or width
+    else:
+        width, height = width or settings.IMAGE_MAX_DIMENSION, height or settings.IMAGE_MAX_DIMENSION
+    return DerivativeSpec(width, height, fit, format, quality)
+
+def _content_length(request: Request) -> Optional[int]:
+    value = request.headers.get("content-length")
+    return int(value) if value and value.isdigit() else None
+
+@router.post("/", response_model=APIResponse[StoredFileResponse])
+async def upload_file(
+    request: Request,
+    filename: Optional[str] = Query(None, description="File name for a raw (non-multipart) body"),
+    file_manager: FileManager = Depends(get_file_manager),
+    derivatives: DerivativeManager = Depends(get_derivative_manager)
+):
+    """
+    Upload one file, as multipart/form-data (first file part) or as the raw request body.
+    Streamed to disk; identical content is stored once.
+    """
+    length = _content_length(request)
+    if length is not None:
+        file_manager.check_size(length)  # refuse before reading anything
+    body = await read_upload(request, filename)
+    stored = await file_manager.save_stream(body.chunks, body.filename, body.content_type)
+    derivatives.schedule_upload_presets(stored.id, stored.content_type)
+    return wrap_response(data=map_to_dto(StoredFileResponse, stored))
+
+@router.post("/uploads", response_model=APIResponse[UploadSessionResponse])
+async def create_upload(
+    upload: UploadSessionCreate,
+    file_manager: FileManager = Depends(get_file_manager)
+):
+    """Start a resumable upload; send the bytes with PATCH /uploads/{id}"""
+    session = await file_manager.create_session(upload.filename, upload.size, upload.content_type)
+    return wrap_response(data=_session_response(session))
+
+@router.get("/uploads/{upload_id}", response_model=APIResponse[UploadSessionResponse])
+async def get_upload(
+    upload_id: str,
+    file_manager: FileManager = Depends(get_file_manager)
+):
+    """Current offset of a resumable upload: where the next chunk must start"""
+    session = await file_manager.get_session(upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return wrap_response(data=_session_response(session))
+
+@router.patch("/uploads/{upload_id}", response_model=APIResponse[UploadSessionResponse])
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    file_manager: FileManager = Depends(get_file_manager),
+    derivatives: DerivativeManager = Depends(get_derivative_manager)
+):
+    """Append the raw body at Upload-Offset; the last chunk completes the upload (409 on a wrong offset)"""
+    session, stored = await file_manager.append_chunk(upload_id, upload_offset, request.stream())
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if stored is not None:
+        derivatives.schedule_upload_presets(stored.id, stored.content_type)
+    return wrap_response(data=_session_response(session, stored))
+
+@router.api_route("/{file_id}", methods=["GET", "HEAD"])
+async def download_file(
+    file_id: str,
+    request: Request,
+    filename: Optional[str] = Query(None, description="Serve as an attachment with this name"),
+    file_manager: FileManager = Depends(get_file_manager)
+):
+    """
+    Download a stored file by its content hash. Supports Range (single and multi-range) and If-Range;
+    If-None-Match / If-Modified-Since answer 304 from the in-memory index without touching the file.
+    """
+    entry = await file_manager.lookup(file_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    if is_not_modified(request, entry):
+        return not_modified_response(entry)
+    return IndexedFileResponse(entry, filename=filename)
+
+@router.api_route("/{file_id}/derivative", methods=["GET", "HEAD"])
+async def download_derivative(
+    file_id: str,
+    request: Request,
+    preset: Optional[str] = Query(None, description=f"One of: {', '.join(PRESETS)} (overrides the size options)"),
+    width: Optional[int] = Query(None, ge=1, le=settings.IMAGE_MAX_DIMENSION),
+    height: Optional[int] = Query(None, ge=1, le=settings.IMAGE_MAX_DIMENSION),
+    fit: Literal["contain", "cover"] = Query("contain"),
+    format: Literal["webp", "jpeg", "png"] = Query("webp"),
+    quality: int = Query(80, ge=1, le=95),
+    derivatives: DerivativeManager = Depends(get_derivative_manager)
+):
+    """
+    A resized variant of a stored image, rendered in a worker pool on first request and cached on disk.
+    Same caching headers as the original; a matching If-None-Match answers 304 without rendering.
+    """
+    spec = _derivative_spec(preset, width, height, fit, format, quality)
+    etag = derivatives.derivative_etag(file_id, spec)
+    if etag_is_current(request, etag):
+        return etag_not_modified_response(etag)
+    entry = await derivatives.get(file_id, spec)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    if is_not_modified(request, entry):
+        return not_modified_response(entry)
+    return IndexedFileResponse(entry)
@@ -0,0 +1,35 @@
+# app/presentation/job_controller.py
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.application.services.job_service import JobService
+from app.core.dependencies import get_job_service
+from app.domain.dtos.job.JobStatusResponse import JobStatusResponse
+from app.domain.dtos.user.UserCreate import UserCreate
+from app.utilities.bulk_utils import iter_bulk_rows
+from app.utilities.common_response import APIResponse
+from app.utilities.response_utils import wrap_response
+
+router = APIRouter()
+
+@router.post("/user-import", response_model=APIResponse[JobStatusResponse], status_code=202)
+async def submit_user_import(
+    request: Request,
+    job_service: JobService = Depends(get_job_service)
+):
+    """
+    Import users in the background. Same body as POST /api/user/bulk (JSON array or NDJSON); rows are
+    validated now, then created by the task workers in chunks. Poll GET /api/jobs/{id} for progress and
+    the per-row report.
+    """
+    job = await job_service.submit_user_import(iter_bulk_rows(request, UserCreate))
+    return wrap_response(data=job, message="Accepted", status_code=202)
+
+@router.get("/{job_id}", response_model=APIResponse[JobStatusResponse])
+async def get_job(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service)
+):
+    """Job state (queued, running, succeeded, failed), chunk / row progress, and the result once done"""
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return wrap_response(data=job)
@@ -4,10 +4,12 @@ from app.domain.dtos.user.UserLogin import UserLogin
 from app.application.services.login_service import LoginService
 from app.core.dependencies import get_login_service
 from app.utilities.response_utils import wrap_response
+from app.utilities.common_response import APIResponse
+from app.domain.dtos.user.UserLoginResponse import UserLoginResponse
 
 router = APIRouter()
 
-@router.post("/login")
+@router.post("/login", response_model=APIResponse[UserLoginResponse])
 async def login_user(
     user_login: UserLogin,
     login_service: LoginService = Depends(get_login_service)
@@ -17,4 +19,4 @@ async def login_user(
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Wrap response
-    return wrap_response(data=result.model_dump())
+    return wrap_response(data=result)
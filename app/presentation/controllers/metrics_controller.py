@@ -0,0 +1,11 @@
+# app/presentation/metrics_controller.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.utilities.metrics_utils import registry
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (text exposition format)"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
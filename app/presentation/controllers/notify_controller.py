@@ -0,0 +1,50 @@
+# app/presentation/notify_controller.py
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from app.core.dependencies import get_notify_hub
+from app.domain.dtos.notify.NotificationCreate import NotificationCreate
+from app.domain.dtos.notify.NotificationResponse import NotificationResponse
+from app.hubs.notify_hub import NotifyHub
+from app.utilities.common_response import APIResponse
+from app.utilities.response_utils import wrap_response
+
+router = APIRouter()
+
+@router.get("/stream")
+async def notification_stream(
+    topics: Optional[str] = Query(None, description="Comma separated topics; all topics when omitted"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    hub: NotifyHub = Depends(get_notify_hub)
+):
+    """Server-Sent Events stream; reconnecting with Last-Event-ID replays what was missed"""
+    topic_filter = frozenset(t for t in topics.split(",") if t) if topics else None
+    subscriber, replay = hub.subscribe(topic_filter, last_event_id)
+
+    async def events():
+        try:
+            yield b"retry: 3000\n\n" + b"".join(replay)
+            while not subscriber.closed:
+                if not subscriber.queue:
+                    subscriber.ready.clear()
+                    await subscriber.ready.wait()
+                # Everything queued since the last wake-up goes out as one chunk
+                if subscriber.queue:
+                    yield subscriber.drain()
+        finally:
+            hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.post("/publish", response_model=APIResponse[NotificationResponse])
+async def publish_notification(
+    notification: NotificationCreate,
+    hub: NotifyHub = Depends(get_notify_hub)
+):
+    """Broadcast a notification to the subscribers of its topic on every worker"""
+    event_id = await hub.publish(notification.topic, notification.event, notification.data)
+    return wrap_response(data=NotificationResponse(id=event_id, topic=notification.topic, event=notification.event))
@@ -0,0 +1,72 @@
+# app/presentation/report_controller.py
+from datetime import date, datetime, timezone
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.application.services.report_service import ReportService
+from app.core.dependencies import get_report_service
+from app.domain.entities.ledger_batch import LedgerBatch
+from app.domain.dtos.report.PeriodCloseResponse import PeriodCloseResponse
+from app.domain.dtos.report.PeriodSummaryResponse import PeriodSummaryResponse
+from app.domain.dtos.report.TrialBalanceResponse import TrialBalanceResponse
+from app.utilities.common_response import APIResponse
+from app.utilities.export_utils import export_response
+from app.utilities.period_utils import parse_period
+from app.utilities.response_utils import wrap_response
+
+router = APIRouter()
+
+def _period(text: str) -> int:
+    try:
+        return parse_period(text)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.get("/trial-balance", response_model=APIResponse[TrialBalanceResponse])
+async def trial_balance(
+    as_of: Optional[date] = Query(None, description="Include lines dated on or before this day (default today)"),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """Debit, credit and balance per account; closed periods come from their stored summaries"""
+    report = await report_service.trial_balance(as_of)
+    return wrap_response(data=report)
+
+@router.get("/period-summaries", response_model=APIResponse[List[PeriodSummaryResponse]])
+async def period_summaries(
+    start: str = Query(..., description="First period, YYYY-MM"),
+    end: str = Query(..., description="Last period, YYYY-MM"),
+    account: Optional[str] = Query(None, max_length=50),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """Totals per period and account"""
+    first, last = _period(start), _period(end)
+    if first > last:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    summaries = await report_service.period_summaries(first, last, account)
+    return wrap_response(data=summaries)
+
+@router.get("/ledger/{account}")
+async def account_ledger(
+    account: str,
+    start: Optional[date] = Query(None, description="First day; an opening balance row comes first"),
+    end: Optional[date] = Query(None, description="Last day (default today)"),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """Stream an account's lines with running balances as NDJSON or CSV; memory stays flat regardless of line count"""
+    end = end or datetime.now(timezone.utc).date()
+    if start is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    return export_response(report_service.account_ledger(account, start, end), format, list(LedgerBatch.FIELDS), f"ledger-{account}")
+
+@router.post("/periods/{period}/close", response_model=APIResponse[PeriodCloseResponse])
+async def close_period(
+    period: str,
+    report_service: ReportService = Depends(get_report_service)
+):
+    """
+    Close a period (YYYY-MM), and every open one before it: their per-account totals are stored and
+    reports read those instead of the lines. Posting into a closed period is rejected from then on, and a
+    close that overlaps a post into its periods fails with 409 (close again), so close once posting is done.
+    """
+    closed = await report_service.close_period(_period(period))
+    return wrap_response(data=closed)
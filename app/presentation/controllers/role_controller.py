@@ -1,14 +1,23 @@
-# app/presentation/user_controller.py
-from fastapi import APIRouter, Depends, HTTPException, Query
+# app/presentation/role_controller.py
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from app.domain.dtos.role.RoleCreate import RoleCreate
 from app.application.services.role_service import RoleService
-from app.core.dependencies import get_role_service
+from app.core.dependencies import get_collection_versions, get_role_service
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.utilities.etag_utils import collection_etag, etag_is_current, revalidate_headers, revalidate_not_modified_response
 from app.utilities.response_utils import wrap_response
+from app.utilities.bulk_utils import iter_bulk_rows
+from app.utilities.export_utils import export_response
+from app.domain.dtos.role.RoleResponse import RoleResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.utilities.common_response import APIResponse, PageResponse
+from app.config import settings
 
 
 router = APIRouter()
 
-@router.post("/")
+@router.post("/", response_model=APIResponse[RoleResponse])
 async def create_role(
     role_data: RoleCreate,
     role_service: RoleService = Depends(get_role_service)
@@ -17,25 +26,60 @@ async def create_role(
     role = await role_service.create_role(role_data)
     return wrap_response(data=role)
 
-@router.get("/{role_id}")
-async def get_user(
-    role_id: int,
+@router.post("/bulk", response_model=APIResponse[BulkImportResponse])
+async def bulk_create_roles(
+    request: Request,
+    batch_size: int = Query(settings.BULK_IMPORT_BATCH_SIZE, ge=1, le=1000, description="Rows per insert batch"),
     role_service: RoleService = Depends(get_role_service)
 ):
-    """Fetch a role by ID"""
-    role = await role_service.get_user_by_id(role_id)
+    """
+    Create many roles in one call. Body is a JSON array of RoleCreate objects, or NDJSON
+    (Content-Type: application/x-ndjson) which is processed while it streams in.
+    Returns a per-row report.
+    """
+    report = await role_service.bulk_create_roles(iter_bulk_rows(request, RoleCreate), batch_size)
+    return wrap_response(data=report)
+
+@router.get("/export")
+async def export_roles(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    batch_size: int = Query(settings.EXPORT_BATCH_SIZE, ge=1, le=10000, description="Rows fetched per cursor round trip"),
+    role_service: RoleService = Depends(get_role_service)
+):
+    """Stream every role as NDJSON or CSV; memory stays flat regardless of row count"""
+    return export_response(role_service.export_roles(batch_size), format, list(RoleResponse.model_fields), "roles")
+
+@router.get("/{role_id}", response_model=APIResponse[RoleResponse])
+async def get_role(
+    request: Request,
+    role_id: str,
+    role_service: RoleService = Depends(get_role_service),
+    versions: CollectionVersions = Depends(get_collection_versions)
+):
+    """Fetch a role by ID; If-None-Match with the current ETag answers 304 without a query"""
+    etag = collection_etag(request, versions, "roles")
+    if etag_is_current(request, etag):
+        return revalidate_not_modified_response(etag)
+    role = await role_service.get_role_by_id(role_id)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
-    return wrap_response(data=role)
+    return wrap_response(data=role, headers=revalidate_headers(etag))
 
-@router.get("/")
+@router.get("/", response_model=APIResponse[PageResponse[RoleResponse]])
 async def list_roles(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_field: str = Query("name", description="Field to sort by"),
     ascending: bool = Query(True, description="Sort ascending?"),
-    role_service: RoleService = Depends(get_role_service)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; enables keyset paging"),
+    include_total: Literal["true", "false", "estimated"] = Query("true", description="Exact total, no total, or a cheap estimate"),
+    role_service: RoleService = Depends(get_role_service),
+    versions: CollectionVersions = Depends(get_collection_versions)
 ):
-    """Fetch paginated roles"""
-    roles = await role_service.list_roles(page, page_size, sort_field, ascending)
-    return wrap_response(data=roles)
+    """Fetch paginated roles; the ETag covers the query parameters, so each page revalidates on its own"""
+    etag = collection_etag(request, versions, "roles")
+    if etag_is_current(request, etag):
+        return revalidate_not_modified_response(etag)
+    roles = await role_service.list_roles(page, page_size, sort_field, ascending, cursor, include_total)
+    return wrap_response(data=roles, headers=revalidate_headers(etag))
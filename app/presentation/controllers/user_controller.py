@@ -1,14 +1,23 @@
 # app/presentation/user_controller.py
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from app.domain.dtos.user.UserCreate import UserCreate
 from app.application.services.user_service import UserService
-from app.core.dependencies import get_user_service
+from app.core.dependencies import get_collection_versions, get_user_service
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.utilities.etag_utils import collection_etag, etag_is_current, revalidate_headers, revalidate_not_modified_response
 from app.utilities.response_utils import wrap_response
+from app.utilities.bulk_utils import iter_bulk_rows
+from app.utilities.export_utils import export_response
+from app.domain.dtos.user.UserResponse import UserResponse
+from app.domain.dtos.bulk.BulkImportResponse import BulkImportResponse
+from app.utilities.common_response import APIResponse, PageResponse
+from app.config import settings
 
 
 router = APIRouter()
 
-@router.post("/")
+@router.post("/", response_model=APIResponse[UserResponse])
 async def create_user(
     user_data: UserCreate,
     user_service: UserService = Depends(get_user_service)
@@ -17,16 +26,44 @@ async def create_user(
     user = await user_service.create_user(user_data)
     return wrap_response(data=user)
 
-@router.get("/{user_id}")
-async def get_user(
-    user_id: int,
+@router.post("/bulk", response_model=APIResponse[BulkImportResponse])
+async def bulk_create_users(
+    request: Request,
+    batch_size: int = Query(settings.BULK_IMPORT_BATCH_SIZE, ge=1, le=1000, description="Rows per insert batch"),
     user_service: UserService = Depends(get_user_service)
 ):
-    """Fetch a user by ID"""
+    """
+    Create many users in one call. Body is a JSON array of UserCreate objects, or NDJSON
+    (Content-Type: application/x-ndjson) which is processed while it streams in.
+    Returns a per-row report.
+    """
+    report = await user_service.bulk_create_users(iter_bulk_rows(request, UserCreate), batch_size)
+    return wrap_response(data=report)
+
+@router.get("/export")
+async def export_users(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    batch_size: int = Query(settings.EXPORT_BATCH_SIZE, ge=1, le=10000, description="Rows fetched per cursor round trip"),
+    user_service: UserService = Depends(get_user_service)
+):
+    """Stream every user as NDJSON or CSV; memory stays flat regardless of row count"""
+    return export_response(user_service.export_users(batch_size), format, list(UserResponse.model_fields), "users")
+
+@router.get("/{user_id}", response_model=APIResponse[UserResponse])
+async def get_user(
+    request: Request,
+    user_id: str,
+    user_service: UserService = Depends(get_user_service),
+    versions: CollectionVersions = Depends(get_collection_versions)
+):
+    """Fetch a user by ID; If-None-Match with the current ETag answers 304 without a query"""
+    etag = collection_etag(request, versions, "users", "roles")
+    if etag_is_current(request, etag):
+        return revalidate_not_modified_response(etag)
     user = await user_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return wrap_response(data=user)
+    return wrap_response(data=user, headers=revalidate_headers(etag))
 
 
 # @router.get("/")
@@ -34,16 +71,23 @@ async def get_user(
 #     """Fetch all users"""
 #     user =  await user_service.list_users()
 #     return wrap_response(data=user)
-@router.get("/")
+@router.get("/", response_model=APIResponse[PageResponse[UserResponse]])
 async def list_users(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     sort_field: str = Query("username", description="Field to sort by"),
     ascending: bool = Query(True, description="Sort ascending?"),
-    user_service: UserService = Depends(get_user_service)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; enables keyset paging"),
+    include_total: Literal["true", "false", "estimated"] = Query("true", description="Exact total, no total, or a cheap estimate"),
+    user_service: UserService = Depends(get_user_service),
+    versions: CollectionVersions = Depends(get_collection_versions)
 ):
-    """Fetch paginated users"""
-    roles = await user_service.list_users(page, page_size, sort_field, ascending)
-    return wrap_response(data=roles)
+    """Fetch paginated users; the ETag covers the query parameters, so each page revalidates on its own"""
+    etag = collection_etag(request, versions, "users", "roles")
+    if etag_is_current(request, etag):
+        return revalidate_not_modified_response(etag)
+    users = await user_service.list_users(page, page_size, sort_field, ascending, cursor, include_total)
+    return wrap_response(data=users, headers=revalidate_headers(etag))
 
 
@@ -0,0 +1,33 @@
+# app/presentation/voucher_controller.py
+from fastapi import APIRouter, Depends, HTTPException
+from app.application.services.voucher_service import VoucherService
+from app.core.dependencies import get_voucher_service
+from app.domain.dtos.voucher.VoucherCreate import VoucherCreate
+from app.domain.dtos.voucher.VoucherResponse import VoucherResponse
+from app.utilities.common_response import APIResponse
+from app.utilities.response_utils import wrap_response
+
+router = APIRouter()
+
+@router.post("/", response_model=APIResponse[VoucherResponse])
+async def post_voucher(
+    voucher_data: VoucherCreate,
+    voucher_service: VoucherService = Depends(get_voucher_service)
+):
+    """
+    Post a balanced voucher (total debit = total credit). Concurrent posts are written together
+    in batched transactions; the response comes once the voucher is committed, with its number.
+    """
+    voucher = await voucher_service.post_voucher(voucher_data)
+    return wrap_response(data=voucher)
+
+@router.get("/{voucher_id}", response_model=APIResponse[VoucherResponse])
+async def get_voucher(
+    voucher_id: str,
+    voucher_service: VoucherService = Depends(get_voucher_service)
+):
+    """Fetch a voucher with its lines"""
+    voucher = await voucher_service.get_voucher_by_id(voucher_id)
+    if not voucher:
+        raise HTTPException(status_code=404, detail="Voucher not found")
+    return wrap_response(data=voucher)
@@ -0,0 +1,63 @@
+# app/utilities/bulk_utils.py
+import json
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple, Type, TypeVar
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+# (row index, parsed DTO or None, error message or None)
+BulkRow = Tuple[int, Optional[T], Optional[str]]
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in exc.errors())
+
+def _parse_row(index: int, model: Type[T], raw) -> BulkRow:
+    try:
+        if isinstance(raw, (bytes, str)):
+            return index, model.model_validate_json(raw), None
+        return index, model.model_validate(raw), None
+    except ValidationError as exc:
+        return index, None, _validation_message(exc)
+
+async def iter_bulk_rows(request: Request, model: Type[T]) -> AsyncIterator[BulkRow]:
+    """
+    Parse a bulk request body row by row: a JSON array, or NDJSON (one object per line) which is
+    read from the stream as it arrives, so large imports are never held in memory as a whole.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        index = 0
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield _parse_row(index, model, line)
+                    index += 1
+        if buffer.strip():
+            yield _parse_row(index, model, buffer)
+        return
+
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    for index, item in enumerate(items):
+        yield _parse_row(index, model, item)
+
+async def batched(rows: AsyncIterable[BulkRow], size: int) -> AsyncIterator[List[BulkRow]]:
+    """Group parsed rows into batches of at most `size`"""
+    batch: List[BulkRow] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
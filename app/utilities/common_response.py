@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Optional
+from typing import Generic, List, TypeVar, Optional
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -8,3 +8,11 @@ class APIResponse(BaseModel, Generic[T]):
     message: str
     data: Optional[T] = None
     errors: Optional[str] = None
+
+class PageResponse(BaseModel, Generic[T]):
+    """Shape of the data returned by the paginated list endpoints"""
+    total: Optional[int] = None
+    data: List[T]
+    page: int
+    page_size: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,35 @@
+# app/utilities/etag_utils.py
+import hashlib
+from fastapi import Request, Response
+from app.infrastructure.cache.collection_versions import CollectionVersions
+
+# Clients may keep the answer but must revalidate it (a cheap 304 while it is unchanged) before each use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    etag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+def etag_is_current(request: Request, etag: str) -> bool:
+    """If-None-Match alone: lets a response whose ETag is known up front answer 304 before producing anything"""
+    if_none_match = request.headers.get("if-none-match")
+    return if_none_match is not None and etag_matches(if_none_match, etag)
+
+def collection_etag(request: Request, versions: CollectionVersions, *collections: str) -> str:
+    """
+    Weak ETag of a read over collections: their current versions plus the path and query parameters,
+    so it is known without querying and changes with any write to them (weak: equal data, not bytes).
+    Taken before the read: a write racing with the read changes the version, so the next poll refetches.
+    """
+    query = "&".join(sorted(f"{name}={value}" for name, value in request.query_params.multi_items()))
+    key = "\n".join([request.url.path, query, *(versions.current(collection) for collection in collections)])
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:24]}"'
+
+def revalidate_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+
+def revalidate_not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=revalidate_headers(etag))
@@ -0,0 +1,47 @@
+# app/utilities/export_utils.py
+import csv
+import io
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Union
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# A batch is a list of DTOs, or a columnar batch exposing rows(fields) (e.g. UserBatch)
+ExportBatch = Union[List[BaseModel], Any]
+
+def _json_rows(batch: ExportBatch, fields: List[str]) -> Iterable[list]:
+    """Rows of JSON-compatible values (ISO datetimes, as the DTOs would serialize them), ordered as fields"""
+    if isinstance(batch, list):
+        return ([row[f] for f in fields] for row in (item.model_dump(mode="json") for item in batch))
+    return (to_jsonable_python(row) for row in batch.rows(fields))
+
+async def encode_ndjson(batches: AsyncIterable[ExportBatch], fields: List[str]) -> AsyncIterator[bytes]:
+    """One JSON object per line; one chunk per batch"""
+    async for batch in batches:
+        if isinstance(batch, list):
+            yield b"".join(item.model_dump_json().encode() + b"\n" for item in batch)
+        else:
+            yield b"".join(to_json(dict(zip(fields, row))) + b"\n" for row in batch.rows(fields))
+
+async def encode_csv(batches: AsyncIterable[ExportBatch], fields: List[str]) -> AsyncIterator[bytes]:
+    """Header row, then one chunk per batch; the buffer is reused so memory stays at one batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for batch in batches:
+        writer.writerows(_json_rows(batch, fields))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def export_response(batches: AsyncIterable[ExportBatch], fmt: str, fields: List[str], filename: str) -> StreamingResponse:
+    body = encode_csv(batches, fields) if fmt == "csv" else encode_ndjson(batches, fields)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,156 @@
+# app/utilities/metrics_utils.py
+import bisect
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+# Latency buckets in seconds (upper bounds; +Inf is implicit)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    """Monotonic counter per label set, rendered in the Prometheus text format"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labelnames, labels)} {value}" for labels, value in items)
+        return lines
+
+class Gauge:
+    """Last set value per label set"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        self._values[labels] = value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        lines.extend(f"{self.name}{_labels(self.labelnames, labels)} {value}" for labels, value in list(self._values.items()))
+        return lines
+
+class Histogram:
+    """
+    Histogram per label set. observe() is a bisect plus three additions under a lock;
+    cumulative bucket counts are only computed when /metrics is scraped.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._series.items()]
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for a /metrics scrape"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Process-wide registry and the metrics the app records
+registry = MetricsRegistry()
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+repository_duration = registry.histogram(
+    "repository_method_duration_seconds", "Repository method latency", ("repository", "method"))
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds", "Duration of single SQL statements / MongoDB commands", ("backend",))
+db_rows = registry.counter(
+    "db_rows_returned_total", "Records returned by repository methods, by route", ("route",))
+password_hash_rounds = registry.gauge(
+    "password_hash_rounds", "bcrypt cost (log2 rounds) used for new password hashes")
+password_calibrated_verify = registry.gauge(
+    "password_calibrated_verify_seconds", "bcrypt verify time measured at the chosen cost by calibration")
+password_verify_duration = registry.histogram(
+    "password_verify_duration_seconds", "Password verification latency, hasher pool queueing included")
+chat_connections = registry.gauge(
+    "chat_connections", "Open chat WebSocket connections in this worker")
+chat_frames_dropped = registry.counter(
+    "chat_frames_dropped_total", "Outbound chat frames lost to full per-connection queues", ("policy",))
+notify_subscribers = registry.gauge(
+    "notify_subscribers", "Open notification (SSE) streams in this worker")
+notify_subscribers_dropped = registry.counter(
+    "notify_subscribers_dropped_total", "SSE streams cut off for falling too far behind")
+image_derivative_requests = registry.counter(
+    "image_derivative_requests_total", "Image derivative lookups by outcome (hit, render, shared)", ("result",))
+image_derivative_render_duration = registry.histogram(
+    "image_derivative_render_seconds", "Time to render one image derivative, pool queueing included")
+image_derivative_cache_bytes = registry.gauge(
+    "image_derivative_cache_bytes", "Bytes of image derivatives this worker tracks on disk")
+voucher_batch_size = registry.histogram(
+    "voucher_batch_size", "Vouchers written per batched transaction", buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000))
@@ -0,0 +1,35 @@
+# app/utilities/pagination_utils.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from app.domain.exceptions.invalid_cursor_exceptions import InvalidCursorException
+
+# include_total modes for list endpoints
+TOTAL_EXACT = "true"         # exact count, fetched in the same round trip as the page
+TOTAL_NONE = "false"         # no count at all
+TOTAL_ESTIMATED = "estimated"  # cheap approximate count (collection metadata or a cached count)
+
+def encode_cursor(sort_field: str, ascending: bool, value: Any, last_id: Any) -> str:
+    """Encode the (sort value, id) of the last row of a page into an opaque cursor"""
+    payload = {"f": sort_field, "a": ascending, "v": value, "id": str(last_id)}
+    if isinstance(value, datetime):
+        payload["v"], payload["t"] = value.isoformat(), "dt"
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, sort_field: str, ascending: bool) -> Tuple[Any, str]:
+    """Decode a cursor back into (sort value, id); it must belong to the same sort"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value = payload["v"]
+        if payload.get("t") == "dt":
+            value = datetime.fromisoformat(value)
+        last_id = payload["id"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorException("Malformed pagination cursor") from exc
+
+    if payload.get("f") != sort_field or payload.get("a") != ascending:
+        raise InvalidCursorException("Cursor does not match the requested sort_field/ascending")
+    return value, last_id
@@ -0,0 +1,40 @@
+# app/utilities/period_utils.py
+import calendar
+import re
+from datetime import date
+
+# Accounting periods are calendar months, held as YYYYMM integers (202403) and shown as "2024-03"
+_PERIOD = re.compile(r"^(\d{4})-(0[1-9]|1[0-2])$")
+
+def period_of(day: date) -> int:
+    return day.year * 100 + day.month
+
+def period_start(period: int) -> date:
+    return date(period // 100, period % 100, 1)
+
+def period_end(period: int) -> date:
+    year, month = divmod(period, 100)
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+def next_period(period: int) -> int:
+    year, month = divmod(period, 100)
+    return period + 1 if month < 12 else (year + 1) * 100 + 1
+
+def previous_period(period: int) -> int:
+    year, month = divmod(period, 100)
+    return period - 1 if month > 1 else (year - 1) * 100 + 12
+
+def last_full_period(day: date) -> int:
+    """The latest period that ends on or before day"""
+    period = period_of(day)
+    return period if day == period_end(period) else previous_period(period)
+
+def parse_period(text: str) -> int:
+    """'2024-03' -> 202403; raises ValueError on anything else"""
+    match = _PERIOD.match(text)
+    if match is None:
+        raise ValueError(f"Invalid period '{text}', expected YYYY-MM")
+    return int(match.group(1)) * 100 + int(match.group(2))
+
+def format_period(period: int) -> str:
+    return f"{period // 100:04d}-{period % 100:02d}"
@@ -1,6 +1,25 @@
 # app/utilities/response_utils.py
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from app.utilities.common_response import APIResponse
 
-def wrap_response(data=None, message="Success", success=True, errors=None):
-    return APIResponse(success=success, message=message, data=data, errors=errors).model_dump()
+class APIJSONResponse(JSONResponse):
+    """
+    Renders a Pydantic model with model_dump_json: one pass in pydantic-core straight to bytes,
+    instead of model_dump() + jsonable_encoder + json.dumps. Other content renders as usual.
+    """
 
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return super().render(content)
+
+def wrap_response(data=None, message="Success", success=True, errors=None, status_code=200, headers=None) -> APIJSONResponse:
+    # Returned as a Response, so FastAPI skips its own serialization; the route's
+    # response_model only documents the shape
+    return APIJSONResponse(
+        APIResponse(success=success, message=message, data=data, errors=errors),
+        status_code=status_code,
+        headers=headers,
+    )
@@ -0,0 +1,94 @@
+# app/utilities/upload_utils.py
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import HTTPException, Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+class UploadBody:
+    """The file in an upload request: its name, content type and body chunks (read lazily)"""
+    __slots__ = ("filename", "content_type", "chunks")
+
+    def __init__(self, filename: str, content_type: str, chunks: AsyncIterator[bytes]):
+        self.filename = filename
+        self.content_type = content_type
+        self.chunks = chunks
+
+async def read_upload(request: Request, filename: Optional[str] = None) -> UploadBody:
+    """
+    A multipart/form-data body yields its first file part; any other body is the file itself
+    (name from `filename`). Nothing is spooled: chunks come straight off the request stream.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type == b"multipart/form-data":
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=400, detail="Missing multipart boundary")
+        return await _multipart_file(request, boundary)
+    return UploadBody(filename or "upload", content_type.decode() or "application/octet-stream", request.stream())
+
+async def _multipart_file(request: Request, boundary: bytes) -> UploadBody:
+    # python-multipart's push parser calls back synchronously; data of the file part is collected
+    # per request chunk and handed out after each write, so at most one body chunk is held
+    state = {"field": b"", "value": b"", "in_file": False, "done": False, "file": None}
+    headers: Dict[bytes, bytes] = {}
+    pending: List[bytes] = []
+
+    def on_part_begin():
+        headers.clear()
+
+    def on_header_field(data, start, end):
+        state["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        headers[state["field"].lower()] = state["value"]
+        state["field"] = state["value"] = b""
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(headers.get(b"content-disposition", b""))
+        if state["file"] is None and b"filename" in disposition:
+            state["in_file"] = True
+            content_type = headers.get(b"content-type", b"application/octet-stream").decode()
+            state["file"] = (disposition[b"filename"].decode(errors="replace"), content_type)
+
+    def on_part_data(data, start, end):
+        if state["in_file"]:
+            pending.append(bytes(data[start:end]))
+
+    def on_part_end():
+        if state["in_file"]:
+            state["in_file"] = False
+            state["done"] = True
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin, "on_header_field": on_header_field, "on_header_value": on_header_value,
+        "on_header_end": on_header_end, "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data, "on_part_end": on_part_end,
+    })
+    stream = request.stream().__aiter__()
+
+    # Read until the file part's headers are parsed (form fields before it are skipped)
+    async for chunk in stream:
+        parser.write(chunk)
+        if state["file"] is not None:
+            break
+    if state["file"] is None:
+        raise HTTPException(status_code=400, detail="No file part in the form")
+
+    async def chunks() -> AsyncIterator[bytes]:
+        while True:
+            if pending:
+                data = b"".join(pending)
+                pending.clear()
+                yield data
+            if state["done"]:
+                return
+            try:
+                chunk = await stream.__anext__()
+            except StopAsyncIteration:
+                raise HTTPException(status_code=400, detail="Incomplete multipart body")
+            parser.write(chunk)
+
+    filename, content_type = state["file"]
+    return UploadBody(filename, content_type, chunks())
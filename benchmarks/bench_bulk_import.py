@@ -0,0 +1,71 @@
+# benchmarks/bench_bulk_import.py
+"""
+Users/second through POST /api/user/ (one request per user) vs POST /api/user/bulk (NDJSON).
+
+    python -m benchmarks.bench_bulk_import --rows 2000 --rounds 4
+
+bcrypt dominates both paths at production cost, so --rounds lowers it to expose the
+per-row request/duplicate-check/insert overhead that the bulk path removes.
+"""
+import argparse
+import asyncio
+import json
+import time
+from fastapi import Depends
+from app.main import app
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_unit_of_work, get_user_service
+from app.core.security import password_hasher, set_password_rounds
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.support import InMemoryRoleRepository, create_schema, make_client, sqlite_engine, use_engine
+
+
+def user_rows(prefix: str, count: int):
+    return [{"username": f"{prefix}-{i}", "password": "secret", "email": f"{prefix}-{i}@example.com", "roleId": "role-1"} for i in range(count)]
+
+
+async def run(rows: int, rounds: int, concurrency: int) -> None:
+    set_password_rounds(rounds)
+    engine = sqlite_engine()
+    await create_schema(engine)
+    use_engine(engine)
+    user_service = UserService(UserRepository(InMemoryRoleRepository()))
+    app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+
+    try:
+        async with make_client(app) as client:
+            # Single-row endpoint, `concurrency` requests in flight
+            pending = user_rows("single", rows)
+            start = time.perf_counter()
+
+            async def worker():
+                while pending:
+                    r = await client.post("/api/user/", json=pending.pop())
+                    assert r.status_code == 200, r.text
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            single = time.perf_counter() - start
+
+            # Bulk endpoint, one streamed NDJSON request
+            body = "\n".join(json.dumps(row) for row in user_rows("bulk", rows)).encode()
+            start = time.perf_counter()
+            r = await client.post("/api/user/bulk", content=body, headers={"content-type": "application/x-ndjson"})
+            bulk = time.perf_counter() - start
+            report = r.json()["data"]
+            assert report["created"] == rows, report["failed"]
+    finally:
+        password_hasher.shutdown()
+        await engine.dispose()
+
+    print(f"rows={rows} bcrypt rounds={rounds} single-row concurrency={concurrency}")
+    print(f"single-row: {rows / single:8.0f} users/s ({single:.2f}s)")
+    print(f"bulk:       {rows / bulk:8.0f} users/s ({bulk:.2f}s)  -> {single / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=4, help="bcrypt cost (4 is the minimum)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.rounds, args.concurrency))
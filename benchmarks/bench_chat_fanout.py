@@ -0,0 +1,127 @@
+# benchmarks/bench_chat_fanout.py
+"""
+Chat hub load test: simulated WebSocket clients spread over rooms, with a share of slow consumers.
+Measures delivery latency to the fast clients, frames dropped for slow ones and memory per connection.
+
+    MESSAGE_BROKER_BACKEND=memory python -m benchmarks.bench_chat_fanout --connections 5000 --rooms 50 --messages 20 --slow 0.05
+    MESSAGE_BROKER_BACKEND=memory python -m benchmarks.bench_chat_fanout --policy disconnect
+
+Simulated clients stand in for the socket only (send_text / close); fan-out, queues and slow-consumer
+handling are the hub's own. One real WebSocket round trip through /api/chat/ws is checked first.
+"""
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from starlette.testclient import TestClient
+from app.main import app
+from app.core.security import create_access_token
+from app.hubs.chat_hub import ChatHub
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from benchmarks.support import percentile
+
+
+class SimulatedSocket:
+    """Records when each frame object arrives; slow clients take `delay` seconds per frame"""
+    __slots__ = ("delay", "published_at", "latencies", "frames", "closed_with")
+
+    def __init__(self, delay: float, published_at: dict, latencies: list):
+        self.delay = delay
+        self.published_at = published_at
+        self.latencies = latencies
+        self.frames = set()
+        self.closed_with = None
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+            return
+        self.frames.add(id(data))
+        self.latencies.append(time.perf_counter() - self.published_at[id(data)])
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+def websocket_smoke_test() -> None:
+    """Two authenticated clients over the real endpoint: one sends, both receive"""
+    with TestClient(app) as client:
+        alice, bob = create_access_token({"sub": "alice"}), create_access_token({"sub": "bob"})
+        with client.websocket_connect(f"/api/chat/ws?token={alice}") as a, client.websocket_connect(f"/api/chat/ws?token={bob}") as b:
+            for ws in (a, b):
+                ws.send_text(json.dumps({"action": "join", "room": "lobby"}))
+            a.send_text(json.dumps({"action": "send", "room": "lobby", "text": "hello"}))
+            assert json.loads(a.receive_text())["text"] == json.loads(b.receive_text())["text"] == "hello"
+    print("websocket round trip through /api/chat/ws: ok")
+
+
+async def run(connections: int, rooms: int, messages: int, slow: float, slow_delay: float, policy: str, queue_size: int) -> None:
+    hub = ChatHub(InMemoryMessageBroker(), queue_size=queue_size, policy=policy)
+    await hub.start()
+    published_at, latencies, frames = {}, [], []
+    slow_every = int(1 / slow) if slow else 0
+    sockets = [SimulatedSocket(slow_delay if slow_every and i % slow_every == 0 else 0, published_at, latencies)
+               for i in range(connections)]
+
+    # Memory of the hub side only: the simulated sockets already exist
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    members = []
+    for i, socket in enumerate(sockets):
+        connection = hub.connect(socket, f"user-{i}")
+        hub.join(connection, f"room-{i % rooms}")
+        members.append(connection)
+    await asyncio.sleep(0)  # let every sender task start and park
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    per_connection = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / connections
+
+    # Publish: every room gets `messages` messages, interleaved; each frame is serialized once
+    original_deliver = hub.deliver
+
+    def timed_deliver(room, frame):
+        frames.append(frame)  # keeps ids unique for the whole run
+        published_at[id(frame)] = time.perf_counter()
+        original_deliver(room, frame)
+    hub.deliver = timed_deliver
+
+    start = time.perf_counter()
+    for n in range(messages):
+        for r in range(rooms):
+            await hub.publish(f"room-{r}", "bench", f"message {n}")
+        await asyncio.sleep(0.001)
+    fast = [s for s in sockets if not s.delay]
+    expected = len(fast) * messages
+    while len(latencies) < expected and time.perf_counter() - start < 30:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+
+    slow_connections = [c for c, s in zip(members, sockets) if s.delay]
+    print(f"policy={policy} queue={queue_size} connections={connections} rooms={rooms} "
+          f"(~{connections // rooms} per room), slow clients={len(slow_connections)}")
+    print(f"hub memory per connection: {per_connection / 1024:.2f} KiB (tracemalloc, sender task included)")
+    print(f"delivered {len(latencies)}/{expected} frames to fast clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} frames/s)")
+    print(f"delivery latency: p50={percentile(latencies, 50) * 1000:.2f}ms p95={percentile(latencies, 95) * 1000:.2f}ms "
+          f"p99={percentile(latencies, 99) * 1000:.2f}ms")
+    print(f"distinct frame objects per fast client: {len(fast[0].frames) if fast else 0} for {messages} messages "
+          f"(frames encoded: {len(frames)} for {messages * rooms} messages)")
+    print(f"slow clients: dropped frames={sum(c.dropped for c in slow_connections)}, "
+          f"disconnected={sum(1 for s in sockets if s.closed_with == 1013)}, "
+          f"max queued={max((len(c.queue) for c in slow_connections), default=0)}")
+    await hub.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=5000)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=20, help="messages per room")
+    parser.add_argument("--slow", type=float, default=0.05, help="share of slow clients")
+    parser.add_argument("--slow-delay", type=float, default=0.2, help="seconds a slow client takes per frame")
+    parser.add_argument("--policy", choices=["drop", "coalesce", "disconnect"], default="drop")
+    parser.add_argument("--queue-size", type=int, default=8)
+    args = parser.parse_args()
+    websocket_smoke_test()
+    asyncio.run(run(args.connections, args.rooms, args.messages, args.slow, args.slow_delay, args.policy, args.queue_size))
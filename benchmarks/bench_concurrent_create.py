@@ -0,0 +1,113 @@
+# benchmarks/bench_concurrent_create.py
+"""
+Concurrent creates of the same usernames, and create latency, with insert-first + unique indexes
+vs the old pre-insert duplicate check (OR query on unindexed UserName/Email, then insert).
+
+    python -m benchmarks.bench_concurrent_create --mode insert-first --rows 100000
+    python -m benchmarks.bench_concurrent_create --mode precheck --rows 100000
+
+Each of --names usernames is POSTed by --racers concurrent requests; exactly one may succeed.
+Exits non-zero if any username ends up stored more than once or more than one request succeeded.
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from fastapi import Depends
+from sqlalchemy import func, select, text
+from app.main import app
+from app.application.mappers.mapper_utils import map_to_dto, map_to_entity
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_unit_of_work, get_user_service
+from app.core.security import password_hasher, set_password_rounds
+from app.domain.dtos.user.UserCreate import UserCreate
+from app.domain.dtos.user.UserResponse import UserResponse
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.bench_pagination import seed
+from benchmarks.support import InMemoryRoleRepository, make_client, percentile, sqlite_engine, use_engine
+
+
+class PrecheckUserService(UserService):
+    """create_user as it was: look for a duplicate first, then insert"""
+
+    async def create_user(self, user_data: UserCreate) -> UserResponse:
+        existing = await self.repo.get_by_username_or_email(username=user_data.username, email=user_data.email)
+        if existing:
+            raise AlreadyExistsException(f"Username or email already taken: {user_data.username}")
+        saved_user = await self.repo.add_user(map_to_entity(User, user_data))
+        return map_to_dto(UserResponse, saved_user)
+
+
+def payload(name: str) -> dict:
+    return {"username": name, "password": "secret", "email": f"{name}@example.com", "roleId": "role-1"}
+
+
+async def run(mode: str, rows: int, names: int, racers: int, creates: int) -> bool:
+    set_password_rounds(4)  # keep bcrypt out of the way; this measures the create path
+    engine = sqlite_engine()
+    try:
+        print(f"seeding {rows} users ...")
+        await seed(engine, rows)
+        if mode == "precheck":
+            # The schema as it was: no unique indexes on UserName / Email
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP INDEX UX_Users_UserName"))
+                await conn.execute(text("DROP INDEX UX_Users_Email"))
+        use_engine(engine)
+        roles = InMemoryRoleRepository([Role(id="role-1", name="admin")])
+        service_class = PrecheckUserService if mode == "precheck" else UserService
+        user_service = service_class(UserRepository(roles))
+        app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+
+        async with make_client(app) as client:
+            # Latency of sequential, non-conflicting creates
+            latencies = []
+            for i in range(creates):
+                start = time.perf_counter()
+                r = await client.post("/api/user/", json=payload(f"latency-{i}"))
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert r.status_code == 200, r.text
+
+            # Races: every username posted by `racers` requests at once
+            statuses, errors = Counter(), Counter()
+            for n in range(names):
+                responses = await asyncio.gather(
+                    *(client.post("/api/user/", json=payload(f"race-{n}")) for _ in range(racers)),
+                    return_exceptions=True,
+                )
+                for response in responses:
+                    statuses[response.status_code if not isinstance(response, Exception) else type(response).__name__] += 1
+                    if not isinstance(response, Exception) and response.status_code == 500:
+                        errors[response.json()["errors"][:60]] += 1
+
+        async with engine.connect() as conn:
+            stored = (await conn.execute(
+                select(UserModel.username, func.count()).where(UserModel.username.like("race-%")).group_by(UserModel.username)
+            )).all()
+        duplicated = sum(1 for _, count in stored if count > 1)
+        print(f"mode={mode} seeded={rows}")
+        print(f"create latency: p50={percentile(latencies, 50):.2f}ms p99={percentile(latencies, 99):.2f}ms (n={creates})")
+        print(f"races: {names} usernames x {racers} concurrent requests -> statuses {dict(statuses)}")
+        print(f"usernames stored more than once: {duplicated}")
+        for error, count in errors.items():
+            print(f"  500 x{count}: {error}")
+        return duplicated == 0 and statuses[200] == names
+    finally:
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=["insert-first", "precheck"], default="insert-first")
+    parser.add_argument("--rows", type=int, default=100000, help="users seeded before measuring")
+    parser.add_argument("--names", type=int, default=50)
+    parser.add_argument("--racers", type=int, default=8)
+    parser.add_argument("--creates", type=int, default=200)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args.mode, args.rows, args.names, args.racers, args.creates)) else 1)
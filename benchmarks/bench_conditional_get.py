@@ -0,0 +1,206 @@
+# benchmarks/bench_conditional_get.py
+"""
+Polling GET /api/role/, GET /api/user/{id} and GET /api/user/ the way the UI does, with and without
+If-None-Match, while a writer adds a user every --write-interval seconds and a role every fourth write.
+Counts SQL statements (SQLite stand-in) and role store reads (an in-memory stand-in for Mongo behind
+the role cache) per request, and checks that every write changes the ETags it should.
+
+    python -m benchmarks.bench_conditional_get --users 2000 --pollers 20 --seconds 5
+
+Plain polls pay a full read and serialization each time; conditional polls answer 304 from the
+collection versions until something is written.
+"""
+import argparse
+import asyncio
+import time
+from fastapi import Depends
+from sqlalchemy import event
+from app.main import app
+from app.application.services.role_service import RoleService
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_collection_versions, get_role_service, get_unit_of_work, get_user_service
+from app.core.security import password_hasher, set_password_rounds
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.infrastructure.cache.role_cache import RoleCache
+from app.infrastructure.db.unit_of_work import UnitOfWork
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from app.infrastructure.repositories.cached_role_repository import CachedRoleRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.support import InMemoryRoleRepository, create_schema, make_client, percentile, sqlite_engine, use_engine
+
+
+class Counted:
+    def __init__(self):
+        self.sql = 0
+        self.role_reads = 0
+
+
+class CountingRoleRepository(InMemoryRoleRepository):
+    """The role store behind the cache; list_roles always reaches it"""
+
+    def __init__(self, roles, counted: Counted):
+        super().__init__(roles)
+        self.counted = counted
+
+    async def list_roles(self, *args, **kwargs) -> dict:
+        self.counted.role_reads += 1
+        return await super().list_roles(*args, **kwargs)
+
+    async def get_by_id(self, role_id: str):
+        self.counted.role_reads += 1
+        return await super().get_by_id(role_id)
+
+
+async def poll(client, urls, seconds: float, pollers: int, conditional: bool, writer) -> dict:
+    statuses, latencies = {200: 0, 304: 0}, []
+    deadline = time.perf_counter() + seconds
+
+    async def poller():
+        etags = {}
+        while time.perf_counter() < deadline:
+            for url in urls:
+                headers = {"if-none-match": etags[url]} if conditional and url in etags else {}
+                start = time.perf_counter()
+                response = await client.get(url, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code in (200, 304), response.text
+                statuses[response.status_code] += 1
+                etags[url] = response.headers["etag"]
+
+    start = time.perf_counter()
+    writes = asyncio.create_task(writer(deadline))
+    await asyncio.gather(*(poller() for _ in range(pollers)))
+    elapsed = time.perf_counter() - start
+    await writes
+    return {"requests": len(latencies), "rps": len(latencies) / elapsed, "p50_ms": percentile(latencies, 50) * 1000,
+            "statuses": statuses, "writes": writes.result()}
+
+
+async def check_semantics(client, user_id: str, versions: CollectionVersions, broker: InMemoryMessageBroker) -> None:
+    listing = await client.get("/api/user/", params={"page_size": 20})
+    etag, total = listing.headers["etag"], listing.json()["data"]["total"]
+    assert etag.startswith('W/"') and listing.headers["cache-control"] == "no-cache"
+    not_modified = await client.get("/api/user/", params={"page_size": 20}, headers={"if-none-match": etag})
+    assert not_modified.status_code == 304 and not_modified.content == b"" and not_modified.headers["etag"] == etag
+    other_page = await client.get("/api/user/", params={"page_size": 20, "page": 2}, headers={"if-none-match": etag})
+    assert other_page.status_code == 200, "an ETag must not validate other query parameters"
+
+    created = await client.post("/api/user/", json={"username": "etag-check", "password": "secret",
+                                                    "email": "etag-check@example.com", "roleId": "role-1"})
+    assert created.status_code == 200, created.text
+    after = await client.get("/api/user/", params={"page_size": 20}, headers={"if-none-match": etag})
+    assert after.status_code == 200 and after.json()["data"]["total"] == total + 1, "a new user must change the list ETag"
+
+    user = await client.get(f"/api/user/{user_id}")
+    assert (await client.post("/api/role/", json={"id": "", "name": "etag-check-role", "isActive": True})).status_code == 200
+    again = await client.get(f"/api/user/{user_id}", headers={"if-none-match": user.headers["etag"]})
+    assert again.status_code == 200, "users embed roleName: a role write must change user ETags"
+
+    # A duplicate is rejected and rolled back: nothing changed, so the ETag still validates
+    current = (await client.get(f"/api/user/{user_id}")).headers["etag"]
+    duplicate = await client.post("/api/user/", json={"username": "etag-check", "password": "secret",
+                                                      "email": "etag-check@example.com", "roleId": "role-1"})
+    assert duplicate.status_code == 400, duplicate.text
+    assert (await client.get(f"/api/user/{user_id}", headers={"if-none-match": current})).status_code == 304
+
+    # Writes in a unit of work that rolls back never bump
+    before = versions.current("users")
+    try:
+        async with UnitOfWork():
+            await versions.changed("users")
+            raise RuntimeError("rolled back")
+    except RuntimeError:
+        pass
+    assert versions.current("users") == before
+
+    # A second worker on the same broker converges on the first one's tokens
+    other = CollectionVersions(broker)
+    await other.start()
+    assert other.current("users") == versions.current("users")
+    await versions.bump("users")
+    assert other.current("users") == versions.current("users") != before
+    print("ETag per path+query, 304 without body, write -> 200, role write -> user ETags change, "
+          "rejected write keeps ETags, rollback does not bump, workers converge: ok")
+
+
+async def run(users: int, pollers: int, seconds: float, write_interval: float) -> None:
+    set_password_rounds(4)  # keep bcrypt out of the writer's way
+    engine = sqlite_engine()
+    await create_schema(engine)
+    use_engine(engine)
+    counted = Counted()
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: setattr(counted, "sql", counted.sql + 1))
+
+    broker = InMemoryMessageBroker()
+    versions = CollectionVersions(broker)
+    await versions.start()
+    role_store = CountingRoleRepository([Role(id=f"role-{i}", name=f"role-{i}") for i in range(1, 6)], counted)
+    roles = CachedRoleRepository(role_store, RoleCache(), broker, versions)
+    await roles.start()
+    user_repository = UserRepository(roles, versions)
+    user_service, role_service = UserService(user_repository), RoleService(roles)
+    app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+    app.dependency_overrides[get_role_service] = lambda uow=Depends(get_unit_of_work): role_service
+    app.dependency_overrides[get_collection_versions] = lambda: versions
+    try:
+        seeded = await user_repository.add_users([
+            User(id=None, username=f"user-{i:06d}", password="secret", email=f"user-{i}@example.com",
+                 roleId=f"role-{i % 5 + 1}") for i in range(users)])
+        user_id = seeded[0].id
+        urls = ["/api/role/", f"/api/user/{user_id}", "/api/user/?page_size=20"]
+        written = [0]
+
+        async with make_client(app) as client:
+            await check_semantics(client, user_id, versions, broker)
+
+            async def writer(deadline: float) -> int:
+                count = 0
+                while time.perf_counter() + write_interval < deadline:
+                    await asyncio.sleep(write_interval)
+                    written[0] += 1
+                    n = written[0]
+                    response = await client.post("/api/user/", json={"username": f"polled-{n}", "password": "secret",
+                                                                      "email": f"polled-{n}@example.com", "roleId": "role-1"})
+                    assert response.status_code == 200, response.text
+                    if n % 4 == 0:
+                        assert (await client.post("/api/role/", json={"id": "", "name": f"polled-role-{n}", "isActive": True})).status_code == 200
+                    count += 1
+                return count
+
+            print(f"{users} users, {pollers} pollers x {len(urls)} URLs for {seconds:.0f}s, "
+                  f"a write every {write_interval}s (a role every 4th)")
+            print(f"{'mode':<12} {'req/s':>8} {'p50 ms':>7} {'200':>7} {'304':>7} {'SQL/req':>8} {'role reads/req':>15}")
+            rows = {}
+            for label, conditional in (("plain", False), ("conditional", True)):
+                sql, role_reads = counted.sql, counted.role_reads
+                result = await poll(client, urls, seconds, pollers, conditional, writer)
+                # Includes the writer's statements, the same in both modes
+                requests = result["requests"]
+                sql_per = (counted.sql - sql) / requests
+                reads_per = (counted.role_reads - role_reads) / requests
+                rows[label] = (sql_per, reads_per, result)
+                print(f"{label:<12} {result['rps']:>8,.0f} {result['p50_ms']:>7.1f} {result['statuses'][200]:>7,} "
+                      f"{result['statuses'][304]:>7,} {sql_per:>8.3f} {reads_per:>15.3f}")
+            plain, conditional = rows["plain"], rows["conditional"]
+            print(f"conditional polling: {plain[0] / max(conditional[0], 1e-9):.0f}x fewer SQL statements and "
+                  f"{plain[1] / max(conditional[1], 1e-9):.0f}x fewer role store reads per request "
+                  f"({conditional[2]['writes']} writes during the run), "
+                  f"{conditional[2]['rps'] / plain[2]['rps']:.1f}x the request rate")
+    finally:
+        app.dependency_overrides.pop(get_user_service, None)
+        app.dependency_overrides.pop(get_role_service, None)
+        app.dependency_overrides.pop(get_collection_versions, None)
+        password_hasher.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--pollers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5.0, help="per mode")
+    parser.add_argument("--write-interval", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.pollers, args.seconds, args.write_interval))
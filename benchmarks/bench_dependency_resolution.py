@@ -0,0 +1,92 @@
+# benchmarks/bench_dependency_resolution.py
+"""
+Dependency-resolution overhead per request: UserService + RoleService as the old punq setup built them
+(everything transient, signatures inspected on every resolve) vs the Container with lifetimes.
+
+    python -m benchmarks.bench_dependency_resolution --iterations 20000
+
+"request scope" is the full per-request path of app/core/dependencies.py: open a scope, enter the
+unit of work (no SQL issued, so no connection is opened), resolve the services, close the scope.
+"""
+import argparse
+import asyncio
+import time
+from app.core.container import Container, Lifetime
+from app.core.di_container import container
+from app.application.services.user_service import UserService
+from app.application.services.role_service import RoleService
+from app.infrastructure.cache.role_cache import RoleCache
+from app.infrastructure.db.unit_of_work import UnitOfWork
+from app.infrastructure.interfaces.i_message_broker import IMessageBroker
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+from app.infrastructure.interfaces.i_user_repository import IUserRepository
+from app.infrastructure.repositories.cached_role_repository import CachedRoleRepository
+from app.infrastructure.repositories.role_repository import RoleRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+
+
+def per_request_us(iterations: int, resolve) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        resolve(UserService)
+        resolve(RoleService)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def transient_container() -> Container:
+    """The same graph with the old lifetimes: transient everywhere except the role cache repository"""
+    transient = Container()
+    transient.register(IMessageBroker, instance=container.resolve(IMessageBroker))
+    transient.register(RoleCache, instance=container.resolve(RoleCache))
+    transient.register(IUserRepository, UserRepository)
+    transient.register(RoleRepository, RoleRepository)
+    transient.register(IRoleRepository, CachedRoleRepository, lifetime=Lifetime.SINGLETON)
+    transient.register(UserService)
+    transient.register(RoleService)
+    transient.build()
+    return transient
+
+
+def punq_container():
+    try:
+        import punq
+    except ImportError:
+        return None
+    old = punq.Container()
+    old.register(IMessageBroker, instance=container.resolve(IMessageBroker))
+    old.register(RoleCache, instance=container.resolve(RoleCache))
+    old.register(IUserRepository, UserRepository)
+    old.register(RoleRepository, RoleRepository)
+    old.register(IRoleRepository, CachedRoleRepository, scope=punq.Scope.singleton)
+    old.register(UserService, UserService)
+    old.register(RoleService, RoleService)
+    return old
+
+
+async def request_scope_us(iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        async with container.create_scope() as scope:
+            await scope.enter(UnitOfWork)
+            scope.resolve(UserService)
+            scope.resolve(RoleService)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int) -> None:
+    print(f"iterations={iterations} (UserService + RoleService per request)")
+    old = punq_container()
+    if old is not None:
+        print(f"punq, transient (before)        {per_request_us(iterations, old.resolve):8.2f}us/request")
+    else:
+        print("punq, transient (before)        not installed")
+    print(f"Container, transient            {per_request_us(iterations, transient_container().resolve):8.2f}us/request")
+    print(f"Container, singletons           {per_request_us(iterations, container.resolve):8.2f}us/request")
+    print(f"Container, request scope + UoW  {asyncio.run(request_scope_us(iterations)):8.2f}us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.iterations)
@@ -0,0 +1,63 @@
+# benchmarks/bench_entity_memory.py
+"""
+Memory held by 100k users as __dict__ entities (before), slotted User entities, and one columnar UserBatch.
+
+    python -m benchmarks.bench_entity_memory --rows 100000
+
+Field values are built up front and shared by every case, so only the container cost is measured.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from app.domain.entities.user import User
+from app.domain.entities.user_batch import UserBatch
+
+
+class DictUser:
+    """The User entity as it was before: a plain class with a per-instance __dict__"""
+
+    def __init__(self, id=None, username=None, password=None, hashed_password=None, email=None,
+                 roleId=None, roleName=None, createDate=None, isActive=True):
+        self.id = id
+        self.username = username
+        self.password = password
+        self.hashed_password = hashed_password
+        self.email = email
+        self.roleId = roleId
+        self.roleName = roleName
+        self.createDate = createDate or datetime.now(timezone.utc)
+        self.isActive = isActive
+
+
+def measure(label: str, build, rows: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    print(f"{label:24} {current / 1024 / 1024:7.2f}MB per {rows // 1000}k users  {current / rows:6.0f}B/user  built in {elapsed * 1000:6.0f}ms")
+
+
+def run(rows: int) -> None:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    data = [
+        (f"id-{i}", f"user-{i}", f"user-{i}@example.com", f"role-{i % 5}", f"role-{i % 5}", base + timedelta(seconds=i), True)
+        for i in range(rows)
+    ]
+    fields = UserBatch.FIELDS
+
+    measure("__dict__ class (before)", lambda: [DictUser(**dict(zip(fields, row))) for row in data], rows)
+    measure("slotted User", lambda: [User(**dict(zip(fields, row))) for row in data], rows)
+    measure("UserBatch (columnar)", lambda: UserBatch.from_rows(data), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,66 @@
+# benchmarks/bench_export_memory.py
+"""
+Streams GET /api/user/export over a large synthetic table and fails if RSS grows past a ceiling.
+
+    python -m benchmarks.bench_export_memory --rows 1000000 --ceiling-mb 64 --format csv
+"""
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+from app.main import app
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_user_service
+from app.domain.entities.role import Role
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.bench_pagination import seed
+from benchmarks.support import InMemoryRoleRepository, asgi_stream, rss_mb, sqlite_engine, use_engine
+
+
+async def run(rows: int, ceiling_mb: float, fmt: str, batch_size: int, db_path: str) -> bool:
+    fresh = not os.path.exists(db_path)
+    engine = sqlite_engine(db_path)
+    try:
+        if fresh:
+            print(f"seeding {rows} users into {db_path} ...")
+            await seed(engine, rows)
+        use_engine(engine)
+        roles = InMemoryRoleRepository([Role(id=f"role-{i}", name=f"role-{i}") for i in range(5)])
+        user_service = UserService(UserRepository(roles))
+        app.dependency_overrides[get_user_service] = lambda: user_service
+
+        gc.collect()
+        baseline = peak = rss_mb()
+        exported_bytes = lines = 0
+
+        def on_chunk(chunk: bytes) -> None:
+            nonlocal peak, exported_bytes, lines
+            exported_bytes += len(chunk)
+            lines += chunk.count(b"\n")
+            peak = max(peak, rss_mb())
+
+        start = time.perf_counter()
+        status = await asgi_stream(app, "/api/user/export", f"format={fmt}&batch_size={batch_size}", on_chunk)
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.dispose()
+
+    growth = peak - baseline
+    print(f"status={status} format={fmt} lines={lines} bytes={exported_bytes / 1e6:.0f}MB in {elapsed:.1f}s "
+          f"({lines / elapsed:.0f} rows/s)")
+    print(f"RSS baseline={baseline:.0f}MB peak={peak:.0f}MB growth={growth:.1f}MB ceiling={ceiling_mb}MB")
+    return status == 200 and growth <= ceiling_mb
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--ceiling-mb", type=float, default=64)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--db", default="bench_pagination.db")
+    args = parser.parse_args()
+    ok = asyncio.run(run(args.rows, args.ceiling_mb, args.format, args.batch_size, args.db))
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,136 @@
+# benchmarks/bench_file_download.py
+"""
+Downloads from /api/files/{id}: correctness of Range / multi-range / If-Range / 416 and the
+conditional 304 paths, then throughput of full downloads and request rates for 200, 206 and 304.
+
+    python -m benchmarks.bench_file_download --size-mb 256
+
+The 304 check runs with the blob moved away, proving conditional requests never touch the file.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from app.main import app
+from app.core.dependencies import get_file_manager
+from app.core.file_manager import FileManager
+from benchmarks.support import asgi_request, asgi_upload
+
+
+def blocks(size: int, block: bytes):
+    for start in range(0, size, len(block)):
+        yield block[: min(len(block), size - start)]
+
+
+async def upload(size: int, seed: bytes) -> str:
+    block = hashlib.sha256(seed).digest() * 2048  # 64 KiB
+    status, body = await asgi_upload(app, "POST", "/api/files/", blocks(size, block),
+                                     headers=[(b"content-type", b"application/octet-stream")], query="filename=blob.bin")
+    assert status == 200, body
+    return json.loads(body)["data"]["id"]
+
+
+async def check(file_id: str, manager: FileManager, size: int) -> None:
+    path = f"/api/files/{file_id}"
+    with open(manager.object_path(file_id), "rb") as f:
+        content = f.read()
+
+    status, headers, body = await asgi_request(app, "GET", path)
+    assert status == 200 and body == content and headers["etag"] == f'"{file_id}"', (status, headers)
+    assert headers["accept-ranges"] == "bytes" and "immutable" in headers["cache-control"]
+    etag, last_modified = headers["etag"], headers["last-modified"]
+
+    status, headers, body = await asgi_request(app, "HEAD", path)
+    assert status == 200 and body == b"" and headers["content-length"] == str(size)
+
+    status, headers, body = await asgi_request(app, "GET", path, [(b"range", b"bytes=100-199")])
+    assert status == 206 and body == content[100:200] and headers["content-range"] == f"bytes 100-199/{size}"
+
+    status, headers, body = await asgi_request(app, "GET", path, [(b"range", b"bytes=-10")])
+    assert status == 206 and body == content[-10:]
+
+    status, headers, body = await asgi_request(app, "GET", path, [(b"range", b"bytes=0-9,1000-1009")])
+    assert status == 206 and headers["content-type"].startswith("multipart/byteranges; boundary=")
+    assert "content-range" not in headers and content[:10] in body and content[1000:1010] in body
+
+    status, headers, _ = await asgi_request(app, "GET", path, [(b"range", f"bytes={size}-".encode())])
+    assert status == 416 and headers["content-range"] == f"*/{size}"
+
+    status, _, body = await asgi_request(app, "GET", path, [(b"range", b"bytes=0-9"), (b"if-range", b'"stale"')])
+    assert status == 200 and len(body) == size  # If-Range mismatch: whole file
+    status, _, body = await asgi_request(app, "GET", path, [(b"range", b"bytes=0-9"), (b"if-range", etag.encode())])
+    assert status == 206 and body == content[:10]
+
+    status, _, body = await asgi_request(app, "GET", path, extensions={"http.response.pathsend": {}})
+    assert status == 200 and body.startswith(b"<pathsend:")  # zero-copy hand-off to the server
+
+    # Conditional requests: answered from the index, with the blob moved away
+    blob = manager.object_path(file_id)
+    os.rename(blob, blob + ".away")
+    try:
+        for header in ((b"if-none-match", etag.encode()), (b"if-none-match", b'"other", W/' + etag.encode()),
+                       (b"if-none-match", b"*"), (b"if-modified-since", last_modified.encode())):
+            status, headers, body = await asgi_request(app, "GET", path, [header])
+            assert status == 304 and body == b"" and headers["etag"] == etag, (header, status)
+    finally:
+        os.rename(blob + ".away", blob)
+    status, _, _ = await asgi_request(app, "GET", path, [(b"if-none-match", b'"other"'),
+                                                         (b"if-modified-since", last_modified.encode())])
+    assert status == 200  # If-None-Match wins over If-Modified-Since
+
+    status, _, _ = await asgi_request(app, "GET", "/api/files/" + "0" * 64)
+    assert status == 404
+    status, _, _ = await asgi_request(app, "GET", "/api/files/..%2Fetc")
+    assert status == 404
+    print("range / multi-range / If-Range / 416 / pathsend / 304 / 404 checks: ok")
+
+
+async def rate(label: str, path: str, headers, seconds: float = 2.0) -> None:
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        status, _, _ = await asgi_request(app, "GET", path, headers)
+        assert status in (200, 206, 304), status
+        count += 1
+    print(f"{label:<34} {count / (time.perf_counter() - start):>8,.0f} req/s")
+
+
+async def run(size_mb: int) -> None:
+    root = tempfile.mkdtemp(prefix="bench-download-")
+    size = size_mb * 1024 * 1024
+    manager = FileManager(root=root, max_size=size)
+    app.dependency_overrides[get_file_manager] = lambda: manager
+    try:
+        big = await upload(size, b"big")
+        small = await upload(4096, b"small")
+
+        # A fresh manager (another worker, or after a restart) fills its index from disk on first use
+        manager = FileManager(root=root, max_size=size)
+        await check(small, manager, 4096)
+
+        for _ in range(2):
+            start = time.perf_counter()
+            status, _, body = await asgi_request(app, "GET", f"/api/files/{big}")
+            elapsed = time.perf_counter() - start
+            assert status == 200 and len(body) == size
+            del body
+        print(f"full download of {size_mb} MiB (chunked read, no pathsend): {size_mb / elapsed:,.0f} MiB/s")
+
+        small_path = f"/api/files/{small}"
+        etag = f'"{small}"'.encode()
+        await rate("200 GET 4 KiB", small_path, [])
+        await rate("206 GET bytes=0-1023", small_path, [(b"range", b"bytes=0-1023")])
+        await rate("304 If-None-Match", small_path, [(b"if-none-match", etag)])
+    finally:
+        app.dependency_overrides.pop(get_file_manager, None)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(run(args.size_mb))
@@ -0,0 +1,160 @@
+# benchmarks/bench_image_derivatives.py
+"""
+Image derivatives through /api/files/{id}/derivative: event-loop lag while variants render (pool vs
+rendering inline), single-flight under a burst for one variant, cache hit / 304 rates and LRU eviction.
+
+    python -m benchmarks.bench_image_derivatives --width 4000 --height 3000 --burst 50
+
+The loop lag is the worst delay of a 5ms ticker running next to the renders: what every other request
+on the worker would wait.
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from PIL import Image
+from app.main import app
+from app.config import settings
+from app.core.dependencies import get_derivative_manager, get_file_manager
+from app.core.file_manager import FileManager
+from app.core.image_derivatives import DerivativeManager, DerivativeSpec, render_derivative
+from benchmarks.support import asgi_request, asgi_upload
+
+
+def sample_jpeg(width: int, height: int) -> bytes:
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge("RGB", (gradient, gradient.rotate(90, expand=False), gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def upload(data: bytes, content_type: bytes) -> str:
+    status, body = await asgi_upload(app, "POST", "/api/files/", [data], headers=[(b"content-type", content_type)],
+                                     query="filename=photo.jpg")
+    assert status == 200, body
+    return json.loads(body)["data"]["id"]
+
+
+class LoopLag:
+    """Worst lateness of a 5ms ticker while the block runs"""
+
+    async def _tick(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            self.worst = max(self.worst, time.perf_counter() - start - 0.005)
+
+    async def __aenter__(self):
+        self.worst = 0.0
+        self._task = asyncio.create_task(self._tick())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+
+
+async def run(width: int, height: int, burst: int) -> None:
+    root = tempfile.mkdtemp(prefix="bench-derivatives-")
+    files = FileManager(root=root, max_size=64 * 1024 * 1024)
+    derivatives = DerivativeManager(files, max_workers=2)
+    app.dependency_overrides[get_file_manager] = lambda: files
+    app.dependency_overrides[get_derivative_manager] = lambda: derivatives
+    try:
+        data = sample_jpeg(width, height)
+        print(f"source: {width}x{height} JPEG, {len(data) / 1024:.0f} KiB")
+        file_id = await upload(data, b"image/jpeg")
+        thumbnail = derivatives.derivative_path(file_id, DerivativeSpec(256, 256, "cover"))
+        for _ in range(500):
+            if os.path.exists(thumbnail):
+                break
+            await asyncio.sleep(0.01)
+        assert os.path.exists(thumbnail), "upload did not pre-render the thumbnail"
+        print("thumbnail pre-rendered on upload: ok")
+
+        # Inline rendering (what the request asked us not to do) vs the pool
+        specs = [DerivativeSpec(w, w) for w in (300, 500, 700, 900)]
+        source = files.object_path(file_id)
+        async with LoopLag() as inline:
+            for spec in specs:
+                render_derivative(source, os.path.join(root, "inline." + spec.format), spec.width, spec.height,
+                                  spec.fit, spec.format, spec.quality)
+                await asyncio.sleep(0)
+        async with LoopLag() as pooled:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(asgi_request(app, "GET", f"/api/files/{file_id}/derivative",
+                                                          query=f"width={spec.width}") for spec in specs))
+            pooled_elapsed = time.perf_counter() - start
+        assert all(status == 200 for status, _, _ in results), [r[:2] for r in results]
+        print(f"loop lag while rendering {len(specs)} variants: inline {inline.worst * 1000:.0f}ms, "
+              f"process pool {pooled.worst * 1000:.0f}ms ({pooled_elapsed * 1000 / len(specs):.0f}ms per render)")
+
+        # Burst for one new variant: one render, everyone gets the same bytes
+        counted = []
+        original = derivatives._render
+
+        async def counting_render(*args):
+            counted.append(1)
+            return await original(*args)
+        derivatives._render = counting_render
+        results = await asyncio.gather(*(asgi_request(app, "GET", f"/api/files/{file_id}/derivative",
+                                                      query="width=1200&format=jpeg") for _ in range(burst)))
+        derivatives._render = original
+        assert all(status == 200 for status, _, _ in results) and len({body for _, _, body in results}) == 1
+        assert len(counted) == 1 and derivatives._in_flight == 0, counted
+        print(f"burst of {burst} requests for one new variant: {len(counted)} render")
+
+        status, headers, body = results[0]
+        with Image.open(io.BytesIO(body)) as image:
+            assert image.format == "JPEG" and max(image.size) == 1200, image.size
+        etag = headers["etag"].encode()
+        for label, extra in (("cache hit", []), ("304 If-None-Match", [(b"if-none-match", etag)])):
+            count, start = 0, time.perf_counter()
+            while time.perf_counter() - start < 1.0:
+                status, _, _ = await asgi_request(app, "GET", f"/api/files/{file_id}/derivative", extra,
+                                                  query="width=1200&format=jpeg")
+                assert status in (200, 304)
+                count += 1
+            print(f"{label:<18} {count / (time.perf_counter() - start):>7,.0f} req/s")
+
+        status, _, _ = await asgi_request(app, "GET", f"/api/files/{file_id}/derivative", query="preset=nope")
+        assert status == 400
+        text_id = await upload(b"not an image", b"text/plain")
+        status, _, _ = await asgi_request(app, "GET", f"/api/files/{text_id}/derivative", query="preset=small")
+        assert status == 415
+        fake_id = await upload(b"not an image either", b"image/png")
+        status, _, _ = await asgi_request(app, "GET", f"/api/files/{fake_id}/derivative", query="preset=small")
+        assert status == 415
+        print("bad preset 400 / non-image 415: ok")
+
+        # LRU: a budget of ~3 variants; the most recently used survive
+        budget = 3 * os.path.getsize(derivatives.derivative_path(file_id, DerivativeSpec(300, settings.IMAGE_MAX_DIMENSION))) + 1024
+        small = DerivativeManager(FileManager(root=root), max_workers=1, cache_bytes=budget)
+        app.dependency_overrides[get_derivative_manager] = lambda: small
+        for w in (300, 310, 320, 330, 340, 300):
+            status, _, _ = await asgi_request(app, "GET", f"/api/files/{file_id}/derivative", query=f"width={w}")
+            assert status == 200
+        on_disk = sum(os.path.getsize(entry.path) for entry in small._entries.values())
+        kept = sorted(int(os.path.basename(entry.path).split("x")[0]) for entry in small._entries.values())
+        assert small.cache_size == on_disk <= budget and 300 in kept and 340 in kept, (kept, small.cache_size, budget)
+        print(f"LRU eviction: budget {budget / 1024:.0f} KiB, kept widths {kept}, {small.cache_size / 1024:.0f} KiB on disk")
+        small.shutdown()
+    finally:
+        derivatives.shutdown()
+        app.dependency_overrides.pop(get_file_manager, None)
+        app.dependency_overrides.pop(get_derivative_manager, None)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--burst", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.width, args.height, args.burst))
@@ -0,0 +1,131 @@
+# benchmarks/bench_job_pipeline.py
+"""
+User import as a background job (POST /api/jobs/user-import, then polling GET /api/jobs/{id}) vs the
+inline POST /api/user/bulk, without Redis: memory:// broker, cache+memory:// result backend and a
+Celery worker thread in this process. Also runs the same job in eager mode (the test setup) and
+checks that a failing chunk fails the job.
+
+    python -m benchmarks.bench_job_pipeline --rows 5000 --chunk-size 500 --rounds 4
+
+The job request returns once the chunks are queued; the inline request holds the connection until
+every row is written.
+"""
+import os
+
+# Before the app is imported: the Celery app is configured from settings at import
+os.environ.setdefault("CELERY_BROKER_URL", "memory://")
+os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
+
+import argparse
+import asyncio
+import json
+import time
+from celery.contrib.testing.worker import start_worker
+from fastapi import Depends
+from app.main import app
+from app.application.services.job_service import JobService
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_job_service, get_unit_of_work, get_user_service
+from app.core.di_container import container
+from app.core.security import password_hasher, set_password_rounds
+from app.infrastructure.jobs.celery_app import celery_app
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.support import InMemoryRoleRepository, create_schema, make_client, sqlite_engine, use_engine
+
+
+def ndjson(prefix: str, count: int) -> bytes:
+    rows = [{"username": f"{prefix}-{i}", "password": "secret", "email": f"{prefix}-{i}@example.com",
+             "roleId": "role-1"} for i in range(count)]
+    rows[1] = {"username": f"{prefix}-no-password"}  # rejected at submission
+    rows[2] = dict(rows[0], email=f"{prefix}-dup@example.com")  # duplicate username, rejected by its chunk
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+async def submit(client, body: bytes) -> dict:
+    start = time.perf_counter()
+    response = await client.post("/api/jobs/user-import", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 202, response.text
+    job = response.json()["data"]
+    job["submitSeconds"] = time.perf_counter() - start
+    return job
+
+
+async def wait(client, job_id: str, timeout: float = 300.0) -> tuple:
+    """Poll until the job is done; returns the final status and the chunksDone values seen on the way"""
+    seen, deadline = [], time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        job = (await client.get(f"/api/jobs/{job_id}")).json()["data"]
+        if not seen or seen[-1] != job["chunksDone"]:
+            seen.append(job["chunksDone"])
+        if job["state"] in ("succeeded", "failed"):
+            return job, seen
+        await asyncio.sleep(0.02)
+    raise TimeoutError(job_id)
+
+
+class FailingUserService(UserService):
+    async def bulk_create_users(self, rows, batch_size: int = 1000):
+        raise RuntimeError("database went away")
+
+
+async def run(rows: int, chunk_size: int, rounds: int) -> None:
+    set_password_rounds(rounds)
+    engine = sqlite_engine()
+    await create_schema(engine)
+    use_engine(engine)
+    user_service = UserService(UserRepository(InMemoryRoleRepository()))
+    container.register(UserService, instance=user_service)  # what the tasks resolve
+    jobs = JobService(chunk_size=chunk_size)
+    app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+    app.dependency_overrides[get_job_service] = lambda: jobs
+    try:
+        async with make_client(app) as client:
+            start = time.perf_counter()
+            response = await client.post("/api/user/bulk", content=ndjson("inline", rows),
+                                         headers={"content-type": "application/x-ndjson"})
+            inline = time.perf_counter() - start
+            assert response.status_code == 200 and response.json()["data"]["created"] == rows - 2, response.text[:300]
+
+            with start_worker(celery_app, pool="solo", perform_ping_check=False, shutdown_timeout=30):
+                job = await submit(client, ndjson("job", rows))
+                assert job["state"] in ("queued", "running") and job["rows"] == rows, job
+                done, seen = await wait(client, job["id"])
+                total = time.perf_counter() - start - inline
+            report = done["result"]
+            assert done["state"] == "succeeded" and done["rowsDone"] == rows and done["chunksDone"] == done["chunks"], done
+            assert report["total"] == rows and report["created"] == rows - 2 and report["failed"] == 2, report
+            assert [r["index"] for r in report["results"]] == list(range(rows))
+            print(f"rows={rows} chunk size={chunk_size} bcrypt rounds={rounds}")
+            print(f"inline POST /api/user/bulk: request held {inline:.2f}s")
+            print(f"job: POST answered 202 in {job['submitSeconds'] * 1000:.0f}ms, {done['chunks']} chunks done after "
+                  f"{total:.2f}s; progress seen {seen}")
+            print(f"job report: {report['created']} created, {report['failed']} failed (indices "
+                  f"{[r['index'] for r in report['results'] if not r['success']]})")
+
+            # Eager mode, as in tests: the job has run by the time the 202 comes back
+            celery_app.conf.task_always_eager = True
+            try:
+                job = await submit(client, ndjson("eager", 50))
+                assert job["state"] == "succeeded" and job["result"]["created"] == 48, job
+                container.register(UserService, instance=FailingUserService(user_service.repo))
+                job = await submit(client, ndjson("broken", 50))
+                assert job["state"] == "failed" and "database went away" in job["error"], job
+            finally:
+                celery_app.conf.task_always_eager = False
+                container.register(UserService, instance=user_service)
+            print("eager mode: succeeded on submit; failing chunk -> job failed with its error: ok")
+            assert (await client.get("/api/jobs/unknown")).status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_user_service, None)
+        app.dependency_overrides.pop(get_job_service, None)
+        password_hasher.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=4, help="bcrypt cost (4 is the minimum)")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.chunk_size, args.rounds))
@@ -0,0 +1,202 @@
+# benchmarks/bench_ledger_reports.py
+"""
+Ledger reports over a synthetic ledger (10M voucher lines by default) in a local SQLite stand-in:
+trial balance by chunked vectorized aggregation vs a per-row Python loop, then closing periods so
+the trial balance only scans the open month, plus period summaries and a streamed account ledger.
+Peak RSS growth during the reports is asserted to stay under a ceiling.
+
+    python -m benchmarks.bench_ledger_reports --lines 10000000 --max-rss-growth-mb 300
+
+The ledger is generated with SQL (two lines per voucher over 24 months, 500 accounts) and kept at
+--db, so later runs with the same size skip generation.
+"""
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import select
+from app.main import app
+from app.application.services.report_service import ReportService
+from app.core.dependencies import get_report_service, get_unit_of_work, get_voucher_service
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.application.services.voucher_service import VoucherService
+from app.infrastructure.db.models.voucher_line import VoucherLine as VoucherLineModel
+from app.infrastructure.repositories.report_repository import ReportRepository
+from app.infrastructure.repositories.voucher_repository import VoucherRepository
+from app.utilities.period_utils import parse_period
+from benchmarks.support import asgi_stream, create_schema, make_client, rss_mb, sqlite_engine, use_engine
+from fastapi import Depends
+
+ACCOUNTS = 500
+FIRST_DAY = date(2023, 1, 1)
+DAYS = 731  # 2023-01-01 .. 2024-12-31
+
+
+def generate(path: str, lines: int) -> None:
+    """Two balanced lines per voucher, spread evenly over DAYS; amounts up to 1,000.00"""
+    vouchers = lines // 2
+    db = sqlite3.connect(path)
+    db.executescript(f"""
+        PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF; PRAGMA cache_size = -200000;
+        DELETE FROM VoucherLines; DELETE FROM Vouchers; DELETE FROM AccountPeriodSummaries; DELETE FROM ClosedPeriods;
+        INSERT INTO Vouchers (id, Number, VoucherDate, Description, CreateDate)
+        WITH RECURSIVE seq(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM seq WHERE n < {vouchers - 1})
+        SELECT 'v' || n, n + 1, date('{FIRST_DAY}', '+' || (n * {DAYS} / {vouchers}) || ' days'), 'bench', '2025-01-01'
+        FROM seq;
+        INSERT INTO VoucherLines (VoucherId, LineNo, VoucherDate, Account, Debit, Credit, Description)
+        SELECT id, k, VoucherDate,
+               printf('%04d', 1000 + ((Number * 7919 + k * 104729) % {ACCOUNTS})),
+               CASE k WHEN 1 THEN (Number * 37 % 100000) / 100.0 ELSE 0 END,
+               CASE k WHEN 2 THEN (Number * 37 % 100000) / 100.0 ELSE 0 END,
+               NULL
+        FROM Vouchers, (SELECT 1 AS k UNION ALL SELECT 2);
+        ANALYZE;
+    """)
+    db.close()
+
+
+class PeakRss:
+    """Highest RSS seen by a sampling thread while the block runs (pandas work can hold the event loop)"""
+
+    def _sample(self):
+        while not self._stop.wait(0.02):
+            self.peak = max(self.peak, rss_mb())
+
+    def __enter__(self):
+        self.base = self.peak = rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_mb())
+
+    @property
+    def growth(self) -> float:
+        return self.peak - self.base
+
+
+async def row_loop_trial_balance(factory, limit: int) -> float:
+    """The per-row approach: one Row and two Decimals per line folded into a dict; returns lines/s"""
+    totals = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    stmt = (select(VoucherLineModel.account, VoucherLineModel.debit, VoucherLineModel.credit)
+            .limit(limit).execution_options(yield_per=10000))
+    start = time.perf_counter()
+    async with factory() as session:
+        async for row in await session.stream(stmt):
+            account_totals = totals[row.account]
+            account_totals[0] += row.debit
+            account_totals[1] += row.credit
+    return limit / (time.perf_counter() - start)
+
+
+async def timed(label: str, coro, lines: int = 0):
+    with PeakRss() as memory:
+        start = time.perf_counter()
+        result = await coro
+        elapsed = time.perf_counter() - start
+    rate = f", {lines / elapsed:,.0f} lines/s" if lines else ""
+    print(f"{label:<44} {elapsed:>7.2f}s{rate}, peak RSS +{memory.growth:.0f} MB")
+    return result, memory.growth
+
+
+async def run(lines: int, db_path: str, max_growth: float, loop_sample: int) -> None:
+    engine = sqlite_engine(db_path)
+    factory = use_engine(engine)
+    await create_schema(engine)
+    existing = sqlite3.connect(db_path).execute("SELECT count(*) FROM VoucherLines").fetchone()[0]
+    if existing != lines:
+        start = time.perf_counter()
+        generate(db_path, lines)
+        print(f"generated {lines:,} lines in {time.perf_counter() - start:.0f}s ({os.path.getsize(db_path) / 2**30:.1f} GiB)")
+    else:
+        sqlite3.connect(db_path).executescript("DELETE FROM AccountPeriodSummaries; DELETE FROM ClosedPeriods;")
+        print(f"reusing {lines:,} lines in {db_path}")
+
+    repository = ReportRepository()
+    service = ReportService(repository)
+    await repository.get_closed_period(cached=False)
+    growth = []
+
+    rate = await row_loop_trial_balance(factory, loop_sample)
+    print(f"{'per-row Python loop (Decimal dict)':<44} {lines / rate:>7.2f}s est. ({rate:,.0f} lines/s on {loop_sample:,})")
+
+    full, mb = await timed("trial balance, nothing closed (full scan)", service.trial_balance(date(2024, 12, 31)), lines)
+    growth.append(mb)
+    assert full.totalDebit == full.totalCredit and len(full.accounts) == ACCOUNTS, (full.totalDebit, full.totalCredit)
+
+    closed, mb = await timed("close 2023-01 .. 2024-11 (one scan)", service.close_period(parse_period("2024-11")))
+    growth.append(mb)
+    print(f"  {closed.periodsSummarized} periods, {closed.summaries:,} summaries, {closed.lines:,} lines")
+
+    open_lines = lines - closed.lines
+    again, mb = await timed("trial balance, 2024-12 open (summaries+scan)", service.trial_balance(date(2024, 12, 31)), open_lines)
+    growth.append(mb)
+    assert again.model_dump(exclude={"closedThrough"}) == full.model_dump(exclude={"closedThrough"})
+    month_end, _ = await timed("trial balance as of 2024-11-30 (summaries)", service.trial_balance(date(2024, 11, 30)))
+    print(f"  closed-period results match the full scan; {month_end.totalDebit:,} debits through 2024-11")
+
+    summaries, _ = await timed("period summaries 2024-01 .. 2024-12", service.period_summaries(202401, 202412))
+    assert len({s.period for s in summaries}) == 12 and sum(s.lines for s in summaries) > open_lines
+
+    # Ledger of the busiest account over the open month through HTTP; its last balance must match the trial balance
+    account = max(again.accounts, key=lambda a: a.debit + a.credit).account
+    app.dependency_overrides[get_report_service] = lambda uow=Depends(get_unit_of_work): service
+    received, tail = [0], [b""]
+
+    def on_chunk(chunk: bytes):
+        received[0] += chunk.count(b"\n")
+        if chunk:
+            tail[0] = chunk
+
+    with PeakRss() as memory:
+        start = time.perf_counter()
+        status = await asgi_stream(app, f"/api/reports/ledger/{account}", "start=2024-12-01&end=2024-12-31&format=csv", on_chunk)
+        elapsed = time.perf_counter() - start
+    growth.append(memory.growth)
+    last_balance = Decimal(tail[0].decode().strip().splitlines()[-1].split(",")[-1])
+    expected = next(a.balance for a in again.accounts if a.account == account)
+    assert status == 200 and last_balance == expected, (status, last_balance, expected)
+    print(f"{'ledger ' + account + ' for 2024-12 (CSV stream)':<44} {elapsed:>7.2f}s, {received[0] - 1:,} rows "
+          f"incl. opening balance, peak RSS +{memory.growth:.0f} MB; closing balance matches")
+
+    voucher_repository = VoucherRepository()
+    batcher = VoucherBatcher(voucher_repository)
+    voucher_service = VoucherService(voucher_repository, batcher, repository)
+    app.dependency_overrides[get_voucher_service] = lambda uow=Depends(get_unit_of_work): voucher_service
+    try:
+        async with make_client(app) as client:
+            body = {"voucherDate": "2024-06-30", "lines": [{"account": "6100", "debit": "5"}, {"account": "1000", "credit": "5"}]}
+            assert (await client.post("/api/vouchers/", json=body)).status_code == 409
+            assert (await client.post("/api/reports/periods/2024-10/close")).status_code == 409
+            assert (await client.get("/api/reports/period-summaries", params={"start": "2024-13", "end": "2024-12"})).status_code == 400
+            response = await client.get("/api/reports/trial-balance", params={"as_of": "2024-12-31"})
+            assert response.status_code == 200 and response.json()["data"]["closedThrough"] == "2024-11"
+    finally:
+        app.dependency_overrides.pop(get_voucher_service, None)
+        app.dependency_overrides.pop(get_report_service, None)
+        await batcher.close()
+    print("post into closed period 409, re-close 409, bad period 400, GET trial-balance: ok")
+
+    assert max(growth) < max_growth, f"peak RSS growth {max(growth):.0f} MB over the {max_growth:.0f} MB ceiling"
+    print(f"memory ceiling: peak RSS growth {max(growth):.0f} MB < {max_growth:.0f} MB")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=10_000_000)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "bench-ledger.db"))
+    parser.add_argument("--max-rss-growth-mb", type=float, default=300)
+    parser.add_argument("--loop-sample", type=int, default=500_000, help="lines timed for the per-row loop")
+    args = parser.parse_args()
+    asyncio.run(run(args.lines, args.db, args.max_rss_growth_mb, args.loop_sample))
@@ -0,0 +1,57 @@
+# benchmarks/bench_mappers.py
+"""
+Cost of mapping a 10k-row page of User entities to UserResponse DTOs (and DTOs back to entities).
+
+    python -m benchmarks.bench_mappers --rows 10000 --repeat 20
+
+"model_validate" is the old mapper_utils behaviour (it validated entity.__dict__); the others go through the MapperRegistry.
+"""
+import argparse
+import time
+from app.application.mappers.mapper_utils import map_list_to_dto, map_list_to_entity, map_to_dto
+from app.domain.dtos.user.UserCreate import UserCreate
+from app.domain.dtos.user.UserResponse import UserResponse
+from app.domain.entities.user import User
+
+
+def best_of(repeat: int, fn) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int, repeat: int) -> None:
+    users = [
+        User(id=f"id-{i}", username=f"user-{i}", hashed_password="x", email=f"user-{i}@example.com",
+             roleId="role-1", roleName="admin", isActive=True)
+        for i in range(rows)
+    ]
+    creates = [UserCreate(username=f"user-{i}", password="secret", email=f"user-{i}@example.com", roleId="role-1") for i in range(rows)]
+
+    cases = [
+        ("model_validate (before)", lambda: [UserResponse.model_validate(u, from_attributes=True) for u in users]),
+        ("map_to_dto per row", lambda: [map_to_dto(UserResponse, u) for u in users]),
+        ("map_list_to_dto trusted", lambda: map_list_to_dto(UserResponse, users)),
+        ("map_list_to_dto validated", lambda: map_list_to_dto(UserResponse, users, trusted=False)),
+        ("entity(**model_dump()) (before)", lambda: [User(**d.model_dump()) for d in creates]),
+        ("map_list_to_entity", lambda: map_list_to_entity(User, creates)),
+    ]
+    baseline = {}
+    print(f"rows={rows} best of {repeat}")
+    for label, fn in cases:
+        elapsed = best_of(repeat, fn)
+        kind = "entity" if "entity" in label else "dto"
+        baseline.setdefault(kind, elapsed)
+        print(f"{label:34} {elapsed * 1000:8.1f}ms/page {elapsed / rows * 1e6:6.2f}us/row  {baseline[kind] / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,98 @@
+# benchmarks/bench_pagination.py
+"""
+Offset vs keyset (cursor) paging latency for page 1 and a deep page of UserRepository.list_users.
+
+    python -m benchmarks.bench_pagination --rows 1000000 --page 10000
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert, select
+from app.infrastructure.db.models.role import Role as RoleModel
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.utilities.pagination_utils import encode_cursor
+from app.domain.entities.role import Role
+from benchmarks.support import InMemoryRoleRepository, create_schema, session_factory, sqlite_engine, use_engine
+
+PAGE_SIZE = 100
+
+
+async def seed(engine, rows: int) -> None:
+    await create_schema(engine)
+    epoch = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    async with session_factory(engine)() as session:
+        # ORM-enabled bulk insert (executemany keyed by attribute names)
+        await session.execute(insert(RoleModel), [{"id": f"role-{i}", "name": f"role-{i}", "isActive": True} for i in range(5)])
+        for start in range(0, rows, 50_000):
+            await session.execute(insert(UserModel), [
+                {
+                    "id": str(uuid.uuid4()),
+                    "username": f"user-{i:08d}",
+                    "hashed_password": "x",
+                    "email": f"user-{i}@example.com",
+                    "roleId": f"role-{i % 5}",
+                    "createDate": epoch + timedelta(seconds=i),
+                    "isActive": True,
+                }
+                for i in range(start, min(start + 50_000, rows))
+            ])
+        await session.commit()
+
+
+async def timed(coro_factory, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def run(rows: int, deep_page: int, db_path: str) -> None:
+    fresh = not os.path.exists(db_path)
+    engine = sqlite_engine(db_path)
+    try:
+        if fresh:
+            print(f"seeding {rows} users into {db_path} ...")
+            await seed(engine, rows)
+        await measure(engine, deep_page)
+    finally:
+        await engine.dispose()
+
+
+async def measure(engine, deep_page: int) -> None:
+    use_engine(engine)
+    repo = UserRepository(InMemoryRoleRepository([Role(id=f"role-{i}", name=f"role-{i}") for i in range(5)]))
+
+    # Cursor pointing just before the deep page, as a client that walked there would hold
+    offset = (deep_page - 1) * PAGE_SIZE
+    async with engine.connect() as conn:
+        anchor_username, anchor_id = (await conn.execute(
+            select(UserModel.username, UserModel.id).order_by(UserModel.username, UserModel.id).offset(offset - 1).limit(1)
+        )).one()
+    deep_cursor = encode_cursor("username", True, anchor_username, anchor_id)
+
+    cases = {
+        "offset page 1": lambda: repo.list_users(1, PAGE_SIZE, "username", True),
+        f"offset page {deep_page}": lambda: repo.list_users(deep_page, PAGE_SIZE, "username", True),
+        "cursor page 1": lambda: repo.list_users(1, PAGE_SIZE, "username", True, cursor=None),
+        f"cursor page {deep_page}": lambda: repo.list_users(1, PAGE_SIZE, "username", True, cursor=deep_cursor),
+        f"cursor page {deep_page} (no total)": lambda: repo.list_users(
+            1, PAGE_SIZE, "username", True, cursor=deep_cursor, include_total="false"
+        ),
+    }
+    for name, factory in cases.items():
+        print(f"{name:>33}: {await timed(factory) * 1000:8.1f} ms (best of 5)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--db", default="bench_pagination.db")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.page, args.db))
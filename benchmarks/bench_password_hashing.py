@@ -0,0 +1,67 @@
+# benchmarks/bench_password_hashing.py
+"""
+p99 latency of GET /api/role/ while a flood of concurrent logins is running.
+
+    python -m benchmarks.bench_password_hashing --mode inline   # bcrypt on the event loop (before)
+    python -m benchmarks.bench_password_hashing --mode pool     # bcrypt in the hasher pool (after)
+"""
+import argparse
+import asyncio
+import time
+from app.main import app
+from app.application.services import login_service as login_service_module
+from app.application.services.login_service import LoginService
+from app.application.services.role_service import RoleService
+from app.core.dependencies import get_login_service, get_role_service
+from app.core.security import hash_password, password_hasher, verify_and_update_password
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from benchmarks.support import InMemoryLoginRepository, InMemoryRoleRepository, make_client, summarize
+
+
+async def _inline_verify(plain_password: str, hashed_password: str):
+    return verify_and_update_password(plain_password, hashed_password)
+
+
+async def run(mode: str, logins: int, concurrency: int) -> None:
+    if mode == "inline":
+        login_service_module.verify_and_update_password_async = _inline_verify
+
+    user = User(id="1", username="bench", hashed_password=hash_password("secret"))
+    login_service = LoginService(InMemoryLoginRepository({"bench": user}))
+    role_service = RoleService(InMemoryRoleRepository([Role(id=str(i), name=f"role-{i}") for i in range(20)]))
+    app.dependency_overrides[get_login_service] = lambda: login_service
+    app.dependency_overrides[get_role_service] = lambda: role_service
+
+    async with make_client(app) as client:
+        remaining = logins
+        statuses = {}
+
+        async def login_worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                r = await client.post("/api/auth/login", json={"username": "bench", "password": "secret"})
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        latencies = []
+        flood = [asyncio.create_task(login_worker()) for _ in range(concurrency)]
+        while not all(t.done() for t in flood):
+            start = time.perf_counter()
+            await client.get("/api/role/")
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.005)
+        await asyncio.gather(*flood)
+
+    password_hasher.shutdown()
+    print(f"mode={mode} logins={logins} concurrency={concurrency} login statuses={statuses}")
+    print(f"GET /api/role/ during flood: {summarize(latencies)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=["inline", "pool"], default="pool")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(run(args.mode, args.logins, args.concurrency))
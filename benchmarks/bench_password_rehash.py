@@ -0,0 +1,74 @@
+# benchmarks/bench_password_rehash.py
+"""
+bcrypt calibration on this host, and rehash-on-login after the cost is raised.
+
+    python -m benchmarks.bench_password_rehash --target-ms 250 --from-rounds 4 --to-rounds 10
+
+Seeds a user hashed at --from-rounds, raises the cost to --to-rounds and logs in three times:
+the first login verifies at the old cost and stores a new hash, later ones verify at the new cost.
+Exits non-zero if the stored hash was not upgraded.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from fastapi import Depends
+from passlib.hash import bcrypt
+from sqlalchemy import insert, select
+from app.main import app
+from app.application.services.login_service import LoginService
+from app.core.dependencies import get_login_service, get_unit_of_work
+from app.core.password_calibration import calibrate_rounds
+from app.core.security import password_hasher, set_password_rounds
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.repositories.login_repository import LoginRepository
+from benchmarks.support import create_schema, make_client, session_factory, sqlite_engine, use_engine
+
+
+async def run(target_ms: float, min_rounds: int, from_rounds: int, to_rounds: int) -> bool:
+    rounds, verify_ms = calibrate_rounds(target_ms, min_rounds)
+    print(f"calibration: {rounds} rounds, verify {verify_ms:.0f}ms (target {target_ms:.0f}ms, minimum {min_rounds})")
+
+    engine = sqlite_engine()
+    try:
+        await create_schema(engine)
+        async with session_factory(engine)() as session:
+            await session.execute(insert(UserModel), [{
+                "id": str(uuid.uuid4()), "username": "bench", "email": "bench@example.com", "roleId": "role-1", "isActive": True,
+                "hashed_password": bcrypt.using(rounds=from_rounds).hash("secret"),
+            }])
+            await session.commit()
+        use_engine(engine)
+        set_password_rounds(to_rounds)
+        login_service = LoginService(LoginRepository())
+        app.dependency_overrides[get_login_service] = lambda uow=Depends(get_unit_of_work): login_service
+
+        async def stored_cost() -> int:
+            async with engine.connect() as conn:
+                hashed = (await conn.execute(select(UserModel.hashed_password))).scalar_one()
+            return int(hashed.split("$")[2])
+
+        async with make_client(app) as client:
+            for attempt in range(1, 4):
+                start = time.perf_counter()
+                r = await client.post("/api/auth/login", json={"username": "bench", "password": "secret"})
+                elapsed = (time.perf_counter() - start) * 1000
+                assert r.status_code == 200, r.text
+                print(f"login {attempt}: {elapsed:6.1f}ms, stored cost now {await stored_cost()}")
+            metrics = (await client.get("/metrics")).text
+        print("\n".join(line for line in metrics.splitlines() if line.startswith(("password_hash_rounds ", "password_verify_duration_seconds_count"))))
+        return await stored_cost() == to_rounds
+    finally:
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--from-rounds", type=int, default=4)
+    parser.add_argument("--to-rounds", type=int, default=10)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args.target_ms, args.min_rounds, args.from_rounds, args.to_rounds)) else 1)
@@ -0,0 +1,71 @@
+# benchmarks/bench_response_rps.py
+"""
+Requests/second on GET /api/user/?page_size=100 with the old dict response path vs the single-pass one.
+
+    python -m benchmarks.bench_response_rps --mode dict     # model_dump() + jsonable_encoder + json.dumps (before)
+    python -m benchmarks.bench_response_rps --mode single   # APIResponse.model_dump_json rendered once (after)
+
+Both modes read the same page from an aiosqlite stand-in, so the difference is the response path.
+"""
+import argparse
+import asyncio
+import time
+from fastapi import Depends
+from app.main import app
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_unit_of_work, get_user_service
+from app.domain.entities.role import Role
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.presentation.controllers import user_controller
+from app.utilities.common_response import APIResponse
+from benchmarks.bench_pagination import seed
+from benchmarks.support import InMemoryRoleRepository, make_client, sqlite_engine, use_engine
+
+
+def dict_response(data=None, message="Success", success=True, errors=None):
+    """wrap_response as it was: a dict that FastAPI encodes again"""
+    return APIResponse(success=success, message=message, data=data, errors=errors).model_dump()
+
+
+async def run(mode: str, seconds: float, concurrency: int) -> None:
+    if mode == "dict":
+        user_controller.wrap_response = dict_response
+    engine = sqlite_engine()
+    try:
+        await seed(engine, 1000)
+        use_engine(engine)
+        roles = InMemoryRoleRepository([Role(id=f"role-{i}", name=f"role-{i}") for i in range(5)])
+        user_service = UserService(UserRepository(roles))
+        app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+
+        async with make_client(app) as client:
+            params = {"page_size": 100, "include_total": "false"}
+            r = await client.get("/api/user/", params=params)
+            assert r.status_code == 200 and len(r.json()["data"]["data"]) == 100, r.text
+
+            done = 0
+            deadline = time.perf_counter() + seconds
+
+            async def worker():
+                nonlocal done
+                while time.perf_counter() < deadline:
+                    r = await client.get("/api/user/", params=params)
+                    assert r.status_code == 200
+                    done += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+        print(f"mode={mode} page_size=100 concurrency={concurrency}: {done / elapsed:.0f} req/s ({done} requests)")
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=["dict", "single"], default="single")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args.mode, args.seconds, args.concurrency))
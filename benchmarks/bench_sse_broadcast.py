@@ -0,0 +1,156 @@
+# benchmarks/bench_sse_broadcast.py
+"""
+Notification broadcast over Server-Sent Events: event throughput and latency to many subscribers,
+memory per subscriber, and Last-Event-ID replay through the real endpoint.
+
+    MESSAGE_BROKER_BACKEND=memory python -m benchmarks.bench_sse_broadcast --subscribers 10000 --events 200
+
+Subscribers are drained the way the /api/notify/stream response drains them (wake up, join the queue,
+send one chunk), without the HTTP layer; one real stream is checked end to end first.
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from app.main import app
+from app.hubs.notify_hub import NotifyHub
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from benchmarks.support import make_client, percentile
+
+
+async def open_stream(path: str, headers=()):
+    """Start an SSE request straight through ASGI; returns (chunks queue, disconnect function)"""
+    chunks: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench"), *headers], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            await chunks.put(message["body"])
+
+    task = asyncio.create_task(app(scope, receive, send))
+
+    async def disconnect():
+        disconnected.set()
+        await task
+    return chunks, disconnect
+
+
+async def read_events(chunks: asyncio.Queue, count: int) -> list:
+    """Parse (id, data) pairs off the stream until `count` events arrived"""
+    events, buffer = [], b""
+    while len(events) < count:
+        buffer += await asyncio.wait_for(chunks.get(), timeout=5)
+        *frames, buffer = buffer.split(b"\n\n")
+        for frame in frames:
+            fields = dict(line.split(": ", 1) for line in frame.decode().split("\n") if ": " in line and not line.startswith(":"))
+            if "id" in fields:
+                events.append((fields["id"], fields["data"]))
+    return events
+
+
+async def endpoint_check() -> None:
+    async with make_client(app) as client:
+        async def publish(n: int) -> None:
+            r = await client.post("/api/notify/publish", json={"topic": "orders", "data": f"order {n}"})
+            assert r.status_code == 200, r.text
+
+        async with app.router.lifespan_context(app):
+            chunks, disconnect = await open_stream("/api/notify/stream")
+            await asyncio.sleep(0.01)
+            for n in range(3):
+                await publish(n)
+            seen = await read_events(chunks, 3)
+            await disconnect()
+            for n in range(3, 6):  # published while the client is away
+                await publish(n)
+            chunks, disconnect = await open_stream("/api/notify/stream", [(b"last-event-id", seen[-1][0].encode())])
+            replayed = await read_events(chunks, 3)
+            await disconnect()
+    assert [d for _, d in replayed] == ["order 3", "order 4", "order 5"], replayed
+    print("endpoint: live delivery and Last-Event-ID replay of 3 missed events: ok")
+
+
+async def run(subscribers: int, events: int, batch: int) -> None:
+    await endpoint_check()
+
+    hub = NotifyHub(InMemoryMessageBroker(), replay_size=1000, queue_size=256, heartbeat_seconds=0)
+    await hub.start()
+    published_at, frames, latencies = {}, [], []
+    received = 0
+    stop = asyncio.Event()
+
+    original_dispatch = hub.dispatch
+
+    def timed_dispatch(event_id, topic, frame):
+        frames.append(frame)  # keeps ids unique for the whole run
+        published_at[id(frame)] = time.perf_counter()
+        original_dispatch(event_id, topic, frame)
+    hub.dispatch = timed_dispatch
+
+    async def consume(subscriber, sample: bool) -> None:
+        nonlocal received
+        while not subscriber.closed and not stop.is_set():
+            if not subscriber.queue:
+                subscriber.ready.clear()
+                await subscriber.ready.wait()
+                continue
+            if sample:
+                now = time.perf_counter()
+                latencies.extend(now - published_at[id(f)] for f in subscriber.queue)
+            received += len(subscriber.queue)
+            subscriber.drain()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    subs = [hub.subscribe(frozenset({"orders"}) if i % 2 else None)[0] for i in range(subscribers)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    per_subscriber = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / subscribers
+    consumers = [asyncio.create_task(consume(s, i % 100 == 0)) for i, s in enumerate(subs)]
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for n in range(events):
+        await hub.publish("orders", "message", f'{{"order": {n}}}')
+        if n % batch == batch - 1:
+            await asyncio.sleep(0)
+    expected = subscribers * events
+    while received < expected and time.perf_counter() - start < 60:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for subscriber in subs:
+        subscriber.ready.set()
+    await asyncio.gather(*consumers)
+    dropped = sum(1 for s in subs if s.closed)
+
+    print(f"subscribers={subscribers} events={events} (published in bursts of {batch})")
+    print(f"hub memory per subscriber: {per_subscriber:.0f} B (tracemalloc)")
+    print(f"delivered {received:,}/{expected:,} in {elapsed:.2f}s: {received / elapsed:,.0f} deliveries/s, "
+          f"{events / elapsed:,.0f} events/s to all subscribers; frames encoded: {len(frames)}")
+    print(f"latency (1% sample): p50={percentile(latencies, 50) * 1000:.1f}ms p95={percentile(latencies, 95) * 1000:.1f}ms "
+          f"p99={percentile(latencies, 99) * 1000:.1f}ms; subscribers cut off: {dropped}")
+    await hub.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=10, help="events published between yields to the loop")
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.events, args.batch))
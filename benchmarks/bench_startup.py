@@ -0,0 +1,76 @@
+# benchmarks/bench_startup.py
+"""
+Worker startup report: `-X importtime` for `import app.main`, grouped by top-level package, and
+cold start to first response (fresh interpreter → import → lifespan startup → GET / answered).
+
+    python -m benchmarks.bench_startup --runs 5 --target-ms 1500
+
+Exits non-zero when the median cold start is above --target-ms.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# Runs in a fresh interpreter; prints once the first response has been produced
+COLD_START = """
+import asyncio, httpx
+from app.main import app
+async def main():
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            assert (await client.get("/")).status_code == 200
+    print("ready", flush=True)
+asyncio.run(main())
+"""
+
+
+def import_report(top: int) -> float:
+    """Print the heaviest top-level packages by self time; returns the total import time in ms"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.main"], capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    by_package = defaultdict(int)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        by_package[name.strip().split(".")[0]] += int(self_us)
+        if name.strip() == "app.main":
+            total_us = int(cumulative_us)
+    print(f"import app.main: {total_us / 1000:.0f}ms; heaviest packages (self time):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {package:24} {self_us / 1000:7.1f}ms")
+    return total_us / 1000
+
+
+def cold_start_ms() -> float:
+    env = dict(os.environ, MESSAGE_BROKER_BACKEND="memory")  # no Redis needed to boot
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", COLD_START], capture_output=True, text=True, env=env)
+    elapsed = (time.perf_counter() - start) * 1000
+    if "ready" not in result.stdout:
+        sys.exit(result.stderr)
+    return elapsed
+
+
+def run(runs: int, target_ms: float, top: int) -> bool:
+    import_report(top)
+    samples = [cold_start_ms() for _ in range(runs)]
+    median = statistics.median(samples)
+    print(f"cold start to first response: median={median:.0f}ms min={min(samples):.0f}ms max={max(samples):.0f}ms "
+          f"(runs={runs}, target={target_ms:.0f}ms)")
+    return median <= target_ms
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=1500)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+    sys.exit(0 if run(args.runs, args.target_ms, args.top) else 1)
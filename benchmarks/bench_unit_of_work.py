@@ -0,0 +1,68 @@
+# benchmarks/bench_unit_of_work.py
+"""
+Pool checkouts and latency per request with the request-scoped unit of work vs a session per repository call.
+
+    python -m benchmarks.bench_unit_of_work --requests 500
+
+Reads the X-DB-Checkouts header of POST /api/user/ (duplicate check + insert) and
+GET /api/user/. --mode per-call disables the unit of work, which is what every
+repository call did before: open its own session, check out a connection, commit.
+"""
+import argparse
+import asyncio
+import time
+from fastapi import Depends
+from app.main import app
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_unit_of_work, get_user_service
+from app.core.security import password_hasher, set_password_rounds
+from app.domain.entities.role import Role
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.support import InMemoryRoleRepository, create_schema, make_client, percentile, sqlite_engine, use_engine
+
+
+async def no_unit_of_work():
+    yield None
+
+
+async def run(requests: int, mode: str) -> None:
+    set_password_rounds(4)  # keep bcrypt out of the way; this measures the session handling
+    engine = sqlite_engine()
+    await create_schema(engine)
+    use_engine(engine)
+    user_service = UserService(UserRepository(InMemoryRoleRepository([Role(id="role-1", name="admin")])))
+    # The override keeps the service's dependency on the unit of work
+    app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+    if mode == "per-call":
+        app.dependency_overrides[get_unit_of_work] = no_unit_of_work
+
+    try:
+        async with make_client(app) as client:
+            for label, call in (
+                ("POST /api/user/", lambda i: client.post("/api/user/", json={
+                    "username": f"user-{i}", "password": "secret", "email": f"user-{i}@example.com", "roleId": "role-1"})),
+                ("GET /api/user/", lambda i: client.get("/api/user/", params={"page_size": 20})),
+            ):
+                checkouts, latencies = [], []
+                for i in range(requests):
+                    start = time.perf_counter()
+                    r = await call(i)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    assert r.status_code == 200, r.text
+                    checkouts.append(int(r.headers["x-db-checkouts"]))
+                print(
+                    f"{mode:8} {label:16} checkouts/request={sum(checkouts) / len(checkouts):.2f} "
+                    f"p50={percentile(latencies, 50):.2f}ms p99={percentile(latencies, 99):.2f}ms"
+                )
+    finally:
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--mode", choices=["uow", "per-call"], default="uow")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.mode))
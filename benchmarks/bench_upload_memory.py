@@ -0,0 +1,144 @@
+# benchmarks/bench_upload_memory.py
+"""
+Peak RSS while streaming a large upload through /api/files (raw body, multipart, resumable PATCHes),
+deduplication of a repeated upload, and early abort of an oversized body.
+
+    python -m benchmarks.bench_upload_memory --size-mb 1024
+
+The client side generates the body chunk by chunk, so any RSS growth is the server's.
+Exits non-zero if peak RSS grows by more than --max-growth-mb over the baseline.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from app.main import app
+from app.core.dependencies import get_file_manager
+from app.core.file_manager import FileManager
+from benchmarks.support import asgi_upload, rss_mb
+
+CHUNK = 64 * 1024  # what a server typically hands the app per receive()
+BOUNDARY = "benchboundary7MA4YWxkTrZu0gW"
+
+
+def body(size: int, block: bytes):
+    for start in range(0, size, CHUNK):
+        yield block[: min(CHUNK, size - start)]
+
+
+def multipart(size: int, block: bytes):
+    yield (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"note\"\r\n\r\nhello\r\n"
+           f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"big.bin\"\r\n"
+           f"Content-Type: application/octet-stream\r\n\r\n").encode()
+    yield from body(size, block)
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def disk_usage(root: str) -> int:
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+
+
+class PeakRss:
+    """Samples RSS every 10ms in the background"""
+
+    def __init__(self):
+        self.peak = rss_mb()
+        self._task = None
+
+    async def _sample(self):
+        while True:
+            self.peak = max(self.peak, rss_mb())
+            await asyncio.sleep(0.01)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+        self.peak = max(self.peak, rss_mb())
+
+
+async def timed_upload(label: str, size: int, *args, **kwargs) -> dict:
+    start = time.perf_counter()
+    with PeakRss() as rss:
+        status, payload = await asgi_upload(app, *args, **kwargs)
+    elapsed = time.perf_counter() - start
+    assert status == 200, payload[:300]
+    data = json.loads(payload)["data"]
+    print(f"{label:10} {size / 2**20:7.0f} MiB in {elapsed:5.1f}s ({size / 2**20 / elapsed:6.0f} MiB/s), peak RSS {rss.peak:6.1f} MiB")
+    return data
+
+
+async def run(size_mb: int, max_growth_mb: float) -> bool:
+    root = tempfile.mkdtemp(prefix="bench-uploads-")
+    size = size_mb * 2**20
+    block = os.urandom(CHUNK)
+    manager = FileManager(root=root, max_size=2 * size)
+    app.dependency_overrides[get_file_manager] = lambda: manager
+    try:
+        # Warm up the code paths, then take the baseline
+        await asgi_upload(app, "POST", "/api/files/", body(CHUNK, os.urandom(CHUNK)), query="filename=warm.bin")
+        baseline = rss_mb()
+        print(f"baseline RSS {baseline:.1f} MiB")
+
+        raw = await timed_upload("raw", size, "POST", "/api/files/", body(size, block), query="filename=big.bin")
+        used = disk_usage(root)
+        again = await timed_upload("multipart", size, "POST", "/api/files/", multipart(size, block),
+                                   headers=[(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())])
+        print(f"dedup: same id={again['id'] == raw['id']}, deduplicated={again['deduplicated']}, "
+              f"extra disk used={disk_usage(root) - used} bytes")
+
+        # Resumable: 8 MiB PATCHes (content differs from the first file, so it is stored)
+        other = bytes(reversed(block))
+        status, payload = await asgi_upload(app, "POST", "/api/files/uploads",
+                                            [json.dumps({"filename": "resumable.bin", "size": size}).encode()],
+                                            headers=[(b"content-type", b"application/json")])
+        upload_id = json.loads(payload)["data"]["id"]
+        piece = 8 * 2**20
+        start = time.perf_counter()
+        with PeakRss() as rss:
+            for offset in range(0, size, piece):
+                status, payload = await asgi_upload(app, "PATCH", f"/api/files/uploads/{upload_id}",
+                                                    body(min(piece, size - offset), other),
+                                                    headers=[(b"upload-offset", str(offset).encode())])
+                assert status == 200, payload
+                if offset == 0:
+                    # A replayed (stale) chunk is refused with the offset to resume from
+                    stale, _ = await asgi_upload(app, "PATCH", f"/api/files/uploads/{upload_id}", body(CHUNK, other),
+                                                 headers=[(b"upload-offset", b"0")])
+        final = json.loads(payload)["data"]
+        elapsed = time.perf_counter() - start
+        print(f"{'resumable':10} {size / 2**20:7.0f} MiB in {elapsed:5.1f}s ({size / 2**20 / elapsed:6.0f} MiB/s), "
+              f"peak RSS {rss.peak:6.1f} MiB; completed={final['completed']}, stale chunk -> {stale}")
+
+        # Oversized body without Content-Length: refused once the limit is crossed, not after reading it all
+        manager.max_size = 10 * 2**20
+        consumed = 0
+
+        def counted():
+            nonlocal consumed
+            for chunk in body(100 * 2**20, block):
+                consumed += len(chunk)
+                yield chunk
+        status, _ = await asgi_upload(app, "POST", "/api/files/", counted(), query="filename=too-big.bin")
+        print(f"oversized: 100 MiB body with a 10 MiB limit -> {status} after reading {consumed / 2**20:.1f} MiB; "
+              f"tmp files left: {len(os.listdir(os.path.join(root, 'tmp')))}")
+
+        growth = max(rss.peak, rss_mb()) - baseline
+        print(f"peak RSS growth over baseline: {growth:.1f} MiB (limit {max_growth_mb} MiB)")
+        return growth <= max_growth_mb
+    finally:
+        app.dependency_overrides.clear()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--max-growth-mb", type=float, default=64)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args.size_mb, args.max_growth_mb)) else 1)
@@ -0,0 +1,106 @@
+# benchmarks/bench_voucher_posting.py
+"""
+Voucher posting throughput at 1, 10 and 100 concurrent posters against a local SQLite stand-in:
+batched (the VoucherBatcher defaults) vs one transaction and one number reservation per voucher.
+
+    python -m benchmarks.bench_voucher_posting --seconds 3 --lines 4
+
+Each poster posts balanced vouchers back to back through VoucherService. Afterwards the ledger is
+checked: every voucher stored once with its lines, numbers unique, debits equal to credits.
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+from sqlalchemy import func, select
+from app.main import app
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.application.services.voucher_service import VoucherService
+from app.core.dependencies import get_unit_of_work, get_voucher_service
+from app.domain.dtos.voucher.VoucherCreate import VoucherCreate
+from app.infrastructure.db.models.voucher import Voucher as VoucherModel
+from app.infrastructure.db.models.voucher_line import VoucherLine as VoucherLineModel
+from app.infrastructure.repositories.report_repository import ReportRepository
+from app.infrastructure.repositories.voucher_repository import VoucherRepository
+from app.utilities.metrics_utils import voucher_batch_size
+from benchmarks.support import create_schema, make_client, percentile, sqlite_engine, use_engine
+from fastapi import Depends
+
+
+def voucher(lines: int, amount: int) -> VoucherCreate:
+    debits = [{"account": f"1{i:03d}", "debit": Decimal(amount)} for i in range(lines - 1)]
+    return VoucherCreate(description="bench", lines=[*debits, {"account": "4000", "credit": Decimal(amount * (lines - 1))}])
+
+
+def batch_count() -> int:
+    return voucher_batch_size._series.get((), (None, 0, 0))[2]
+
+
+async def http_smoke_test(service: VoucherService) -> None:
+    app.dependency_overrides[get_voucher_service] = lambda uow=Depends(get_unit_of_work): service
+    try:
+        async with make_client(app) as client:
+            body = {"description": "rent", "lines": [{"account": "6100", "debit": "1200.00"}, {"account": "1000", "credit": "1200.00"}]}
+            posted = (await client.post("/api/vouchers/", json=body)).json()["data"]
+            fetched = await client.get(f"/api/vouchers/{posted['id']}")
+            assert fetched.status_code == 200 and fetched.json()["data"]["number"] == posted["number"]
+            unbalanced = {"lines": [{"account": "6100", "debit": "10"}, {"account": "1000", "credit": "9.99"}]}
+            assert (await client.post("/api/vouchers/", json=unbalanced)).status_code == 400
+            assert (await client.get("/api/vouchers/missing")).status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_voucher_service, None)
+    print("POST / GET /api/vouchers, unbalanced 400, unknown 404: ok")
+
+
+async def measure(service: VoucherService, posters: int, seconds: float, lines: int) -> tuple:
+    latencies, deadline = [], time.perf_counter() + seconds
+
+    async def poster(n: int):
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await service.post_voucher(voucher(lines, 100 + n))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(poster(n) for n in range(posters)))
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, percentile(latencies, 50) * 1000, percentile(latencies, 95) * 1000, len(latencies)
+
+
+async def run(seconds: float, lines: int, posters_list) -> None:
+    engine = sqlite_engine()
+    factory = use_engine(engine)
+    await create_schema(engine)
+    repository = VoucherRepository()
+    batched = VoucherBatcher(repository)
+    unbatched = VoucherBatcher(repository, window_ms=0, max_batch=1, block_size=1)
+    await http_smoke_test(VoucherService(repository, batched, ReportRepository()))
+
+    posted = 1
+    print(f"{'posters':>7} {'mode':<10} {'vouchers/s':>11} {'p50 ms':>8} {'p95 ms':>8} {'avg batch':>10}")
+    for posters in posters_list:
+        for label, batcher in (("unbatched", unbatched), ("batched", batched)):
+            batches = batch_count()
+            rate, p50, p95, count = await measure(VoucherService(repository, batcher, ReportRepository()), posters, seconds, lines)
+            posted += count
+            print(f"{posters:>7} {label:<10} {rate:>11,.0f} {p50:>8.1f} {p95:>8.1f} {count / (batch_count() - batches):>10.1f}")
+
+    async with factory() as session:
+        vouchers = (await session.execute(select(func.count(), func.count(func.distinct(VoucherModel.number))))).one()
+        line_count, debit, credit = (await session.execute(
+            select(func.count(), func.sum(VoucherLineModel.debit), func.sum(VoucherLineModel.credit)))).one()
+    assert vouchers == (posted, posted), (vouchers, posted)
+    assert line_count == (posted - 1) * lines + 2 and debit == credit, (line_count, debit, credit)
+    print(f"ledger check: {posted} vouchers, {line_count} lines, numbers unique, debits = credits = {debit}")
+    await batched.close()
+    await unbatched.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0, help="per poster count and mode")
+    parser.add_argument("--lines", type=int, default=4, help="lines per voucher")
+    parser.add_argument("--posters", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+    asyncio.run(run(args.seconds, args.lines, args.posters))
@@ -0,0 +1,181 @@
+# benchmarks/suite.py
+"""
+Load/regression suite: boots app.main.app in-process (httpx ASGITransport), with aiosqlite standing in
+for SQL Server and an in-memory role repository for MongoDB, seeds synthetic users and drives the
+login, create, get and list endpoints at a fixed concurrency.
+
+    python -m benchmarks.suite                          # run every scenario and report rps / p50 / p95 / p99
+    python -m benchmarks.suite --check                  # also fail (exit 1) on a regression vs baselines.json
+    python -m benchmarks.suite --update-baselines       # store this run as the new baselines
+    python -m benchmarks.suite --scenarios get,list --users 100000 --concurrency 32
+
+A scenario regresses when its throughput drops, or its p95 grows, by more than --tolerance.
+Baselines are machine specific: record them on the machine that runs --check.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List
+import httpx
+from fastapi import Depends
+from sqlalchemy import insert, select
+from app.main import app
+from app.application.services.login_service import LoginService
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_login_service, get_unit_of_work, get_user_service
+from app.core.security import hash_password, password_hasher, set_password_rounds
+from app.domain.entities.role import Role
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.repositories.login_repository import LoginRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from benchmarks.bench_pagination import seed
+from benchmarks.support import InMemoryRoleRepository, make_client, percentile, session_factory, sqlite_engine, use_engine
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+LOGIN_USER, LOGIN_PASSWORD = "bench-login", "bench-password"
+
+# A scenario turns a request number into one request and returns the response
+Scenario = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def build_scenarios(user_ids: List[str], run_id: str) -> Dict[str, Scenario]:
+    return {
+        "login": lambda client, i: client.post(
+            "/api/auth/login", json={"username": LOGIN_USER, "password": LOGIN_PASSWORD}),
+        "create": lambda client, i: client.post("/api/user/", json={
+            "username": f"bench-{run_id}-{i}", "password": "secret",
+            "email": f"bench-{run_id}-{i}@example.com", "roleId": "role-1"}),
+        "get": lambda client, i: client.get(f"/api/user/{user_ids[i % len(user_ids)]}"),
+        "list": lambda client, i: client.get("/api/user/", params={"page_size": 20, "include_total": "false"}),
+    }
+
+
+async def prepare(engine, users: int) -> List[str]:
+    """Seed users plus one login user; returns the ids the get scenario cycles through"""
+    await seed(engine, users)
+    async with session_factory(engine)() as session:
+        await session.execute(insert(UserModel), [{
+            "id": str(uuid.uuid4()), "username": LOGIN_USER, "hashed_password": hash_password(LOGIN_PASSWORD),
+            "email": f"{LOGIN_USER}@example.com", "roleId": "role-1", "isActive": True,
+        }])
+        await session.commit()
+        return list((await session.execute(select(UserModel.id).limit(1000))).scalars())
+
+
+async def measure(client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> dict:
+    """Send `requests` requests from `concurrency` workers; any non-200 response counts as an error"""
+    numbers = itertools.count()
+    for _ in range(warmup):
+        await scenario(client, next(numbers))
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker(count: int) -> None:
+        nonlocal errors
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await scenario(client, next(numbers))
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency + (n < requests % concurrency)) for n in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "errors": errors,
+    }
+
+
+def regressions(results: Dict[str, dict], baselines: Dict[str, dict], tolerance: float) -> List[str]:
+    failures = []
+    for name, result in results.items():
+        if result["errors"]:
+            failures.append(f"{name}: {result['errors']} failed requests")
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result["rps"] < baseline["rps"] * (1 - tolerance):
+            failures.append(f"{name}: {result['rps']} req/s, baseline {baseline['rps']} req/s")
+        if result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p95 {result['p95_ms']}ms, baseline {baseline['p95_ms']}ms")
+    return failures
+
+
+async def run(args) -> bool:
+    # Cheap bcrypt: the login scenario measures the endpoint, not the hash cost (set before the pool forks)
+    set_password_rounds(args.bcrypt_rounds)
+    engine = sqlite_engine()
+    try:
+        print(f"seeding {args.users} users ...")
+        user_ids = await prepare(engine, args.users)
+        use_engine(engine)
+        roles = InMemoryRoleRepository([Role(id=f"role-{i}", name=f"role-{i}") for i in range(5)])
+        user_service = UserService(UserRepository(roles))
+        login_service = LoginService(LoginRepository())
+        app.dependency_overrides[get_user_service] = lambda uow=Depends(get_unit_of_work): user_service
+        app.dependency_overrides[get_login_service] = lambda uow=Depends(get_unit_of_work): login_service
+
+        scenarios = build_scenarios(user_ids, uuid.uuid4().hex[:8])
+        results = {}
+        async with make_client(app) as client:
+            for name in args.scenarios:
+                results[name] = result = await measure(client, scenarios[name], args.requests, args.concurrency, args.warmup)
+                print(f"{name:8} {result['rps']:8.1f} req/s  p50={result['p50_ms']:.2f}ms  p95={result['p95_ms']:.2f}ms  "
+                      f"p99={result['p99_ms']:.2f}ms  errors={result['errors']}")
+    finally:
+        app.dependency_overrides.clear()
+        password_hasher.shutdown()
+        await engine.dispose()
+
+    config = {"users": args.users, "requests": args.requests, "concurrency": args.concurrency, "bcrypt_rounds": args.bcrypt_rounds}
+    if args.update_baselines:
+        stored = {"config": config, "scenarios": {}}
+        if os.path.exists(BASELINES_PATH):
+            with open(BASELINES_PATH) as f:
+                stored["scenarios"] = json.load(f).get("scenarios", {})
+        stored["scenarios"].update({name: {"rps": r["rps"], "p95_ms": r["p95_ms"]} for name, r in results.items()})
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(stored, f, indent=2)
+            f.write("\n")
+        print(f"baselines written to {BASELINES_PATH}")
+
+    if not args.check:
+        return all(not r["errors"] for r in results.values())
+    with open(BASELINES_PATH) as f:
+        stored = json.load(f)
+    if stored.get("config") != config:
+        print(f"warning: baselines were recorded with {stored.get('config')}, this run used {config}")
+    failures = regressions(results, stored["scenarios"], args.tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    print("check failed" if failures else f"check passed (tolerance {args.tolerance:.0%})")
+    return not failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenarios", type=lambda s: s.split(","), default=["login", "create", "get", "list"])
+    parser.add_argument("--users", type=int, default=10000, help="users seeded before measuring")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--check", action="store_true", help="compare with baselines.json, exit 1 on regression")
+    parser.add_argument("--update-baselines", action="store_true")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - {"login", "create", "get", "list"}
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    sys.exit(0 if asyncio.run(run(args)) else 1)
@@ -0,0 +1,264 @@
+# benchmarks/support.py
+"""Shared helpers for the benchmark scripts: in-memory repositories, an in-process client and percentiles."""
+import asyncio
+import math
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.infrastructure.db.base import Base
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.interfaces.i_login_repository import ILoginRepository
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+
+
+class InMemoryLoginRepository(ILoginRepository):
+    """Login repository backed by a dict of username -> User"""
+
+    def __init__(self, users: Optional[Dict[str, User]] = None):
+        self.users = users or {}
+
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        return self.users.get(username)
+
+    async def update_password_hash(self, user_id: str, hashed_password: str) -> None:
+        for user in self.users.values():
+            if user.id == user_id:
+                user.hashed_password = hashed_password
+
+
+class InMemoryRoleRepository(IRoleRepository):
+    """Role repository backed by a list, mirroring the Mongo repository's paging semantics"""
+
+    def __init__(self, roles: Optional[List[Role]] = None):
+        self.roles = list(roles or [])
+
+    async def add_role(self, role_entity: Role) -> Role:
+        if any(r.name == role_entity.name for r in self.roles):
+            raise AlreadyExistsException(f"Role Name already taken: {role_entity.name}")
+        role = Role(id=str(len(self.roles) + 1), name=role_entity.name, isActive=role_entity.isActive)
+        self.roles.append(role)
+        return role
+
+    async def add_roles(self, roles: List[Role]) -> List[Optional[Role]]:
+        saved = []
+        for role in roles:
+            try:
+                saved.append(await self.add_role(role))
+            except AlreadyExistsException:
+                saved.append(None)
+        return saved
+
+    async def get_by_names(self, names: List[str]) -> Dict[str, Role]:
+        wanted = set(names)
+        return {r.name: r for r in self.roles if r.name in wanted}
+
+    async def get_by_id(self, role_id: str) -> Optional[Role]:
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    async def get_by_ids(self, role_ids: List[str]) -> Dict[str, Role]:
+        wanted = set(role_ids)
+        return {r.id: r for r in self.roles if r.id in wanted}
+
+    async def list_all_roles(self) -> List[Role]:
+        return list(self.roles)
+
+    async def get_by_name(self, name: str) -> Optional[Role]:
+        return next((r for r in self.roles if r.name == name), None)
+
+    async def stream_roles(self, batch_size: int = 1000):
+        for start in range(0, len(self.roles), batch_size):
+            yield self.roles[start:start + batch_size]
+
+    async def list_roles(
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True, cursor: Optional[str] = None,
+        include_total: str = "true"
+    ) -> dict:
+        ordered = sorted(self.roles, key=lambda r: getattr(r, sort_field), reverse=not ascending)
+        start = (page - 1) * page_size
+        return {"total": len(ordered), "data": ordered[start:start + page_size], "next_cursor": None}
+
+
+def sqlite_engine(path: Optional[str] = None):
+    """
+    aiosqlite stand-in for SQL Server; the dbo schema is mapped away since SQLite has no schemas.
+    Defaults to a fresh temporary file: a :memory: database is a single shared connection.
+    """
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    return engine.execution_options(schema_translate_map={"dbo": None})
+
+
+def session_factory(engine) -> sessionmaker:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def use_engine(engine) -> sessionmaker:
+    """Point the repositories (unit of work and the export stream) at a benchmark engine"""
+    from app.infrastructure.db import unit_of_work
+    from app.infrastructure.db.instrumentation import install_engine_instrumentation
+    from app.infrastructure.repositories import report_repository, user_repository
+    factory = session_factory(engine)
+    unit_of_work.async_session = factory
+    user_repository.async_session = factory
+    report_repository.async_session = factory
+    install_engine_instrumentation(engine)
+    return factory
+
+
+async def create_schema(engine) -> None:
+    import app.infrastructure.db.models  # noqa: F401  registers the tables on Base.metadata
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def make_client(app) -> httpx.AsyncClient:
+    """Client that drives the ASGI app in-process, without a server or sockets"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://bench")
+
+
+async def asgi_stream(app, path: str, query: str = "", on_chunk=None) -> int:
+    """
+    GET a path straight through the ASGI interface, handing each body chunk to on_chunk and discarding it.
+    (httpx's ASGITransport buffers the whole body, which would defeat streaming measurements.)
+    Returns the response status.
+    """
+    status = 0
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Like a real server: block until the response is done, then report the disconnect
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and on_chunk is not None:
+            on_chunk(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        finished.set()
+    return status
+
+
+async def asgi_upload(app, method: str, path: str, chunks, headers=(), query: str = "") -> Tuple[int, bytes]:
+    """
+    Send a request whose body is produced chunk by chunk (an iterable of bytes) straight through ASGI,
+    so a large upload is never materialized by the client side. Returns (status, response body).
+    """
+    status, body = 0, []
+    chunk_iter = iter(chunks)
+    pending = next(chunk_iter, None)
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"bench"), *headers], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal pending
+        if pending is None:
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        chunk, pending = pending, next(chunk_iter, None)
+        return {"type": "http.request", "body": chunk, "more_body": pending is not None}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # Handled errors are re-raised by ServerErrorMiddleware after the error response went out
+        if not status:
+            raise
+    finally:
+        finished.set()
+    return status, b"".join(body)
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process (Linux)"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> str:
+    """Format latencies (seconds) as p50/p95/p99 in milliseconds"""
+    return (
+        f"n={len(samples)} p50={percentile(samples, 50) * 1000:.1f}ms "
+        f"p95={percentile(samples, 95) * 1000:.1f}ms p99={percentile(samples, 99) * 1000:.1f}ms"
+    )
+
+
+async def asgi_request(app, method: str, path: str, headers=(), query: str = "", extensions=None) -> Tuple[int, dict, bytes]:
+    """
+    A bodiless request straight through ASGI; returns (status, response headers, body).
+    `extensions` is advertised in the scope (e.g. {"http.response.pathsend": {}}); a pathsend
+    message is returned as the body b"<pathsend:path>" instead of reading the file.
+    """
+    status, response_headers, body = 0, {}, []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"bench"), *headers], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+        "extensions": extensions or {},
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.Event().wait()  # no disconnect while the response is being sent
+        sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode(), v.decode()) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+        elif message["type"] == "http.response.pathsend":
+            body.append(f"<pathsend:{message['path']}>".encode())
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        if not status:
+            raise
+    return status, response_headers, b"".join(body)
@@ -0,0 +1,100 @@
+# tests/conftest.py
+"""
+The app runs against a temporary SQLite database (standing in for SQL Server, see tests/support.py), the in-memory
+message broker and Celery in eager mode with in-memory transports: no SQL Server, Mongo or Redis needed.
+Memory-ceiling tests over large data are marked slow and opt-in: pytest --run-slow (or RUN_SLOW_TESTS=1).
+"""
+import inspect
+import os
+
+# Before the app is imported: settings, the broker and the Celery app are built at import
+os.environ.setdefault("MESSAGE_BROKER_BACKEND", "memory")
+os.environ.setdefault("CELERY_BROKER_URL", "memory://")
+os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
+os.environ.setdefault("CELERY_TASK_ALWAYS_EAGER", "true")
+os.environ.setdefault("PASSWORD_HASHER_EXECUTOR", "thread")
+
+import pytest
+from fastapi import Depends
+from sqlalchemy import func, select
+from app.main import app
+from app.core.dependencies import get_collection_versions, get_unit_of_work
+from app.core.security import password_hasher, set_password_rounds
+from app.infrastructure.cache.collection_versions import CollectionVersions
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from tests.support import create_schema, sqlite_engine, use_engine
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False, help="run the slow memory-ceiling tests")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: memory-ceiling test over large data; run with --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow") or os.environ.get("RUN_SLOW_TESTS"):
+        return
+    skip = pytest.mark.skip(reason="slow: run with --run-slow or RUN_SLOW_TESTS=1")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cheap_bcrypt():
+    set_password_rounds(4)  # tests check behaviour, not the hash cost
+    yield
+    password_hasher.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clean_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def engine():
+    """A fresh SQLite database with the schema, used by the unit of work and the repositories"""
+    engine = sqlite_engine()
+    await create_schema(engine)
+    use_engine(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def stored(engine):
+    """Counts a model's rows in the test database, optionally filtered: await stored(UserModel, UserModel.username == "x")"""
+    async def stored(model, *where) -> int:
+        async with engine.connect() as conn:
+            return (await conn.execute(select(func.count()).select_from(model).where(*where))).scalar_one()
+    return stored
+
+
+@pytest.fixture
+def override():
+    """
+    Serves a prepared service for a dependency. A provider built on the unit of work still opens the request's
+    one, so the request commits (or rolls back) exactly as with the real provider.
+    """
+    def override(dependency, service):
+        if "uow" in inspect.signature(dependency).parameters:
+            app.dependency_overrides[dependency] = lambda uow=Depends(get_unit_of_work): service
+        else:
+            app.dependency_overrides[dependency] = lambda: service
+        return service
+    return override
+
+
+@pytest.fixture
+def versions(override) -> CollectionVersions:
+    """The ETag versions the endpoints read, with a TTL long enough that no token rolls over mid-test"""
+    return override(get_collection_versions, CollectionVersions(InMemoryMessageBroker(), ttl_seconds=10**9))
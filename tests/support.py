@@ -0,0 +1,281 @@
+# tests/support.py
+"""
+Stand-ins and in-process helpers for the tests: in-memory repositories, a temporary SQLite database in place
+of SQL Server, an ASGI client, and streaming request helpers for memory-ceiling tests. Kept apart from the
+benchmark scripts, which have their own copies, so neither suite depends on the other.
+"""
+import asyncio
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import httpx
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.application.services.user_service import UserService
+from app.infrastructure.db.base import Base
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.interfaces.i_login_repository import ILoginRepository
+from app.infrastructure.interfaces.i_role_repository import IRoleRepository
+
+CHUNK = 64 * 1024  # what a server typically hands the app per receive()
+BOUNDARY = "testboundary7MA4YWxkTrZu0gW"
+
+
+class InMemoryLoginRepository(ILoginRepository):
+    """Login repository backed by a dict of username -> User"""
+
+    def __init__(self, users: Optional[Dict[str, User]] = None):
+        self.users = users or {}
+
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        return self.users.get(username)
+
+    async def update_password_hash(self, user_id: str, hashed_password: str) -> None:
+        for user in self.users.values():
+            if user.id == user_id:
+                user.hashed_password = hashed_password
+
+
+class InMemoryRoleRepository(IRoleRepository):
+    """Role repository backed by a list, mirroring the Mongo repository's paging semantics"""
+
+    def __init__(self, roles: Optional[List[Role]] = None):
+        self.roles = list(roles or [])
+
+    async def add_role(self, role_entity: Role) -> Role:
+        if any(r.name == role_entity.name for r in self.roles):
+            raise AlreadyExistsException(f"Role Name already taken: {role_entity.name}")
+        role = Role(id=str(len(self.roles) + 1), name=role_entity.name, isActive=role_entity.isActive)
+        self.roles.append(role)
+        return role
+
+    async def add_roles(self, roles: List[Role]) -> List[Optional[Role]]:
+        saved = []
+        for role in roles:
+            try:
+                saved.append(await self.add_role(role))
+            except AlreadyExistsException:
+                saved.append(None)
+        return saved
+
+    async def get_by_names(self, names: List[str]) -> Dict[str, Role]:
+        wanted = set(names)
+        return {r.name: r for r in self.roles if r.name in wanted}
+
+    async def get_by_id(self, role_id: str) -> Optional[Role]:
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    async def get_by_ids(self, role_ids: List[str]) -> Dict[str, Role]:
+        wanted = set(role_ids)
+        return {r.id: r for r in self.roles if r.id in wanted}
+
+    async def list_all_roles(self) -> List[Role]:
+        return list(self.roles)
+
+    async def get_by_name(self, name: str) -> Optional[Role]:
+        return next((r for r in self.roles if r.name == name), None)
+
+    async def stream_roles(self, batch_size: int = 1000):
+        for start in range(0, len(self.roles), batch_size):
+            yield self.roles[start:start + batch_size]
+
+    async def list_roles(
+        self, page: int = 1, page_size: int = 10, sort_field: str = "name", ascending: bool = True, cursor: Optional[str] = None,
+        include_total: str = "true"
+    ) -> dict:
+        ordered = sorted(self.roles, key=lambda r: getattr(r, sort_field), reverse=not ascending)
+        start = (page - 1) * page_size
+        return {"total": len(ordered), "data": ordered[start:start + page_size], "next_cursor": None}
+
+
+class FailingUserService(UserService):
+    """A user service whose bulk create always fails, as when the database goes away mid-job"""
+
+    async def bulk_create_users(self, rows, batch_size: int = 1000):
+        raise RuntimeError("database went away")
+
+
+def sqlite_engine(path: Optional[str] = None):
+    """
+    aiosqlite stand-in for SQL Server; the dbo schema is mapped away since SQLite has no schemas.
+    Defaults to a fresh temporary file: a :memory: database is a single shared connection.
+    """
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="test-"), "test.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    # The sqlite3 driver emits no BEGIN before a SAVEPOINT, so releasing one would commit it and a later
+    # rollback would keep the row. Take over transaction control, as SQL Server does it (SQLAlchemy's recipe).
+    @event.listens_for(engine.sync_engine, "connect")
+    def _driver_transactions_off(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine.execution_options(schema_translate_map={"dbo": None})
+
+
+def session_factory(engine) -> sessionmaker:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def use_engine(engine) -> sessionmaker:
+    """Point the repositories (unit of work and the streaming reads) at a test engine"""
+    from app.infrastructure.db import unit_of_work
+    from app.infrastructure.db.instrumentation import install_engine_instrumentation
+    from app.infrastructure.repositories import report_repository, user_repository
+    factory = session_factory(engine)
+    unit_of_work.async_session = factory
+    user_repository.async_session = factory
+    report_repository.async_session = factory
+    install_engine_instrumentation(engine)
+    return factory
+
+
+async def create_schema(engine) -> None:
+    import app.infrastructure.db.models  # noqa: F401  registers the tables on Base.metadata
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def seed_users(engine, rows: int, roles: int = 5) -> None:
+    """`rows` users (user-00000000, ...) spread over role-0..role-{roles - 1}, inserted in bulk"""
+    from app.infrastructure.db.models.role import Role as RoleModel
+    from app.infrastructure.db.models.user import User as UserModel
+    epoch = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    async with session_factory(engine)() as session:
+        await session.execute(insert(RoleModel), [{"id": f"role-{i}", "name": f"role-{i}", "isActive": True} for i in range(roles)])
+        for start in range(0, rows, 50_000):
+            await session.execute(insert(UserModel), [
+                {"id": str(uuid.uuid4()), "username": f"user-{i:08d}", "hashed_password": "x", "email": f"user-{i}@example.com",
+                 "roleId": f"role-{i % roles}", "createDate": epoch + timedelta(seconds=i), "isActive": True}
+                for i in range(start, min(start + 50_000, rows))
+            ])
+        await session.commit()
+
+
+def make_client(app) -> httpx.AsyncClient:
+    """Client that drives the ASGI app in-process, without a server or sockets"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test")
+
+
+def _scope(method: str, path: str, query: str, headers) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"test"), *headers], "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+
+
+async def asgi_stream(app, path: str, query: str = "", on_chunk=None) -> int:
+    """
+    GET a path straight through ASGI, handing each body chunk to on_chunk and discarding it (httpx's
+    ASGITransport buffers the whole body, which would defeat memory-ceiling tests). Returns the status.
+    """
+    status = 0
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Like a real server: block until the response is done, then report the disconnect
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and on_chunk is not None:
+            on_chunk(message.get("body", b""))
+
+    try:
+        await app(_scope("GET", path, query, ()), receive, send)
+    finally:
+        finished.set()
+    return status
+
+
+async def asgi_upload(app, method: str, path: str, chunks: Iterable[bytes], headers=(), query: str = "") -> Tuple[int, bytes]:
+    """Send a body produced chunk by chunk straight through ASGI, never materialized client side; returns (status, body)"""
+    status, body = 0, []
+    chunk_iter = iter(chunks)
+    pending = next(chunk_iter, None)
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal pending
+        if pending is None:
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        chunk, pending = pending, next(chunk_iter, None)
+        return {"type": "http.request", "body": chunk, "more_body": pending is not None}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    try:
+        await app(_scope(method, path, query, headers), receive, send)
+    except Exception:
+        # Handled errors are re-raised by ServerErrorMiddleware after the error response went out
+        if not status:
+            raise
+    finally:
+        finished.set()
+    return status, b"".join(body)
+
+
+def sized_body(size: int, block: bytes) -> Iterator[bytes]:
+    """`size` bytes as CHUNK-sized slices of block"""
+    for start in range(0, size, CHUNK):
+        yield block[: min(CHUNK, size - start)]
+
+
+def multipart_body(size: int, block: bytes) -> Iterator[bytes]:
+    """A multipart/form-data body (boundary BOUNDARY) with a text field and a `size`-byte file"""
+    yield (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"note\"\r\n\r\nhello\r\n"
+           f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"big.bin\"\r\n"
+           f"Content-Type: application/octet-stream\r\n\r\n").encode()
+    yield from sized_body(size, block)
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process (Linux)"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+class PeakRss:
+    """Samples RSS every 10ms in the background while the block runs"""
+
+    def __init__(self):
+        self.peak = rss_mb()
+        self._task = None
+
+    async def _sample(self):
+        while True:
+            self.peak = max(self.peak, rss_mb())
+            await asyncio.sleep(0.01)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+        self.peak = max(self.peak, rss_mb())
@@ -0,0 +1,126 @@
+# tests/test_chat.py
+import asyncio
+import json
+import pytest
+from fastapi import WebSocketDisconnect
+from app.core.security import create_access_token
+from app.hubs.chat_hub import ChatHub
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from app.presentation.controllers.chat_controller import _valid_room, chat_socket
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+class ClientWebSocket(FakeWebSocket):
+    """A client socket driven by the test; flags overlapping sends, which a real WebSocket does not allow"""
+
+    def __init__(self, *frames):
+        super().__init__()
+        self.headers = {"authorization": f"Bearer {create_access_token({'sub': 'alice'})}"}
+        self.incoming = asyncio.Queue()
+        self.sending = False
+        self.overlapped = False
+        for frame in frames:
+            self.incoming.put_nowait(frame)
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive_text(self) -> str:
+        frame = await self.incoming.get()
+        if frame is None:
+            raise WebSocketDisconnect()
+        return frame
+
+    async def send_text(self, text: str) -> None:
+        self.overlapped |= self.sending
+        self.sending = True
+        await asyncio.sleep(0.001)  # a slow network write
+        self.sending = False
+        await super().send_text(text)
+
+    def frames(self, kind: str) -> list:
+        return [frame for frame in map(json.loads, self.sent) if frame["type"] == kind]
+
+
+async def until(condition) -> None:
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+async def hub():
+    hub = ChatHub(InMemoryMessageBroker())
+    await hub.start()
+    yield hub
+    await hub.close()
+
+
+async def test_room_names_cannot_inject_frames_into_other_rooms(hub):
+    victim = FakeWebSocket()
+    hub.join(hub.connect(victim, "victim"), "general")
+    forged = json.dumps({"type": "message", "user": "admin", "text": "pwned"})
+
+    await hub.publish(f"general\n{forged}", "mallory", "hi")
+    await hub.publish("3:general", "mallory", "hi")
+    await hub.publish("general", "bob", "hello")
+    await asyncio.sleep(0)
+
+    assert [json.loads(frame)["text"] for frame in victim.sent] == ["hello"]
+    assert json.loads(victim.sent[0])["room"] == "general"
+
+
+def test_room_names_are_printable_and_bounded():
+    assert _valid_room("general")
+    assert _valid_room("café 2")
+    assert not _valid_room("")
+    assert not _valid_room("general\n{}")
+    assert not _valid_room("general\r")
+    assert not _valid_room("x" * 101)
+
+
+async def test_error_frames_queue_behind_messages_instead_of_racing_the_sender(hub):
+    socket = ClientWebSocket(json.dumps({"action": "join", "room": "general"}))
+    session = asyncio.create_task(chat_socket(socket, token=None, hub=hub))
+    await until(lambda: hub.room_size("general") == 1)
+
+    for n in range(5):
+        await hub.publish("general", "bob", f"message {n}")
+    socket.incoming.put_nowait("not json")
+    socket.incoming.put_nowait(json.dumps({"action": "send", "room": "elsewhere", "text": "hi"}))
+    await until(lambda: len(socket.sent) == 7)
+    socket.incoming.put_nowait(None)
+    await session
+
+    assert not socket.overlapped
+    assert [frame["type"] for frame in map(json.loads, socket.sent)] == ["message"] * 5 + ["error"] * 2
+    assert [frame["detail"] for frame in socket.frames("error")] == ["Expected {action, room} JSON", "Not in room elsewhere"]
+
+
+async def test_joins_past_the_room_cap_are_refused():
+    hub = ChatHub(InMemoryMessageBroker(), max_rooms=3)
+    await hub.start()
+    socket = ClientWebSocket(*(json.dumps({"action": "join", "room": f"room-{n}"}) for n in range(5)),
+                             json.dumps({"action": "join", "room": "room-0"}))
+    session = asyncio.create_task(chat_socket(socket, token=None, hub=hub))
+    await until(lambda: len(socket.sent) == 2)
+    joined = {room for room in (f"room-{n}" for n in range(5)) if hub.room_size(room)}
+    socket.incoming.put_nowait(None)
+    await session
+    await hub.close()
+
+    assert joined == {"room-0", "room-1", "room-2"}
+    # Re-joining a room it is already in is not a new room
+    assert [frame["detail"] for frame in socket.frames("error")] == ["Too many rooms (at most 3)"] * 2
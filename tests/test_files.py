@@ -0,0 +1,169 @@
+# tests/test_files.py
+import json
+import os
+import time
+import pytest
+from app.main import app
+from app.core.dependencies import get_file_manager
+from app.core.file_manager import FileManager
+from tests.support import BOUNDARY, CHUNK, PeakRss, asgi_upload, make_client, multipart_body, rss_mb, sized_body
+
+pytestmark = pytest.mark.anyio
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def files(tmp_path, override) -> FileManager:
+    return override(get_file_manager, FileManager(root=str(tmp_path), max_size=1024 * 1024))
+
+
+async def test_patches_to_unknown_uploads_leave_no_locks(files):
+    async with make_client(app) as client:
+        for upload_id in ("0" * 32, "deadbeef", "nope"):
+            response = await client.patch(f"/api/files/uploads/{upload_id}", content=b"x", headers={"Upload-Offset": "0"})
+            assert response.status_code == 404
+
+    assert files._session_locks == {}
+
+
+async def test_completed_uploads_drop_their_lock(files):
+    session = await files.create_session("a.txt", 6, "text/plain")
+
+    partial, stored = await files.append_chunk(session.id, 0, body(b"abc"))
+    assert partial.offset == 3 and stored is None
+    done, stored = await files.append_chunk(session.id, 3, body(b"def"))
+
+    assert stored is not None and stored.size == 6
+    assert files._session_locks == {} and files._hashers == {}
+    assert await files.append_chunk(session.id, 6, body(b"g")) == (None, None)
+    assert files._session_locks == {}
+
+
+async def test_idle_uploads_expire(files):
+    idle = await files.create_session("idle.bin", 10, "application/octet-stream")
+    await files.append_chunk(idle.id, 0, body(b"12345"))
+    active = await files.create_session("active.bin", 10, "application/octet-stream")
+    past = time.time() - files.session_ttl - 60
+    for path in files._session_paths(idle.id):
+        os.utime(path, (past, past))
+
+    assert await files.expire_sessions() == 1
+
+    assert await files.get_session(idle.id) is None
+    assert not any(os.path.exists(path) for path in files._session_paths(idle.id))
+    assert idle.id not in files._session_locks and idle.id not in files._hashers
+    assert (await files.get_session(active.id)) is not None
+
+
+ALPHABET = b"abcdefghijklmnopqrstuvwxyz"
+
+
+@pytest.fixture
+async def alphabet(files) -> str:
+    """Id of a stored 26-byte text file"""
+    async with make_client(app) as client:
+        response = await client.post("/api/files/", content=ALPHABET, params={"filename": "alphabet.txt"},
+                                     headers={"content-type": "text/plain"})
+    return response.json()["data"]["id"]
+
+
+async def test_a_single_range_is_served_as_206(alphabet):
+    async with make_client(app) as client:
+        response = await client.get(f"/api/files/{alphabet}", headers={"Range": "bytes=2-5"})
+
+    assert response.status_code == 206
+    assert response.content == b"cdef"
+    assert response.headers["content-range"] == "bytes 2-5/26"
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["etag"] and response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+async def test_multiple_ranges_are_served_as_multipart_byteranges(alphabet):
+    async with make_client(app) as client:
+        response = await client.get(f"/api/files/{alphabet}", headers={"Range": "bytes=0-1, 24-25"})
+
+    assert response.status_code == 206
+    # Starlette puts the multipart type in Content-Range; it belongs in Content-Type, and only there
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    assert "content-range" not in response.headers
+    boundary = content_type.split("boundary=", 1)[1]
+    parts = [part for part in response.content.split(f"--{boundary}".encode()) if part.strip(b"-\r\n")]
+    assert len(parts) == 2
+    assert b"Content-Range: bytes 0-1/26" in parts[0] and parts[0].rstrip().endswith(b"ab")
+    assert b"Content-Range: bytes 24-25/26" in parts[1] and parts[1].rstrip().endswith(b"yz")
+
+
+async def test_if_range_serves_the_range_only_while_the_validator_matches(alphabet):
+    async with make_client(app) as client:
+        etag = (await client.get(f"/api/files/{alphabet}")).headers["etag"]
+        matching = await client.get(f"/api/files/{alphabet}", headers={"Range": "bytes=0-2", "If-Range": etag})
+        stale = await client.get(f"/api/files/{alphabet}", headers={"Range": "bytes=0-2", "If-Range": '"changed"'})
+
+    assert matching.status_code == 206 and matching.content == b"abc"
+    assert stale.status_code == 200 and stale.content == ALPHABET
+
+
+async def test_an_unsatisfiable_range_is_416(alphabet):
+    async with make_client(app) as client:
+        response = await client.get(f"/api/files/{alphabet}", headers={"Range": "bytes=30-40"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */26"
+
+
+async def test_conditional_gets_answer_304_from_the_index(files, alphabet):
+    async with make_client(app) as client:
+        full = await client.get(f"/api/files/{alphabet}")
+        etag, last_modified = full.headers["etag"], full.headers["last-modified"]
+        # Answered from the in-memory index: the blob itself is not opened
+        os.remove(files.object_path(alphabet))
+
+        by_etag = await client.get(f"/api/files/{alphabet}", headers={"If-None-Match": f'"other", {etag}'})
+        by_date = await client.get(f"/api/files/{alphabet}", headers={"If-Modified-Since": last_modified})
+        # If-None-Match decides when both are sent
+        etag_wins = await client.get(f"/api/files/{alphabet}",
+                                     headers={"If-None-Match": etag, "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+
+    assert full.status_code == 200 and full.content == ALPHABET
+    for response in (by_etag, by_date, etag_wins):
+        assert response.status_code == 304 and response.content == b""
+        assert response.headers["etag"] == etag and response.headers["last-modified"] == last_modified
+
+
+async def test_conditional_gets_of_a_changed_file_are_served_in_full(alphabet):
+    async with make_client(app) as client:
+        by_etag = await client.get(f"/api/files/{alphabet}", headers={"If-None-Match": '"other"'})
+        by_date = await client.get(f"/api/files/{alphabet}", headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+        bad_date = await client.get(f"/api/files/{alphabet}", headers={"If-Modified-Since": "yesterday"})
+
+    for response in (by_etag, by_date, bad_date):
+        assert response.status_code == 200 and response.content == ALPHABET
+
+
+@pytest.mark.slow
+async def test_1gb_upload_keeps_rss_flat(tmp_path, override):
+    size = int(os.environ.get("UPLOAD_TEST_MB", 1024)) * 2**20
+    ceiling_mb = 64
+    block = os.urandom(CHUNK)
+    override(get_file_manager, FileManager(root=str(tmp_path), max_size=2 * size))
+    # Warm the code paths up before taking the baseline
+    await asgi_upload(app, "POST", "/api/files/", sized_body(CHUNK, os.urandom(CHUNK)), query="filename=warm.bin")
+    baseline = rss_mb()
+
+    with PeakRss() as raw_rss:
+        status, payload = await asgi_upload(app, "POST", "/api/files/", sized_body(size, block), query="filename=big.bin")
+    assert status == 200, payload[:300]
+    raw = json.loads(payload)["data"]
+    with PeakRss() as multipart_rss:
+        status, payload = await asgi_upload(app, "POST", "/api/files/", multipart_body(size, block),
+                                            headers=[(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())])
+    assert status == 200, payload[:300]
+
+    assert raw["size"] == size and json.loads(payload)["data"]["id"] == raw["id"]
+    growth = max(raw_rss.peak, multipart_rss.peak) - baseline
+    assert growth <= ceiling_mb, f"RSS grew {growth:.0f} MB uploading {size >> 20} MiB"
@@ -0,0 +1,129 @@
+# tests/test_images.py
+import asyncio
+import io
+import os
+import threading
+import pytest
+from PIL import Image
+from app.core import image_derivatives
+from app.core.file_manager import FileManager
+from app.core.image_derivatives import DerivativeManager, DerivativeSpec, render_derivative
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.domain.exceptions.unsupported_image_exceptions import UnsupportedImageException
+
+pytestmark = pytest.mark.anyio
+
+WAITERS = 5
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def png(width: int = 200, height: int = 150) -> bytes:
+    image = Image.new("RGB", (width, height))
+    image.putdata([(x % 256, y % 256, (x * y) % 256) for y in range(height) for x in range(width)])
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class GatedRenders:
+    """Stands in for render_derivative: counts renders and holds each one until the gate opens"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+        self.started.release()
+        self.gate.wait(5)
+        render_derivative(*args)
+
+    async def wait_started(self) -> None:
+        assert await asyncio.to_thread(self.started.acquire, True, 5)
+
+
+@pytest.fixture
+def files(tmp_path) -> FileManager:
+    return FileManager(root=str(tmp_path))
+
+
+@pytest.fixture
+def derivatives(files):
+    manager = DerivativeManager(files, executor_type="thread", max_workers=1, max_queue=0,
+                                cache_bytes=1024 * 1024, upload_presets="")
+    yield manager
+    manager.shutdown()
+
+
+@pytest.fixture
+def renders(monkeypatch) -> GatedRenders:
+    renders = GatedRenders()
+    monkeypatch.setattr(image_derivatives, "render_derivative", renders)
+    yield renders
+    renders.gate.set()
+
+
+async def store(files: FileManager, content: bytes, content_type: str = "image/png") -> str:
+    return (await files.save_stream(body(content), "upload", content_type)).id
+
+
+async def test_concurrent_requests_share_one_render(files, derivatives, renders):
+    file_id = await store(files, png())
+    spec = DerivativeSpec(64, 64)
+
+    waiters = [asyncio.create_task(derivatives.get(file_id, spec)) for _ in range(WAITERS)]
+    await renders.wait_started()
+    await asyncio.sleep(0)  # every waiter has joined the render by now
+    assert list(derivatives._rendering) == [derivatives.derivative_path(file_id, spec)]
+    renders.gate.set()
+    entries = await asyncio.gather(*waiters)
+
+    assert renders.count == 1
+    assert len({entry.path for entry in entries}) == 1 and os.path.exists(entries[0].path)
+    assert derivatives._rendering == {}
+    assert (await derivatives.get(file_id, spec)) is entries[0] and renders.count == 1  # a cache hit
+
+
+async def test_the_cache_is_trimmed_to_its_budget_least_recent_first(files, derivatives):
+    file_id = await store(files, png())
+    first = await derivatives.get(file_id, DerivativeSpec(96, 96, format="png"))
+    second = await derivatives.get(file_id, DerivativeSpec(80, 80, format="png"))
+    await derivatives.get(file_id, DerivativeSpec(96, 96, format="png"))  # first is now the most recent
+    derivatives.cache_bytes = first.stat.st_size + second.stat.st_size
+
+    third = await derivatives.get(file_id, DerivativeSpec(16, 16, format="png"))
+
+    assert third.stat.st_size < second.stat.st_size
+    assert not os.path.exists(second.path)
+    assert os.path.exists(first.path) and os.path.exists(third.path)
+    assert derivatives.cache_size == first.stat.st_size + third.stat.st_size <= derivatives.cache_bytes
+
+
+async def test_renders_beyond_the_queue_are_refused(files, derivatives, renders):
+    file_id = await store(files, png())
+    busy = asyncio.create_task(derivatives.get(file_id, DerivativeSpec(64, 64)))
+    await renders.wait_started()
+
+    with pytest.raises(ServiceUnavailableException):
+        await derivatives.get(file_id, DerivativeSpec(32, 32))
+
+    renders.gate.set()
+    assert (await busy).content_type == "image/webp"
+    assert (await derivatives.get(file_id, DerivativeSpec(32, 32))) is not None
+
+
+async def test_files_that_are_not_images_are_unsupported(files, derivatives):
+    text = await store(files, b"just text", "text/plain")
+    fake = await store(files, b"not really a png", "image/png")
+
+    with pytest.raises(UnsupportedImageException):
+        await derivatives.get(text, DerivativeSpec(64, 64))
+    with pytest.raises(UnsupportedImageException):
+        await derivatives.get(fake, DerivativeSpec(64, 64))
+
+    assert derivatives.cache_size == 0 and os.listdir(derivatives._tmp) == []
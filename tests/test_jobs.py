@@ -0,0 +1,109 @@
+# tests/test_jobs.py
+import asyncio
+import json
+import pytest
+from app.main import app
+from app.application.services.job_service import JobService
+from app.application.services.user_service import UserService
+from app.core.container import Lifetime
+from app.core.dependencies import get_job_service
+from app.core.di_container import container
+from app.core.security import verify_password
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.repositories.user_repository import UserRepository
+from tests.support import FailingUserService, InMemoryRoleRepository, make_client
+
+pytestmark = pytest.mark.anyio
+
+ROWS = 10
+
+
+def ndjson(prefix: str, count: int = ROWS) -> bytes:
+    rows = [{"username": f"{prefix}-{i}", "password": "secret", "email": f"{prefix}-{i}@example.com",
+             "roleId": "role-1"} for i in range(count)]
+    rows[1] = {"username": f"{prefix}-no-password"}  # rejected at submission
+    rows[2] = dict(rows[0], email=f"{prefix}-dup@example.com")  # duplicate username, rejected by its chunk
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+class LoopRecordingUserService(UserService):
+    def __init__(self, user_repository):
+        super().__init__(user_repository)
+        self.loops = []
+
+    async def bulk_create_users(self, rows, batch_size: int = 1000):
+        self.loops.append(asyncio.get_running_loop())
+        return await super().bulk_create_users(rows, batch_size)
+
+
+@pytest.fixture
+def user_service(engine, override):
+    """The service the eager tasks resolve from the container, on the test database"""
+    service = UserService(UserRepository(InMemoryRoleRepository()))
+    container.register(UserService, instance=service)
+    override(get_job_service, JobService(chunk_size=4))
+    yield service
+    container.register(UserService, lifetime=Lifetime.SINGLETON)
+
+
+async def submit(client, body: bytes) -> dict:
+    response = await client.post("/api/jobs/user-import", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 202, response.text
+    return response.json()["data"]
+
+
+async def test_eager_import_succeeds_with_the_merged_report(stored, user_service):
+    async with make_client(app) as client:
+        job = await submit(client, ndjson("eager"))
+        status = (await client.get(f"/api/jobs/{job['id']}")).json()["data"]
+
+    assert status["state"] == "succeeded" and status["chunks"] == 3 and status["chunksDone"] == 3
+    report = status["result"]
+    assert report["total"] == ROWS and report["created"] == ROWS - 2 and report["failed"] == 2
+    assert [row["index"] for row in report["results"]] == list(range(ROWS))
+    assert [row["index"] for row in report["results"] if not row["success"]] == [1, 2]
+    assert await stored(UserModel) == ROWS - 2
+
+
+async def test_a_failing_chunk_fails_the_job(engine, user_service):
+    container.register(UserService, instance=FailingUserService(user_service.repo))
+
+    async with make_client(app) as client:
+        job = await submit(client, ndjson("broken"))
+        status = (await client.get(f"/api/jobs/{job['id']}")).json()["data"]
+
+    assert status["state"] == "failed"
+    assert "database went away" in status["error"]
+
+
+async def test_eager_chunks_run_on_the_app_loop(engine, user_service):
+    # The engine's pooled connections (and the broker clients) belong to this loop
+    recording = LoopRecordingUserService(user_service.repo)
+    container.register(UserService, instance=recording)
+
+    async with make_client(app) as client:
+        job = await submit(client, ndjson("loop"))
+
+    assert job["state"] == "succeeded"
+    assert recording.loops == [asyncio.get_running_loop()] * 3
+
+
+async def test_passwords_are_hashed_before_they_are_queued(user_service, monkeypatch):
+    messages = []
+    enqueue = JobService._enqueue
+
+    def recording_enqueue(self, meta, workflow):
+        messages.append(json.dumps([task.args for task in workflow.tasks]))
+        enqueue(self, meta, workflow)
+    monkeypatch.setattr(JobService, "_enqueue", recording_enqueue)
+
+    async with make_client(app) as client:
+        job = await submit(client, ndjson("hashed"))
+
+    assert job["state"] == "succeeded"
+    assert "secret" not in messages[0] and '"password"' not in messages[0]
+    queued = [fields for chunk in json.loads(messages[0]) for _, fields in chunk[0]]
+    assert len(queued) == ROWS - 1 and all(verify_password("secret", fields["hashed_password"]) for fields in queued)
+    # Stored as queued: the worker does not hash them again
+    user = await user_service.repo.get_by_id(job["result"]["results"][0]["id"])
+    assert user.hashed_password == queued[0]["hashed_password"]
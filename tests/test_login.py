@@ -0,0 +1,60 @@
+# tests/test_login.py
+import pytest
+from passlib.context import CryptContext
+from app.application.services.login_service import LoginService
+from app.core.security import set_password_rounds
+from app.domain.entities.user import User
+from tests.support import InMemoryLoginRepository
+
+pytestmark = pytest.mark.anyio
+
+CURRENT_ROUNDS = 6
+
+
+def bcrypt_hash(password: str, rounds: int) -> str:
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash(password)
+
+
+def cost(hashed: str) -> int:
+    return int(hashed.split("$")[2])
+
+
+@pytest.fixture
+def current_rounds():
+    set_password_rounds(CURRENT_ROUNDS)
+    yield CURRENT_ROUNDS
+    set_password_rounds(4)
+
+
+def login_service(hashed: str) -> LoginService:
+    return LoginService(InMemoryLoginRepository({"alice": User(id="u-1", username="alice", hashed_password=hashed)}))
+
+
+async def test_login_upgrades_a_hash_below_the_current_cost(current_rounds):
+    service = login_service(bcrypt_hash("secret", 4))
+
+    user = await service.authenticate_user("alice", "secret")
+
+    assert user is not None
+    stored = service.login_repository.users["alice"].hashed_password
+    assert cost(stored) == current_rounds
+    assert await service.authenticate_user("alice", "secret") is not None
+
+
+async def test_login_keeps_a_hash_above_the_current_cost(current_rounds):
+    # A worker calibrated below the stored cost must not downgrade it
+    original = bcrypt_hash("secret", 8)
+    service = login_service(original)
+
+    user = await service.authenticate_user("alice", "secret")
+
+    assert user is not None
+    assert service.login_repository.users["alice"].hashed_password == original
+
+
+async def test_login_with_a_wrong_password_leaves_the_hash(current_rounds):
+    original = bcrypt_hash("secret", 4)
+    service = login_service(original)
+
+    assert await service.authenticate_user("alice", "wrong") is None
+    assert service.login_repository.users["alice"].hashed_password == original
@@ -0,0 +1,28 @@
+# tests/test_notify.py
+import pytest
+from pydantic import ValidationError
+from app.domain.dtos.notify.NotificationCreate import NotificationCreate
+from app.hubs.notify_hub import encode_sse
+
+
+def fields(frame: bytes) -> list:
+    """The field names of an SSE frame, split the way a browser splits lines"""
+    text = frame.decode().replace("\r\n", "\n").replace("\r", "\n")
+    return [line.split(":", 1)[0] for line in text.split("\n") if line]
+
+
+def test_data_line_breaks_cannot_forge_fields():
+    frame = encode_sse("1", "message", "a\revent: admin\rdata: forged\r\nid: 9\nlast")
+
+    assert fields(frame) == ["id", "event", "data", "data", "data", "data", "data"]
+    assert b"\r" not in frame
+
+
+@pytest.mark.parametrize("event", ["message\nid: x", "message\revent: admin", "\n"])
+def test_event_names_with_line_breaks_are_rejected(event):
+    with pytest.raises(ValidationError):
+        NotificationCreate(topic="orders", event=event, data="x")
+
+
+def test_plain_event_names_are_accepted():
+    assert NotificationCreate(topic="orders", event="order.created", data="x").event == "order.created"
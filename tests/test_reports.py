@@ -0,0 +1,129 @@
+# tests/test_reports.py
+from datetime import date
+from decimal import Decimal
+import pytest
+from app.application.services.report_service import ReportService
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.domain.entities.voucher import Voucher
+from app.domain.entities.voucher_line import VoucherLine
+from app.infrastructure.repositories import report_repository
+from app.infrastructure.repositories.report_repository import ReportRepository
+from app.infrastructure.repositories.voucher_repository import VoucherRepository
+from app.utilities.period_utils import period_end
+
+pytestmark = pytest.mark.anyio
+
+# (date, debit account, credit account, amount); the February fees take more chunks than one merge round
+POSTINGS = [
+    (date(2024, 1, 10), "6100", "1000", "100.00"),
+    (date(2024, 1, 20), "1000", "4000", "50.25"),
+    (date(2024, 2, 5), "6100", "1000", "20.00"),
+    *((date(2024, 2, 6 + day), "6300", "1000", "1.00") for day in range(20)),
+    (date(2024, 3, 15), "6200", "1000", "7.50"),
+]
+AS_OF = date(2024, 3, 31)
+
+
+@pytest.fixture(autouse=True)
+def closed_period_cache(monkeypatch):
+    monkeypatch.setattr(report_repository, "_closed_period", (None, 0.0))
+
+
+@pytest.fixture
+async def ledger(engine) -> None:
+    batcher = VoucherBatcher(VoucherRepository(), window_ms=1)
+    try:
+        for day, debit, credit, amount in POSTINGS:
+            await batcher.submit(Voucher(voucherDate=day, description=f"{debit} from {credit}", lines=[
+                VoucherLine(account=debit, debit=Decimal(amount)), VoucherLine(account=credit, credit=Decimal(amount))]))
+    finally:
+        await batcher.close()
+
+
+@pytest.fixture
+def reports(ledger) -> ReportService:
+    # Tiny chunks: totals are merged across chunks and merge rounds, balances carried across chunks
+    return ReportService(ReportRepository(), chunk_size=2)
+
+
+async def ledger_rows(reports: ReportService, account: str, start=None, end=AS_OF) -> list:
+    return [row async for batch in reports.account_ledger(account, start, end)
+            for row in batch.rows(("voucherDate", "debit", "credit", "balance", "description"))]
+
+
+async def test_trial_balance(reports):
+    balance = await reports.trial_balance(AS_OF)
+
+    assert {line.account: (line.debit, line.credit, line.balance) for line in balance.accounts} == {
+        "1000": (Decimal("50.25"), Decimal("147.50"), Decimal("-97.25")),
+        "4000": (Decimal("0.00"), Decimal("50.25"), Decimal("-50.25")),
+        "6100": (Decimal("120.00"), Decimal("0.00"), Decimal("120.00")),
+        "6200": (Decimal("7.50"), Decimal("0.00"), Decimal("7.50")),
+        "6300": (Decimal("20.00"), Decimal("0.00"), Decimal("20.00")),
+    }
+    assert [line.account for line in balance.accounts] == sorted(line.account for line in balance.accounts)
+    assert balance.totalDebit == balance.totalCredit == Decimal("197.75")
+    assert balance.closedThrough is None
+    # Lines after the as-of date are left out
+    assert (await reports.trial_balance(date(2024, 1, 31))).totalDebit == Decimal("150.25")
+
+
+async def test_period_summaries(reports):
+    summaries = await reports.period_summaries(202401, 202403)
+
+    assert [(s.period, s.account, s.debit, s.credit, s.lines) for s in summaries] == [
+        ("2024-01", "1000", Decimal("50.25"), Decimal("100.00"), 2),
+        ("2024-01", "4000", Decimal("0.00"), Decimal("50.25"), 1),
+        ("2024-01", "6100", Decimal("100.00"), Decimal("0.00"), 1),
+        ("2024-02", "1000", Decimal("0.00"), Decimal("40.00"), 21),
+        ("2024-02", "6100", Decimal("20.00"), Decimal("0.00"), 1),
+        ("2024-02", "6300", Decimal("20.00"), Decimal("0.00"), 20),
+        ("2024-03", "1000", Decimal("0.00"), Decimal("7.50"), 1),
+        ("2024-03", "6200", Decimal("7.50"), Decimal("0.00"), 1),
+    ]
+    assert not any(s.closed for s in summaries)
+    assert [(s.period, s.debit) for s in await reports.period_summaries(202402, 202402, "6300")] == [("2024-02", Decimal("20.00"))]
+
+
+async def test_closed_period_summaries_plus_the_open_scan_equal_a_full_scan(reports):
+    full_totals, summarized = await reports._totals(AS_OF)
+    full_balance = await reports.trial_balance(AS_OF)
+    full_summaries = await reports.period_summaries(202401, 202403)
+    full_ledger = await ledger_rows(reports, "1000", date(2024, 3, 1))
+    assert summarized is None
+
+    closed = await reports.close_period(202402)
+    totals, summarized = await reports._totals(AS_OF)
+    balance = await reports.trial_balance(AS_OF)
+    summaries = await reports.period_summaries(202401, 202403)
+
+    assert closed.periodsSummarized == 2 and closed.lines == 2 * (len(POSTINGS) - 1)
+    assert summarized == 202402
+    assert totals.sort_index().equals(full_totals.sort_index())
+    assert balance.accounts == full_balance.accounts and balance.totalDebit == full_balance.totalDebit
+    assert balance.closedThrough == "2024-02"
+    assert [s.model_dump(exclude={"closed"}) for s in summaries] == [s.model_dump(exclude={"closed"}) for s in full_summaries]
+    assert [s.closed for s in summaries] == [s.period <= "2024-02" for s in summaries]
+    # The opening balance comes from the February summaries now
+    assert await ledger_rows(reports, "1000", date(2024, 3, 1)) == full_ledger
+    # A range inside the closed periods is served from summaries alone
+    inside, summarized = await reports._totals(period_end(202401))
+    assert summarized == 202401 and inside.sort_index().equals(full_totals.loc[[202401]].sort_index())
+
+
+async def test_account_ledger_opening_and_running_balances(reports):
+    rows = await ledger_rows(reports, "1000", date(2024, 2, 1))
+
+    opening, *lines = rows
+    assert opening == (date(2024, 2, 1), Decimal("0.00"), Decimal("0.00"), Decimal("-49.75"), "Opening balance")
+    assert [row[0] for row in lines] == [day for day, debit, credit, _ in POSTINGS[2:] if "1000" in (debit, credit)]
+    expected, balance = [], Decimal("-49.75")
+    for _, debit, credit, running, _ in lines:
+        balance += debit - credit
+        expected.append(balance)
+    assert [row[3] for row in lines] == expected
+    assert lines[0][3] == Decimal("-69.75") and lines[-1][3] == Decimal("-97.25")
+    # Without a start date there is no opening line and the balance starts at zero
+    unbounded = await ledger_rows(reports, "1000")
+    assert unbounded[0][:4] == (date(2024, 1, 10), Decimal("0.00"), Decimal("100.00"), Decimal("-100.00"))
+    assert unbounded[-1][3] == Decimal("-97.25")
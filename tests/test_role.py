@@ -0,0 +1,111 @@
+# tests/test_role.py
+import pytest
+from app.main import app
+from app.application.services.role_service import RoleService
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_role_service, get_user_service
+from app.infrastructure.cache.role_cache import RoleCache
+from app.infrastructure.messaging.in_memory_broker import InMemoryMessageBroker
+from app.infrastructure.repositories.cached_role_repository import CachedRoleRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from tests.support import InMemoryRoleRepository, make_client
+
+pytestmark = pytest.mark.anyio
+
+
+def payload(name: str) -> dict:
+    return {"id": name, "name": name, "isActive": True}
+
+
+class CountingRoleRepository(InMemoryRoleRepository):
+    """Counts the reads that reach the role store"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def get_by_id(self, role_id):
+        self.reads += 1
+        return await super().get_by_id(role_id)
+
+    async def list_roles(self, *args, **kwargs):
+        self.reads += 1
+        return await super().list_roles(*args, **kwargs)
+
+
+@pytest.fixture
+def store() -> CountingRoleRepository:
+    return CountingRoleRepository()
+
+
+@pytest.fixture
+def roles(store, versions, override) -> CachedRoleRepository:
+    """The role cache in front of the store, as wired by the container"""
+    repository = CachedRoleRepository(store, RoleCache(), InMemoryMessageBroker(), versions)
+    override(get_role_service, RoleService(repository))
+    return repository
+
+
+async def test_reads_carry_a_weak_etag_per_page_and_per_role(roles):
+    async with make_client(app) as client:
+        created = (await client.post("/api/role/", json=payload("admin"))).json()["data"]
+        first = await client.get("/api/role/", params={"page": 1})
+        second = await client.get("/api/role/", params={"page": 2})
+        single = await client.get(f"/api/role/{created['id']}")
+
+    for response in (first, second, single):
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"') and response.headers["cache-control"] == "no-cache"
+    assert len({first.headers["etag"], second.headers["etag"], single.headers["etag"]}) == 3
+
+
+async def test_a_current_etag_answers_304_without_reading_the_store(roles, store):
+    async with make_client(app) as client:
+        created = (await client.post("/api/role/", json=payload("admin"))).json()["data"]
+        for url in ("/api/role/", f"/api/role/{created['id']}"):
+            etag = (await client.get(url)).headers["etag"]
+            reads = store.reads
+
+            response = await client.get(url, headers={"If-None-Match": etag})
+
+            assert response.status_code == 304 and response.content == b""
+            assert response.headers["etag"] == etag
+            assert store.reads == reads
+
+
+async def test_creates_change_the_etag(roles):
+    async with make_client(app) as client:
+        etag = (await client.get("/api/role/")).headers["etag"]
+        await client.post("/api/role/", json=payload("admin"))
+        after_create = await client.get("/api/role/", headers={"If-None-Match": etag})
+        bulk = await client.post("/api/role/bulk", json=[payload("editor"), payload("viewer")])
+        after_bulk = await client.get("/api/role/", headers={"If-None-Match": after_create.headers["etag"]})
+
+    assert after_create.status_code == 200 and after_create.headers["etag"] != etag
+    assert bulk.json()["data"]["created"] == 2
+    assert after_bulk.status_code == 200 and after_bulk.headers["etag"] != after_create.headers["etag"]
+    assert after_bulk.json()["data"]["total"] == 3
+
+
+async def test_a_rejected_create_keeps_the_etag(roles):
+    async with make_client(app) as client:
+        await client.post("/api/role/", json=payload("admin"))
+        etag = (await client.get("/api/role/")).headers["etag"]
+
+        rejected = await client.post("/api/role/", json=payload("admin"))
+        revalidated = await client.get("/api/role/", headers={"If-None-Match": etag})
+
+    assert rejected.status_code == 400
+    assert revalidated.status_code == 304
+
+
+async def test_role_writes_change_the_etag_of_user_reads(engine, roles, versions, override):
+    # Users embed their roleName
+    override(get_user_service, UserService(UserRepository(roles, versions)))
+
+    async with make_client(app) as client:
+        etag = (await client.get("/api/user/")).headers["etag"]
+        await client.post("/api/role/", json=payload("admin"))
+        revalidated = await client.get("/api/user/", headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 200 and revalidated.headers["etag"] != etag
@@ -0,0 +1,144 @@
+# tests/test_user.py
+import asyncio
+import gc
+import os
+import pytest
+from sqlalchemy import event
+from app.main import app
+from app.application.services.user_service import UserService
+from app.core.dependencies import get_user_service
+from app.domain.dtos.user.UserCreate import UserCreate
+from app.domain.entities.role import Role
+from app.domain.exceptions.already_exist_exceptions import AlreadyExistsException
+from app.infrastructure.db.models.user import User as UserModel
+from app.infrastructure.db.unit_of_work import UnitOfWork
+from app.infrastructure.repositories.user_repository import UserRepository
+from tests.support import InMemoryRoleRepository, asgi_stream, make_client, rss_mb, seed_users
+
+pytestmark = pytest.mark.anyio
+
+ROLES = [Role(id=f"role-{i}", name=f"role-{i}") for i in range(5)]
+RACERS = 8
+
+
+def payload(username: str, email: str = None) -> dict:
+    return {"username": username, "password": "secret", "email": email or f"{username}@example.com", "roleId": "role-1"}
+
+
+@pytest.fixture
+def user_service(engine, override, versions) -> UserService:
+    return override(get_user_service, UserService(UserRepository(InMemoryRoleRepository(ROLES), versions)))
+
+
+@pytest.fixture
+def statements(engine) -> list:
+    """SQL statements run against the test database from now on"""
+    executed = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda conn, cursor, sql, *args: executed.append(sql))
+    return executed
+
+
+async def test_concurrent_creates_of_one_username_store_it_once(stored, user_service):
+    async with make_client(app) as client:
+        responses = await asyncio.gather(*(client.post("/api/user/", json=payload("racer")) for _ in range(RACERS)))
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200] + [400] * (RACERS - 1)
+    rejected = [response.json() for response in responses if response.status_code == 400]
+    assert all(body["message"] == "Already exists" for body in rejected)
+    assert await stored(UserModel, UserModel.username == "racer") == 1
+
+
+async def test_concurrent_creates_with_one_email_store_it_once(stored, user_service):
+    results = await asyncio.gather(
+        *(user_service.create_user(UserCreate(**payload(f"mail-{i}", "shared@example.com"))) for i in range(RACERS)),
+        return_exceptions=True,
+    )
+
+    created = [result for result in results if not isinstance(result, Exception)]
+    assert len(created) == 1
+    assert all(isinstance(result, AlreadyExistsException) for result in results if isinstance(result, Exception))
+    assert await stored(UserModel, UserModel.email == "shared@example.com") == 1
+
+
+async def test_reads_carry_a_weak_etag_per_page_and_per_user(user_service):
+    async with make_client(app) as client:
+        created = (await client.post("/api/user/", json=payload("tagged"))).json()["data"]
+        first = await client.get("/api/user/", params={"page": 1})
+        second = await client.get("/api/user/", params={"page": 2})
+        single = await client.get(f"/api/user/{created['id']}")
+
+    for response in (first, second, single):
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"') and response.headers["cache-control"] == "no-cache"
+    assert len({first.headers["etag"], second.headers["etag"], single.headers["etag"]}) == 3
+
+
+async def test_a_current_etag_answers_304_without_a_query(user_service, statements):
+    async with make_client(app) as client:
+        created = (await client.post("/api/user/", json=payload("cached"))).json()["data"]
+        for url in ("/api/user/", f"/api/user/{created['id']}"):
+            etag = (await client.get(url)).headers["etag"]
+            statements.clear()
+
+            # Clients may send the weak tag back bare, or among others
+            for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}'):
+                response = await client.get(url, headers={"If-None-Match": if_none_match})
+                assert response.status_code == 304 and response.content == b""
+                assert response.headers["etag"] == etag
+            assert statements == []
+
+
+async def test_creates_change_the_etag(user_service):
+    async with make_client(app) as client:
+        etag = (await client.get("/api/user/")).headers["etag"]
+        await client.post("/api/user/", json=payload("first"))
+        after_create = await client.get("/api/user/", headers={"If-None-Match": etag})
+        bulk = await client.post("/api/user/bulk", json=[payload("second"), payload("third")])
+        after_bulk = await client.get("/api/user/", headers={"If-None-Match": after_create.headers["etag"]})
+
+    assert after_create.status_code == 200 and after_create.headers["etag"] != etag
+    assert bulk.json()["data"]["created"] == 2
+    assert after_bulk.status_code == 200 and after_bulk.headers["etag"] != after_create.headers["etag"]
+    assert after_bulk.json()["data"]["total"] == 3
+
+
+async def test_failed_creates_keep_the_etag(user_service, stored):
+    async with make_client(app) as client:
+        await client.post("/api/user/", json=payload("taken"))
+        etag = (await client.get("/api/user/")).headers["etag"]
+
+        rejected = await client.post("/api/user/", json=payload("taken", "other@example.com"))
+        # Inserted, then rolled back with the rest of its unit of work
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork():
+                await user_service.create_user(UserCreate(**payload("rolled-back")))
+                raise RuntimeError("request failed after the insert")
+        revalidated = await client.get("/api/user/", headers={"If-None-Match": etag})
+
+    assert rejected.status_code == 400
+    assert await stored(UserModel, UserModel.username == "rolled-back") == 0
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.slow
+async def test_export_streams_1m_rows_under_rss_ceiling(engine, override):
+    rows = int(os.environ.get("EXPORT_TEST_ROWS", 1_000_000))
+    ceiling_mb = 64
+    await seed_users(engine, rows)
+    override(get_user_service, UserService(UserRepository(InMemoryRoleRepository(ROLES))))
+
+    gc.collect()
+    baseline = peak = rss_mb()
+    lines = 0
+
+    def on_chunk(chunk: bytes) -> None:
+        nonlocal peak, lines
+        lines += chunk.count(b"\n")
+        peak = max(peak, rss_mb())
+
+    status = await asgi_stream(app, "/api/user/export", "format=csv", on_chunk)
+
+    assert status == 200
+    assert lines == rows + 1  # header + one line per user
+    assert peak - baseline <= ceiling_mb, f"RSS grew {peak - baseline:.0f} MB exporting {rows} rows"
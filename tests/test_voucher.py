@@ -0,0 +1,154 @@
+# tests/test_voucher.py
+import asyncio
+import time
+from datetime import date
+from decimal import Decimal
+import pytest
+from app.main import app
+from app.application.services.voucher_batcher import VoucherBatcher
+from app.application.services.voucher_service import VoucherService
+from app.core.dependencies import get_voucher_service
+from app.domain.entities.voucher import Voucher
+from app.domain.entities.voucher_line import VoucherLine
+from app.domain.exceptions.closed_period_exceptions import ClosedPeriodException
+from app.domain.exceptions.service_unavailable_exceptions import ServiceUnavailableException
+from app.infrastructure.db.models.voucher import Voucher as VoucherModel
+from app.infrastructure.db.models.voucher_line import VoucherLine as VoucherLineModel
+from app.infrastructure.repositories import report_repository
+from app.infrastructure.repositories.report_repository import ReportRepository
+from app.infrastructure.repositories.voucher_repository import VoucherRepository
+from app.utilities.metrics_utils import voucher_batch_size
+from tests.support import make_client
+
+pytestmark = pytest.mark.anyio
+
+POSTERS = 20
+
+
+def body(amount: str = "100.00", **fields) -> dict:
+    return {"lines": [{"account": "6100", "debit": amount}, {"account": "1000", "credit": amount}], **fields}
+
+
+def batch_count() -> int:
+    return voucher_batch_size._series.get((), (None, 0, 0))[2]
+
+
+@pytest.fixture(autouse=True)
+def closed_period_cache(monkeypatch):
+    monkeypatch.setattr(report_repository, "_closed_period", (None, 0.0))
+
+
+def stale_cache(monkeypatch) -> None:
+    """This worker still believes nothing is closed, as if another worker had just closed a period"""
+    monkeypatch.setattr(report_repository, "_closed_period", (None, time.monotonic() + 60))
+
+
+def entity(day: date, account: str = "6100") -> Voucher:
+    lines = [VoucherLine(account=account, debit=Decimal("5")), VoucherLine(account="1000", credit=Decimal("5"))]
+    return Voucher(voucherDate=day, lines=lines)
+
+
+@pytest.fixture
+async def batcher(engine):
+    batcher = VoucherBatcher(VoucherRepository(), window_ms=20)
+    yield batcher
+    await batcher.close()
+
+
+@pytest.fixture
+def voucher_service(batcher, override) -> VoucherService:
+    return override(get_voucher_service, VoucherService(VoucherRepository(), batcher, ReportRepository()))
+
+
+async def test_unbalanced_voucher_is_rejected_with_400(stored, voucher_service):
+    unbalanced = {"lines": [{"account": "6100", "debit": "10.00"}, {"account": "1000", "credit": "9.99"}]}
+
+    async with make_client(app) as client:
+        response = await client.post("/api/vouchers/", json=unbalanced)
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Unbalanced voucher" and "do not balance" in response.json()["errors"]
+    assert await stored(VoucherModel) == 0
+
+
+async def test_concurrent_posts_commit_in_one_batch_with_unique_numbers(stored, voucher_service):
+    batches = batch_count()
+
+    async with make_client(app) as client:
+        responses = await asyncio.gather(
+            *(client.post("/api/vouchers/", json=body(f"{n + 1}.00")) for n in range(POSTERS)))
+
+    assert [response.status_code for response in responses] == [200] * POSTERS
+    numbers = [response.json()["data"]["number"] for response in responses]
+    assert len(set(numbers)) == POSTERS
+    assert batch_count() - batches == 1
+    assert await stored(VoucherModel) == POSTERS
+    assert await stored(VoucherLineModel) == 2 * POSTERS
+
+
+async def test_a_bad_voucher_fails_only_itself(stored, batcher):
+    today = date.today()
+
+    # A NULL account passes the in-memory checks but is refused by the database
+    results = await asyncio.gather(
+        batcher.submit(entity(today, "6100")), batcher.submit(entity(today, None)), batcher.submit(entity(today, "6200")),
+        return_exceptions=True,
+    )
+
+    good = [results[0], results[2]]
+    assert all(isinstance(result, Voucher) for result in good)
+    assert isinstance(results[1], Exception)
+    assert len({result.number for result in good}) == 2
+    assert await stored(VoucherModel) == 2
+
+
+async def test_batcher_takes_posts_again_after_a_restart(stored, voucher_service, batcher):
+    await batcher.close()
+    with pytest.raises(ServiceUnavailableException):
+        await batcher.submit(Voucher())
+
+    batcher.start()
+
+    async with make_client(app) as client:
+        response = await client.post("/api/vouchers/", json=body())
+    assert response.status_code == 200
+    assert await stored(VoucherModel) == 1
+
+
+async def test_posting_into_a_closed_period_fails_even_with_a_stale_cache(stored, voucher_service, monkeypatch):
+    await ReportRepository().close_period(202401, [], None)
+    stale_cache(monkeypatch)
+
+    async with make_client(app) as client:
+        closed = await client.post("/api/vouchers/", json=body(voucherDate="2024-01-31"))
+        open_ = await client.post("/api/vouchers/", json=body(voucherDate="2024-02-01"))
+
+    assert closed.status_code == 409
+    assert closed.json()["message"] == "Period closed" and "2024-01" in closed.json()["errors"]
+    assert open_.status_code == 200
+    assert await stored(VoucherModel) == 1
+
+
+async def test_a_voucher_into_a_closed_period_fails_only_itself_in_a_batch(stored, batcher, monkeypatch):
+    await ReportRepository().close_period(202401, [], None)
+    stale_cache(monkeypatch)
+
+    results = await asyncio.gather(
+        *(batcher.submit(entity(day)) for day in (date(2024, 2, 1), date(2024, 1, 15), date(2024, 3, 1))),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], Voucher) and isinstance(results[2], Voucher)
+    assert isinstance(results[1], ClosedPeriodException)
+    assert await stored(VoucherModel) == 2
+
+
+async def test_close_fails_when_vouchers_were_posted_after_its_scan(engine, batcher):
+    await batcher.submit(entity(date(2024, 1, 15)))
+    reports = ReportRepository()
+
+    # Summaries scanned before the voucher was posted: no lines in 2024-01
+    with pytest.raises(ClosedPeriodException):
+        await reports.close_period(202401, [], None)
+
+    assert await reports.get_closed_period(cached=False) is None